@@ -0,0 +1,42 @@
+"""
+Shared Test Fixtures
+Inventory folders built from the sample files, for the loader, search and monitor tests.
+"""
+
+import os
+import shutil
+
+import pytest
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SAMPLE_INVENTORY')
+
+
+@pytest.fixture
+def make_inventory_dir(tmp_path):
+    """Return a function that copies the sample files into tmp_path under several character names."""
+    def make(copies: int = 4) -> str:
+        # Sample 'Gandalf' becomes Gandalf0..Gandalf{copies-1}, so each shared bank repeats copies times
+        for source in sorted(os.listdir(SAMPLE_DIR)):
+            base_name = source.replace('-Inventory.txt', '')
+            for i in range(copies):
+                shutil.copy(os.path.join(SAMPLE_DIR, source), tmp_path / f"{base_name}{i}-Inventory.txt")
+        return str(tmp_path)
+    return make
+
+
+@pytest.fixture
+def inventory_dir(make_inventory_dir, tmp_path):
+    """Sample files under several names, with repeated shared banks and a duplicated export."""
+    directory = make_inventory_dir(copies=3)
+    shutil.copy(tmp_path / 'Gandalf0-Inventory.txt', tmp_path / 'Gandalf0-Old-Inventory.txt')
+    bank_file = tmp_path / 'Bloodthirster2-Inventory.txt'
+    bank_file.write_text(bank_file.read_text().replace('Rare Gem', 'Very Rare Gem'))
+    return directory
+
+
+@pytest.fixture
+def sorted_items():
+    """Return a function that orders rows independently of how they were spliced together."""
+    def sort(df):
+        return df.sort_values(['Character', 'FileName', 'Location', 'Name']).reset_index(drop=True)
+    return sort
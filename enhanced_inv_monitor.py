@@ -1,23 +1,61 @@
-import pandas as pd
+from __future__ import annotations
+
 from datetime import datetime
 import sys
 import os
 import glob
 import re
 from functools import reduce
-from pandasgui import show
 from typing import Optional, List, Dict
 import argparse
+import queue
+from inventory_stream import RESULT_COLUMNS, StreamFormatError, read_inventory_directory, format_table
+from inventory_watch import WATCH_BACKENDS, InventoryWatcher
+from inventory_profile import OperationProfiler, profile_methods
+
+# pandas and the DataFrame-based modules are imported on first use, so one-shot
+# streaming searches (-s) never pay for them
+pd = None
+
+
+def _import_dataframe_modules():
+    """Import pandas and the DataFrame-based inventory modules into this module's namespace."""
+    global pd, InventoryLoader, memory_report, format_memory_report, TrigramIndex, SearchResultCache
+    global DUPLICATE_KEYS, find_duplicate_rows, SQLiteInventoryStore
+    import pandas as pd
+    from inventory_loader import InventoryLoader
+    from inventory_compact import memory_report, format_memory_report
+    from inventory_search import TrigramIndex, SearchResultCache
+    from inventory_duplicates import DUPLICATE_KEYS, find_duplicate_rows
+    from inventory_sqlite import SQLiteInventoryStore
+
+
+# Where the monitor keeps the inventory: one in-memory DataFrame, or a SQLite database
+BACKENDS = ('pandas', 'sqlite')
+
+# Methods profiled with --profile -> operation name of their reports
+PROFILED_OPERATIONS = {
+    'load_all_inventory_files': 'load',
+    'get_character_info': 'character_info',
+    '_search_items_uncached': 'search',
+    'find_duplicates': 'find_duplicates',
+    'get_character_summary': 'character_summary',
+}
 
 
 class EQInventoryMonitor:
-    def __init__(self, data_directory: str = None):
+    def __init__(self, data_directory: str = None, compact: bool = False, keep_newest: bool = False,
+                 show_timings: bool = False, profiler: Optional[OperationProfiler] = None):
         """
         Initialize the EverQuest inventory monitor.
         
         Args:
             data_directory: Path to directory containing inventory files. 
                           If None, uses current directory.
+            compact: Store the items DataFrame with categorical columns to save memory
+            keep_newest: Of identical rows in several files, keep the most recently exported one
+            show_timings: Print a per-stage timing breakdown after every load
+            profiler: Profile every load, search and analysis (see inventory_profile)
         """
         if data_directory is None:
             data_directory = os.getcwd()
@@ -25,119 +63,162 @@ class EQInventoryMonitor:
         if not os.path.exists(data_directory):
             raise ValueError(f"Data directory does not exist: {data_directory}")
             
+        _import_dataframe_modules()
+        if profiler is not None:
+            profile_methods(self, PROFILED_OPERATIONS, profiler)
         self.data_dir = data_directory
+        # Parsing in worker processes would hide it from the profiler
+        self.inventory_loader = InventoryLoader(self.data_dir, mode='serial' if profiler is not None else 'auto',
+                                                shared_bank_mode='rows', compact=compact,
+                                                duplicate_keep='newest' if keep_newest else 'first',
+                                                timing_hook=self._print_load_timings if show_timings else None)
         self.items_df = self.load_all_inventory_files()
+        self.name_index = None
+        self.search_cache = SearchResultCache()
         
         if self.items_df.empty:
             print("Warning: No inventory data found!")
             return
             
+        self.name_index = TrigramIndex(self.items_df['Name'])
         self.characters_info = self.get_character_info()
+        self._print_load_summary(len(self.characters_info), len(self.items_df),
+                                 len(self.items_df[self.items_df['Name'] != 'Empty']))
+
+    def _print_load_summary(self, characters: int, rows: int, non_empty: int):
         print(f"\n{'='*60}")
         print(f"INVENTORY LOADED SUCCESSFULLY")
         print(f"{'='*60}")
-        print(f"Characters found: {len(self.characters_info)}")
-        print(f"Total items loaded: {len(self.items_df):,}")
-        print(f"Non-empty items: {len(self.items_df[self.items_df['Name'] != 'Empty']):,}")
+        print(f"Characters found: {characters}")
+        print(f"Total items loaded: {rows:,}")
+        print(f"Non-empty items: {non_empty:,}")
         print(f"{'='*60}\n")
 
-    def load_all_inventory_files(self) -> pd.DataFrame:
+    def has_inventory(self) -> bool:
+        return not self.items_df.empty
+
+    def load_all_inventory_files(self, paths: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load and process all *-Inventory.txt files from the data directory.
         
+        Files already loaded are only re-read when their fingerprint (mtime, size,
+        content hash) changes, so repeated calls pick up new exports cheaply.
+        
+        Args:
+            paths: Only check these files (None checks the whole directory)
+        
         Returns:
             DataFrame containing consolidated inventory data from all characters
         """
-        # Look for inventory files in the data directory
-        pattern = os.path.join(self.data_dir, "*-Inventory.txt")
-        inventory_files = glob.glob(pattern)
+        final_df = self.inventory_loader.load(paths)
+        reload_info = self.inventory_loader.last_reload
+        file_count = len(self.inventory_loader.fingerprints)
         
-        if not inventory_files:
+        if file_count == 0 and not reload_info['removed']:
             print(f"No *-Inventory.txt files found in {self.data_dir}")
             return pd.DataFrame()
         
-        result_list = []
-        print(f"Found {len(inventory_files)} inventory files:")
+        if reload_info['full_rebuild']:
+            print(f"Found {file_count} inventory files:")
+        else:
+            unchanged_count = file_count - len(reload_info['added']) - len(reload_info['changed']) - len(reload_info['touched'])
+            print(f"Reloading {file_count} inventory files: {len(reload_info['added'])} added, "
+                  f"{len(reload_info['changed'])} changed, {len(reload_info['removed'])} removed, "
+                  f"{unchanged_count} unchanged")
+        
+        for file_path in reload_info['parsed']:
+            parsed = self.inventory_loader.parsed_files[file_path]
+            file_parts = [parsed['character_items'], parsed['shared_bank_items']]
+            item_count = sum(len(part) for part in file_parts)
+            non_empty_count = sum(int((part['Name'] != 'Empty').sum()) for part in file_parts)
+            print(f"  ✓  {parsed['char_name']}: {item_count:,} slots ({non_empty_count:,} items)")
+        
+        if reload_info['duplicates']:
+            print(f"  ℹ️  Removed {reload_info['duplicates']:,} duplicate entries")
+        
+        return final_df
 
-        for file_path in inventory_files:
-            try:
-                file_name = os.path.basename(file_path)
-                modified_epoch = os.path.getmtime(file_path)
-                modified_ts = datetime.fromtimestamp(modified_epoch)
-                
-                # Extract character name from filename (everything before first hyphen)
-                match = re.match(r"(.+?)-", file_name)
-                if not match:
-                    print(f"  ⚠️  Warning: Could not parse character name from {file_name}")
-                    continue
-                    
-                char_name = match.group(1)
-                
-                # Read inventory file
-                df = pd.read_csv(file_path, sep='\t')
-                
-                # Add metadata columns
-                df.insert(0, 'Character', char_name)
-                df['UpdatedAt'] = modified_ts
-                df['FileName'] = file_name
-                
-                # Handle shared bank items - mark them as SHARED-BANK character
-                df['Character'] = df['Location'].apply(
-                    lambda loc: 'SHARED-BANK' if str(loc).startswith('SharedBank') else char_name
-                )
-                
-                # Add derived columns for better searching
-                df['ItemType'] = df['Location'].apply(self._categorize_location)
-                df['IsEquipped'] = df['Location'].apply(lambda x: not any(word in str(x) for word in ['Slot', 'Bank', 'Bag']))
-                df['IsEmpty'] = df['Name'] == 'Empty'
-                
-                result_list.append(df)
-                item_count = len(df)
-                non_empty_count = len(df[df['Name'] != 'Empty'])
-                print(f"  ✓  {char_name}: {item_count:,} slots ({non_empty_count:,} items)")
-                
-            except Exception as e:
-                print(f"  ❌  Error processing {file_name}: {e}")
-                continue
+    def _print_load_timings(self, timings):
+        """Loader timing hook: one line per load."""
+        print(f"  ⏱️  {timings.format_line()}")
+
+    def reload_inventory(self, paths: Optional[List[str]] = None) -> List[str]:
+        """
+        Re-read only the inventory files that changed since the last load.
         
-        if not result_list:
-            return pd.DataFrame()
-            
-        # Combine all dataframes
-        final_df = pd.concat(result_list, axis=0, ignore_index=True)
+        Args:
+            paths: Only check these files, e.g. those reported by watch (None checks all)
         
-        # Remove duplicates based on all columns except UpdatedAt and FileName
-        unique_cols = [col for col in final_df.columns if col not in ['UpdatedAt', 'FileName']]
-        initial_count = len(final_df)
-        final_df = final_df.drop_duplicates(subset=unique_cols)
-        dedup_count = len(final_df)
+        Returns:
+            Characters whose rows were re-read
+        """
+        stats = self.search_cache.stats()
+        print(f"Search cache: {stats['hits']} hits, {stats['misses']} misses")
+        items_df = self.load_all_inventory_files(paths)
+        name_index = TrigramIndex(items_df['Name']) if not items_df.empty else None
         
-        if initial_count != dedup_count:
-            print(f"  ℹ️  Removed {initial_count - dedup_count:,} duplicate entries")
+        def swap():
+            self.items_df, self.name_index = items_df, name_index
+        self.search_cache.invalidate(swap)
         
-        return final_df
+        reload_info = self.inventory_loader.last_reload
+        self.characters_info = self.get_character_info(None if reload_info['full_rebuild'] else reload_info['characters'])
+        return reload_info['characters']
 
-    def _categorize_location(self, location: str) -> str:
-        """Categorize item location for easier filtering."""
-        location = str(location).lower()
-        
-        if 'bank' in location:
-            return 'Bank'
-        elif 'bag' in location or 'slot' in location:
-            return 'Inventory'
-        elif location in ['charm', 'ear', 'head', 'face', 'neck', 'shoulders', 'arms', 'wrist', 
-                         'hands', 'finger', 'chest', 'legs', 'feet', 'waist', 'primary', 
-                         'secondary', 'range', 'ammo']:
-            return 'Equipped'
-        else:
-            return 'Other'
+    def watch(self, backend: str = 'auto', interval: float = 1.0):
+        """
+        Reload inventory files as they are written, until Ctrl+C.
+        
+        Only the files reported by the watcher are re-read, and the overview of the
+        characters they belong to is printed after each reload.
+        
+        Args:
+            backend: 'auto', 'inotify' or 'poll' (see inventory_watch)
+            interval: Seconds between directory polls
+        """
+        changes = queue.Queue()
+        watcher = InventoryWatcher(self.data_dir, changes.put, backend=backend, interval=interval).start()
+        print(f"👀 Watching {self.data_dir} for inventory changes ({watcher.backend}). Press Ctrl+C to stop.")
+        try:
+            while True:
+                try:
+                    paths = changes.get(timeout=1)  # Wake up regularly so Ctrl+C is handled
+                except queue.Empty:
+                    continue
+                
+                print(f"\n🔄 {datetime.now():%H:%M:%S} inventory files changed")
+                characters = self.reload_inventory(paths)
+                if characters and not self.characters_info.empty:
+                    print(self.characters_info[self.characters_info['Character'].isin(characters)].to_string(index=False))
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+        finally:
+            watcher.stop()
 
-    def get_character_info(self) -> pd.DataFrame:
-        """Get summary information about each character."""
+    def print_memory_report(self):
+        """Print memory used per column by the plain and the compact items DataFrame."""
+        if self.items_df.empty:
+            print("No data loaded")
+            return
+        mode = "compact" if self.inventory_loader.compact else "plain"
+        print(f"\n💾 Memory report (currently {mode}, {len(self.items_df):,} rows):")
+        print(format_memory_report(memory_report(self.items_df)))
+
+    def get_character_info(self, characters: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Get summary information about each character.
+        
+        Args:
+            characters: Only recompute these characters' rows of the current characters_info
+        """
         if self.items_df.empty:
             return pd.DataFrame()
+        
+        previous = getattr(self, 'characters_info', None)
+        incremental = characters is not None and previous is not None and not previous.empty
+        items_df = self.items_df[self.items_df['Character'].isin(characters)] if incremental else self.items_df
             
-        summary = self.items_df.groupby('Character').agg({
+        summary = items_df.groupby('Character', observed=True).agg({
             'Name': lambda x: len(x[x != 'Empty']),  # Count non-empty items
             'UpdatedAt': 'max',
             'FileName': 'first'
@@ -145,8 +226,10 @@ class EQInventoryMonitor:
         
         summary['LastUpdated'] = summary['UpdatedAt'].dt.strftime('%Y-%m-%d %H:%M')
         summary = summary.drop('UpdatedAt', axis=1)
+        if incremental:
+            summary = pd.concat([previous[~previous['Character'].isin(characters)], summary], ignore_index=True)
         
-        return summary.sort_values('ItemCount', ascending=False)
+        return summary.sort_values(['ItemCount', 'Character'], ascending=[False, True], ignore_index=True)
 
     def search_items(self, search_term: str, character: str = None, 
                     exact_match: bool = False, item_type: str = None) -> pd.DataFrame:
@@ -160,15 +243,24 @@ class EQInventoryMonitor:
             item_type: Filter by item type ('Equipped', 'Inventory', 'Bank')
             
         Returns:
-            DataFrame containing matching items
+            DataFrame containing matching items (repeated searches come from search_cache)
         """
-        df = self.items_df[self.items_df['IsEmpty'] == False].copy()  # Exclude empty slots
-        
-        # Filter by search term
+        return self.search_cache.get_or_compute(
+            search_term, character, item_type, exact_match,
+            lambda: self._search_items_uncached(search_term, character, exact_match, item_type))
+
+    def _search_items_uncached(self, search_term: str, character: str = None,
+                               exact_match: bool = False, item_type: str = None) -> pd.DataFrame:
+        items_df, name_index = self.items_df, self.name_index
+        if name_index is None:  # Nothing loaded, e.g. after a reload found no inventory files
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        # Filter by search term (substring searches use the trigram name index)
         if exact_match:
-            df = df[df['Name'].str.lower() == search_term.lower()]
+            df = items_df[items_df['Name'].str.lower() == search_term.lower()]
         else:
-            df = df[df['Name'].str.contains(search_term, case=False, na=False)]
+            df = name_index.search(items_df, search_term)
+        df = df[df['IsEmpty'] == False].copy()  # Exclude empty slots
         
         # Filter by character
         if character:
@@ -180,30 +272,26 @@ class EQInventoryMonitor:
         
         return df[['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID']].sort_values(['Character', 'Name'])
 
-    def find_duplicates(self, min_count: int = 2) -> pd.DataFrame:
-        """Find items that appear multiple times across characters."""
-        item_counts = self.items_df[self.items_df['IsEmpty'] == False].groupby(['Name', 'ID']).agg({
-            'Character': 'count',
-            'Count': 'sum'
-        }).rename(columns={'Character': 'CharacterCount'}).reset_index()
-        
-        duplicates = item_counts[item_counts['CharacterCount'] >= min_count].sort_values('CharacterCount', ascending=False)
+    def find_duplicates(self, min_count: int = 2, mode: str = 'name_id') -> pd.DataFrame:
+        """
+        Find items that appear multiple times across characters.
         
+        Args:
+            min_count: Minimum number of occurrences
+            mode: 'name_id', 'id', 'name', or 'cross_character' (see inventory_duplicates)
+        """
+        duplicates = find_duplicate_rows(self.items_df, min_count, mode)
         if duplicates.empty:
             return duplicates
-            
-        # Get details for duplicate items
-        result_list = []
-        for _, row in duplicates.iterrows():
-            item_details = self.items_df[
-                (self.items_df['Name'] == row['Name']) & 
-                (self.items_df['ID'] == row['ID']) &
-                (self.items_df['IsEmpty'] == False)
-            ][['Character', 'Name', 'Location', 'Count']].copy()
-            item_details['TotalFound'] = row['CharacterCount']
-            result_list.append(item_details)
-            
-        return pd.concat(result_list, ignore_index=True)
+        duplicates = duplicates.sort_values('TotalFound', ascending=False, kind='stable')
+        return duplicates[['Character', 'Name', 'Location', 'Count', 'TotalFound']].reset_index(drop=True)
+
+    def get_character_items(self, character_name: str) -> pd.DataFrame:
+        """Non-empty items of one character, by item type and name."""
+        return self.items_df[
+            (self.items_df['Character'].str.lower() == character_name.lower()) &
+            (self.items_df['IsEmpty'] == False)
+        ][['Name', 'Location', 'ItemType', 'Count']].sort_values(['ItemType', 'Name'])
 
     def get_character_summary(self, character_name: str) -> Dict:
         """Get detailed summary for a specific character."""
@@ -276,10 +364,7 @@ class EQInventoryMonitor:
                     
             elif choice == "2":
                 char_name = input("Enter character name: ").strip()
-                char_items = self.items_df[
-                    (self.items_df['Character'].str.lower() == char_name.lower()) &
-                    (self.items_df['IsEmpty'] == False)
-                ][['Name', 'Location', 'ItemType', 'Count']].sort_values(['ItemType', 'Name'])
+                char_items = self.get_character_items(char_name)
                 
                 if not char_items.empty:
                     summary = self.get_character_summary(char_name)
@@ -297,8 +382,12 @@ class EQInventoryMonitor:
                     min_count = int(min_count) if min_count else 2
                 except ValueError:
                     min_count = 2
+                mode = input(f"Group by ({', '.join(DUPLICATE_KEYS)}; default name_id): ").strip() or 'name_id'
+                if mode not in DUPLICATE_KEYS:
+                    print(f"❌ Unknown grouping '{mode}', using name_id")
+                    mode = 'name_id'
                     
-                duplicates = self.find_duplicates(min_count)
+                duplicates = self.find_duplicates(min_count, mode)
                 if not duplicates.empty:
                     print(f"\n🔄 Items appearing {min_count}+ times:")
                     print(duplicates.to_string(index=False))
@@ -332,29 +421,236 @@ class EQInventoryMonitor:
             else:
                 print("❌ Invalid choice.")
 
+    def export_all_items(self, filename: str):
+        """Export the whole inventory to CSV."""
+        self.items_df.to_csv(filename, index=False)
+        print(f"✓ Full inventory exported to {filename}")
+
+    def _non_empty_items(self) -> pd.DataFrame:
+        return self.items_df[self.items_df['IsEmpty'] == False].copy()
+
     def show_gui(self):
         """Display inventory in PandasGUI."""
-        if not self.items_df.empty:
+        if self.has_inventory():
             # Show only non-empty items in GUI for better performance
-            display_df = self.items_df[self.items_df['IsEmpty'] == False].copy()
+            display_df = self._non_empty_items()
+            try:
+                from pandasgui import show
+            except ImportError:
+                print("❌ PandasGUI is not installed (pip install pandasgui)")
+                return
             show(display_df, settings={'block': True})
         else:
             print("No data to display")
 
 
+class SQLiteInventoryMonitor(EQInventoryMonitor):
+    """Inventory monitor keeping the items in a SQLite database (see inventory_sqlite) instead of a DataFrame."""
+    
+    def __init__(self, data_directory: str = None, database: Optional[str] = None, show_timings: bool = False,
+                 profiler: Optional[OperationProfiler] = None):
+        """
+        Args:
+            data_directory: Path to directory containing inventory files (None for the current directory)
+            database: SQLite database path (default: .fdt_inventory.sqlite in data_directory)
+            show_timings: Print a per-stage timing breakdown after every ingest
+            profiler: Profile every load, search and analysis (see inventory_profile)
+        """
+        if data_directory is None:
+            data_directory = os.getcwd()
+            
+        if not os.path.exists(data_directory):
+            raise ValueError(f"Data directory does not exist: {data_directory}")
+        
+        _import_dataframe_modules()
+        if profiler is not None:
+            profile_methods(self, PROFILED_OPERATIONS, profiler)
+        self.data_dir = data_directory
+        self.store = SQLiteInventoryStore(self.data_dir, database,
+                                          timing_hook=self._print_load_timings if show_timings else None)
+        self.search_cache = SearchResultCache()
+        self.load_all_inventory_files()
+        
+        characters, rows, non_empty = self.store.row_counts()
+        if not rows:
+            print("Warning: No inventory data found!")
+            self.characters_info = pd.DataFrame()
+            return
+        
+        self.characters_info = self.get_character_info()
+        self._print_load_summary(characters, rows, non_empty)
+
+    def load_all_inventory_files(self, paths: Optional[List[str]] = None):
+        """
+        Ingest new and changed *-Inventory.txt files into the database.
+        
+        Args:
+            paths: Only check these files (None checks the whole directory)
+        """
+        ingest = self.store.ingest(paths)
+        file_count = self.store.connection.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+        if file_count == 0 and not ingest['removed']:
+            print(f"No *-Inventory.txt files found in {self.data_dir}")
+            return
+        
+        print(f"Database {self.store.database}: {file_count} inventory files, {len(ingest['added'])} added, "
+              f"{len(ingest['changed'])} changed, {len(ingest['removed'])} removed")
+        return ingest
+
+    def has_inventory(self) -> bool:
+        return self.store.row_counts()[1] > 0
+
+    def reload_inventory(self, paths: Optional[List[str]] = None) -> List[str]:
+        """
+        Ingest only the inventory files that changed since the last load.
+        
+        Args:
+            paths: Only check these files, e.g. those reported by watch (None checks all)
+        
+        Returns:
+            Characters whose rows changed
+        """
+        stats = self.search_cache.stats()
+        print(f"Search cache: {stats['hits']} hits, {stats['misses']} misses")
+        self.search_cache.invalidate(lambda: self.load_all_inventory_files(paths))
+        
+        characters = self.store.last_ingest['characters']
+        if self.characters_info.empty:
+            self.characters_info = self.get_character_info()
+        elif characters:
+            self.characters_info = self.get_character_info(characters)
+        return characters
+
+    def print_memory_report(self):
+        """Print the database size (the items are not held in memory)."""
+        characters, rows, non_empty = self.store.row_counts()
+        size_mb = sum(os.path.getsize(path) for path in (self.store.database, self.store.database + '-wal')
+                      if os.path.exists(path)) / (1024 * 1024)
+        print(f"\n💾 SQLite backend: {rows:,} rows ({non_empty:,} items, {characters} characters) "
+              f"in {self.store.database}, {size_mb:.1f} MB on disk")
+
+    def get_character_info(self, characters: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Get summary information about each character.
+        
+        Args:
+            characters: Only recompute these characters' rows of the current characters_info
+        """
+        previous = getattr(self, 'characters_info', None)
+        if characters is None or previous is None or previous.empty:
+            return self.store.character_info()
+        
+        summary = pd.concat([previous[~previous['Character'].isin(characters)], self.store.character_info(characters)],
+                            ignore_index=True)
+        return summary.sort_values(['ItemCount', 'Character'], ascending=[False, True], ignore_index=True)
+
+    def _search_items_uncached(self, search_term: str, character: str = None,
+                               exact_match: bool = False, item_type: str = None) -> pd.DataFrame:
+        return self.store.search(search_term, character, exact_match, item_type)
+
+    def find_duplicates(self, min_count: int = 2, mode: str = 'name_id') -> pd.DataFrame:
+        """
+        Find items that appear multiple times across characters.
+        
+        Args:
+            min_count: Minimum number of occurrences
+            mode: 'name_id', 'id', 'name', or 'cross_character' (see inventory_duplicates)
+        """
+        return self.store.find_duplicates(min_count, mode)
+
+    def get_character_items(self, character_name: str) -> pd.DataFrame:
+        """Non-empty items of one character, by item type and name."""
+        return self.store.character_items(character_name)
+
+    def get_character_summary(self, character_name: str) -> Dict:
+        """Get detailed summary for a specific character."""
+        return self.store.character_summary(character_name)
+
+    def export_all_items(self, filename: str):
+        """Export the whole inventory to CSV, streaming rows out of the database."""
+        rows = self.store.export_csv(filename)
+        print(f"✓ Full inventory ({rows:,} rows) exported to {filename}")
+
+    def _non_empty_items(self) -> pd.DataFrame:
+        return self.store.items_frame(non_empty=True)
+
+
+def stream_search(directory: str, search_term: str) -> bool:
+    """
+    Answer a one-shot search with the pandas-free streaming parser.
+
+    Returns:
+        False if the files need the full parser (the caller then uses the DataFrame path)
+    """
+    if not os.path.exists(directory):
+        print(f"❌ Data directory does not exist: {directory}")
+        return True
+    
+    try:
+        inventory = read_inventory_directory(directory)
+        positions = inventory.matching_positions(search_term)
+    except StreamFormatError as e:
+        print(f"Streaming parser cannot read this folder ({e}), loading with pandas")
+        return False
+    except re.error as e:
+        print(f"❌ Invalid search pattern '{search_term}': {e}")
+        return True
+    
+    if not len(inventory):
+        print("❌ No inventory data found. Make sure *-Inventory.txt files are in the directory.")
+    elif positions:
+        print(f"\n🔍 Search results for '{search_term}':")
+        print(format_table(RESULT_COLUMNS, inventory.result_rows(positions)))
+    else:
+        print(f"❌ No items found matching '{search_term}'")
+    return True
+
+
 def main():
     """Main function with command line interface."""
     parser = argparse.ArgumentParser(description='EverQuest Inventory Monitor')
     parser.add_argument('-d', '--directory', help='Directory containing inventory files (default: current directory)')
     parser.add_argument('-g', '--gui', action='store_true', help='Launch GUI immediately')
     parser.add_argument('-s', '--search', help='Search for item by name')
+    parser.add_argument('--compact', action='store_true', help='Store inventory with categorical columns to save memory')
+    parser.add_argument('--memory-report', action='store_true', help='Print plain vs compact memory usage and exit')
+    parser.add_argument('--keep-newest', action='store_true',
+                        help='Of duplicate rows in several files, keep the most recently exported one')
+    parser.add_argument('--engine', choices=['stream', 'pandas'], default='stream',
+                        help='Parser for one-shot searches (-s): stream skips pandas entirely (default: stream)')
+    parser.add_argument('--timings', action='store_true',
+                        help='Print a per-stage timing breakdown (glob, parse, concat, dedup, ...) after every load')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='Write cProfile and peak memory reports of loads, searches and analyses to DIR')
+    parser.add_argument('-w', '--watch', action='store_true',
+                        help='Reload inventory files as they are re-exported until Ctrl+C')
+    parser.add_argument('--watch-backend', choices=WATCH_BACKENDS, default='auto',
+                        help='How --watch notices changes: inotify (Linux), poll, or auto (default: auto)')
+    parser.add_argument('--backend', choices=BACKENDS, default='pandas',
+                        help='Keep the inventory in memory (pandas) or in a SQLite database for very large '
+                             'collections (default: pandas)')
+    parser.add_argument('--database', metavar='PATH',
+                        help='SQLite database for --backend sqlite (default: .fdt_inventory.sqlite in the directory)')
     
     args = parser.parse_args()
     
+    profiler = OperationProfiler(args.profile) if args.profile else None
+    
+    if (args.search and args.engine == 'stream' and args.backend == 'pandas'
+            and not (args.gui or args.memory_report or args.timings)):
+        search = profiler.wrap('stream_search', stream_search) if profiler is not None else stream_search
+        if search(args.directory or os.getcwd(), args.search):
+            return
+    
     try:
-        inventory = EQInventoryMonitor(args.directory)
+        if args.backend == 'sqlite':
+            inventory = SQLiteInventoryMonitor(args.directory, args.database, show_timings=args.timings,
+                                               profiler=profiler)
+        else:
+            inventory = EQInventoryMonitor(args.directory, compact=args.compact, keep_newest=args.keep_newest,
+                                           show_timings=args.timings, profiler=profiler)
         
-        if inventory.items_df.empty:
+        if not inventory.has_inventory():
             print("❌ No inventory data found. Make sure *-Inventory.txt files are in the directory.")
             return
             
@@ -362,6 +658,10 @@ def main():
         print("📋 Character Overview:")
         print(inventory.characters_info.to_string(index=False))
         
+        if args.memory_report:
+            inventory.print_memory_report()
+            return
+            
         if args.gui:
             inventory.show_gui()
             return
@@ -375,6 +675,10 @@ def main():
                 print(f"❌ No items found matching '{args.search}'")
             return
         
+        if args.watch:
+            inventory.watch(args.watch_backend)
+            return
+        
         # Interactive menu
         while True:
             print(f"\n{'='*60}")
@@ -385,6 +689,9 @@ def main():
             print("3. Show character list")
             print("4. Quick item search")
             print("5. Export all data")
+            print("6. Reload changed files")
+            print("7. Memory report")
+            print("8. Watch for changes")
             print("0. Exit")
             
             choice = input("\nChoice: ").strip()
@@ -406,9 +713,15 @@ def main():
                         print("❌ No items found.")
             elif choice == "5":
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"eq_full_inventory_{timestamp}.csv"
-                inventory.items_df.to_csv(filename, index=False)
-                print(f"✓ Full inventory exported to {filename}")
+                inventory.export_all_items(f"eq_full_inventory_{timestamp}.csv")
+            elif choice == "6":
+                inventory.reload_inventory()
+                print("\n📋 Character Overview:")
+                print(inventory.characters_info.to_string(index=False))
+            elif choice == "7":
+                inventory.print_memory_report()
+            elif choice == "8":
+                inventory.watch(args.watch_backend)
             elif choice == "0":
                 break
             else:
@@ -1,4 +1,6 @@
-import pandas as pd
+import time
+_MODULE_START = time.perf_counter()
+
 from datetime import datetime
 import os
 import glob
@@ -8,11 +10,83 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 import threading
 from typing import Optional, List, Dict
-from signet_of_might_data import SignetOfMightQuest
+import argparse
+from inventory_jobs import JobScheduler
+from inventory_profile import OperationProfiler, profile_methods
+from inventory_watch import InventoryWatcher
+
+# pandas and every module built on it are imported by _import_dataframe_modules, on a
+# background thread at startup, so the window can appear before pandas has loaded
+pd = None
+_dataframe_modules_lock = threading.Lock()
+
+
+def _import_dataframe_modules():
+    """Import pandas and the DataFrame-based modules into this module's namespace (idempotent)."""
+    global pd, SignetOfMightQuest, InventoryLoader, create_shared_bank_signature
+    global TrigramIndex, IncrementalSearch, SearchResultCache, VirtualResultsView
+    global find_duplicate_rows, equipped_location_mask, ROOT_WORN, ROOT_GENERAL, ROOT_BANK, ROOT_SHARED_BANK
+    global ItemCatalog, analyze_zeb_components, ZEB_REQUIRED_FRAGMENTS, ZEB_OTHER_COMPONENTS
+    with _dataframe_modules_lock:
+        if pd is not None:
+            return
+        from signet_of_might_data import SignetOfMightQuest
+        from inventory_loader import InventoryLoader, create_shared_bank_signature
+        from inventory_search import TrigramIndex, IncrementalSearch, SearchResultCache
+        from inventory_results_view import VirtualResultsView
+        from inventory_duplicates import find_duplicate_rows
+        from inventory_catalog import ItemCatalog
+        from inventory_zeb import analyze_zeb_components, ZEB_REQUIRED_FRAGMENTS, ZEB_OTHER_COMPONENTS
+        from inventory_locations import equipped_location_mask, ROOT_WORN, ROOT_GENERAL, ROOT_BANK, ROOT_SHARED_BANK
+        import pandas as pd
+
+# Find Duplicates grouping choices -> inventory_duplicates mode
+DUPLICATE_MODE_LABELS = {
+    'Name + ID': 'name_id',
+    'ID only': 'id',
+    'Name only': 'name',
+    'Across characters': 'cross_character',
+}
+
+# Methods profiled with --profile -> operation name of their reports
+PROFILED_OPERATIONS = {
+    'load_inventory_files': 'load',
+    '_watch_reload_thread': 'watch_reload',
+    '_search_items_uncached': 'search',
+    'search_items_any': 'search_any',
+    '_find_duplicate_rows': 'find_duplicates',
+    '_analyze_zeb_components': 'zeb_check',
+    '_quest_progress_summary': 'quest_progress',
+}
 
 
 class EQInventoryGUI:
-    def __init__(self):
+    def __init__(self, lazy_startup: bool = True, profile_dir: Optional[str] = None):
+        """
+        Args:
+            lazy_startup: Import pandas in the background and build the Results and Signet
+                          tabs on first selection, so the window appears immediately
+            profile_dir: Write cProfile and peak memory reports of every load, search and
+                         analysis to this directory (see inventory_profile)
+        """
+        self.profiler = None
+        if profile_dir is not None:
+            self.profiler = OperationProfiler(profile_dir)
+            profile_methods(self, PROFILED_OPERATIONS, self.profiler)
+
+        # Startup phase -> seconds since this module started importing
+        self.startup_timings: Dict[str, float] = {}
+        self._startup_reported = False
+        self._startup_load_pending = False
+        self._record_startup_phase('module_import')
+        
+        self.lazy_startup = lazy_startup
+        if lazy_startup:
+            threading.Thread(target=self._import_dataframe_modules_in_background, daemon=True).start()
+        else:
+            _import_dataframe_modules()
+            self._record_startup_phase('dataframe_modules')
+        
         self.root = tk.Tk()
         self.root.title("FDT EQ Emu Inventory Parser")
         self.root.geometry("1400x850")
@@ -20,10 +94,42 @@ class EQInventoryGUI:
         self.root.configure(bg='#2c3e50')
         
         # Data storage
-        self.items_df = pd.DataFrame()
-        self.last_search_results = pd.DataFrame()
+        self.items_df = None  # Set by the first load (see has_inventory)
+        self.last_search_results = None
+        self.name_index = None  # Trigram index over items_df['Name'], rebuilt on every load
+        self.name_search = None  # Recent search terms on top of name_index, reset on every load
+        self.item_catalog = None  # Item IDs and names of items_df, rebuilt on every load
+        # (items_df, name_index, name_search, item_catalog) as one tuple, for the job worker to read in one step
+        self._search_state = (None, None, None, None)
+        self.search_cache = None  # Filtered search results, created by the first load and invalidated on every load
+        self.duplicate_mode_var = tk.StringVar(value='Name + ID')  # Grouping used by Find Duplicates
         self.data_dir = ""
         
+        # Loader mode: 'auto' parses large folders on a process pool ('serial', 'process', 'thread').
+        # Profiled loads parse serially, since worker processes are invisible to the profiler.
+        self.load_mode = 'auto' if self.profiler is None else 'serial'
+        self.inventory_loader = None  # Keeps file fingerprints between loads
+        self.use_load_cache = True  # Persist parsed inventory next to the files for fast warm starts
+        self.compact_memory = False  # Categorical columns and narrow integers for very large mule folders
+        self.keep_newest_duplicates = False  # Of identical rows across files, keep the latest export instead of the first
+        self.show_load_timings = True  # Append the per-stage load breakdown to the status bar after every load
+        
+        # Watch mode: reload re-exported files as they are written (toggled by the "Watch folder" checkbox)
+        self.watch_files_var = tk.BooleanVar(value=False)
+        self.watch_backend = 'auto'  # 'inotify', 'poll', or 'auto' (see inventory_watch)
+        self.inventory_watcher = None
+        self._watch_reload_running = False
+        self._watch_pending = set()  # Paths reported while a watch reload was running (None: check all)
+        
+        # Searches and analyses run on a background worker; only the newest job's result is shown
+        self.jobs = JobScheduler(lambda callback: self.root.after(0, callback), self._on_job_busy_changed)
+        self._status_before_job = None
+        
+        # Search-as-you-type: wait for a pause in typing before searching
+        self.live_search_delay_ms = 250
+        self.live_search_min_chars = 2
+        self._live_search_after = None
+        
         # Configure style with enhanced appearance
         style = ttk.Style()
         style.theme_use('clam')
@@ -54,8 +160,44 @@ class EQInventoryGUI:
                        padding=[15, 8],
                        font=('Arial', 10, 'bold'))
         
+        self._record_startup_phase('window')
         self.create_widgets()
+        self._record_startup_phase('widgets')
         self.center_window()
+    
+    def _record_startup_phase(self, phase):
+        """Remember when a startup phase finished (first occurrence only)."""
+        self.startup_timings.setdefault(phase, time.perf_counter() - _MODULE_START)
+    
+    def _import_dataframe_modules_in_background(self):
+        _import_dataframe_modules()
+        self._record_startup_phase('dataframe_modules')
+    
+    def format_startup_timings(self):
+        """One line with every recorded startup phase, in the order they finished."""
+        phases = sorted(self.startup_timings.items(), key=lambda item: item[1])
+        return "Startup: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in phases)
+    
+    def _report_startup(self):
+        """Print the startup timings once the window is up and the first load (if any) is done."""
+        if not self._startup_reported:
+            self._startup_reported = True
+            print(self.format_startup_timings())
+    
+    def _on_first_idle(self):
+        self._record_startup_phase('first_idle')
+        if not self._startup_load_pending:
+            self._report_startup()
+    
+    def _on_startup_load_finished(self):
+        if self._startup_load_pending:
+            self._startup_load_pending = False
+            self._record_startup_phase('auto_load')
+            self._report_startup()
+    
+    def has_inventory(self):
+        """True once a load has produced at least one item row."""
+        return self.items_df is not None and not self.items_df.empty
         
     def center_window(self):
         """Center the window on screen."""
@@ -94,6 +236,8 @@ class EQInventoryGUI:
         
         ttk.Button(dir_inner_frame, text="Browse", command=self.browse_directory, 
                   style='Accent.TButton').pack(side='right', padx=5)
+        ttk.Checkbutton(dir_inner_frame, text="Watch folder", variable=self.watch_files_var,
+                        command=self.update_watcher).pack(side='right', padx=5)
         ttk.Button(dir_inner_frame, text="Load Inventory", command=self.load_inventory,
                   style='Accent.TButton').pack(side='right')
         
@@ -105,6 +249,10 @@ class EQInventoryGUI:
         self.status_label = ttk.Label(status_frame, textvariable=self.status_var)
         self.status_label.pack(side='left')
         
+        # Cancel button for long searches and analyses (enabled while a job runs)
+        self.cancel_button = ttk.Button(status_frame, text="✖ Cancel", command=self.cancel_job, state='disabled')
+        self.cancel_button.pack(side='right')
+        
         # Progress bar
         self.progress = ttk.Progressbar(status_frame, mode='indeterminate')
         self.progress.pack(side='right', padx=10)
@@ -116,11 +264,11 @@ class EQInventoryGUI:
         # Search Tab (now includes overview)
         self.create_search_tab()
         
-        # Results Tab
-        self.create_results_tab()
-        
-        # Signet of Might Quest Tab
-        self.create_signet_quest_tab()
+        # Results and Signet of Might Quest tabs are built when first selected (or now, without lazy startup)
+        self._lazy_tabs = {}
+        self.results_tab = self._add_lazy_tab("📄 Results", self.create_results_tab, 'results_tab')
+        self.signet_tab = self._add_lazy_tab("🏺 Signet of Might", self.create_signet_quest_tab, 'signet_tab')
+        self.notebook.bind('<<NotebookTabChanged>>', lambda e: self._ensure_tab(self.notebook.select()))
         
         # Set initial directory to current directory and auto-load
         initial_dir = os.getcwd()
@@ -129,6 +277,25 @@ class EQInventoryGUI:
         # Auto-load inventory files from current directory if any exist
         self.auto_load_initial_inventory()
         
+    def _add_lazy_tab(self, text, builder, phase):
+        """Add an empty notebook tab whose contents builder(frame) creates on first use."""
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        self._lazy_tabs[str(frame)] = (frame, builder, phase)
+        if not self.lazy_startup:
+            self._ensure_tab(frame)
+        return frame
+    
+    def _ensure_tab(self, tab):
+        """Build a lazily created tab if it has not been built yet."""
+        entry = self._lazy_tabs.pop(str(tab), None)
+        if entry is None:
+            return
+        frame, builder, phase = entry
+        _import_dataframe_modules()
+        builder(frame)
+        self._record_startup_phase(phase)
+    
     def create_search_tab(self):
         """Create the search interface tab with optimized layout."""
         search_frame = ttk.Frame(self.notebook)
@@ -155,6 +322,7 @@ class EQInventoryGUI:
         search_entry = ttk.Entry(search_row, textvariable=self.search_term_var, width=25)
         search_entry.pack(side='left', padx=5)
         search_entry.bind('<Return>', lambda e: self.perform_search())
+        self.search_term_var.trace_add('write', self._on_search_term_changed)
         
         # Character filter
         ttk.Label(search_row, text="Character:").pack(side='left', padx=(15,5))
@@ -174,6 +342,10 @@ class EQInventoryGUI:
         self.exact_match_var = tk.BooleanVar()
         ttk.Checkbutton(search_row, text="Exact Match", variable=self.exact_match_var).pack(side='left', padx=(15,5))
         
+        # Live search checkbox - results update while typing
+        self.live_search_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(search_row, text="Live Search", variable=self.live_search_var).pack(side='left', padx=5)
+        
         # Action buttons row
         actions_row = ttk.Frame(controls_inner)
         actions_row.pack(fill='x', pady=5)
@@ -184,6 +356,8 @@ class EQInventoryGUI:
         
         ttk.Button(left_buttons, text="🔍 Search", command=self.perform_search).pack(side='left', padx=2)
         ttk.Button(left_buttons, text="🔄 Find Duplicates", command=self.find_duplicates).pack(side='left', padx=2)
+        ttk.Combobox(left_buttons, textvariable=self.duplicate_mode_var, values=list(DUPLICATE_MODE_LABELS),
+                     state='readonly', width=16).pack(side='left', padx=2)
         ttk.Button(left_buttons, text="📊 Character Summary", command=self.show_character_summary).pack(side='left', padx=2)
         
         # Right side buttons
@@ -376,11 +550,8 @@ class EQInventoryGUI:
     
 
     
-    def create_results_tab(self):
+    def create_results_tab(self, results_frame):
         """Create the search results tab with embedded search controls."""
-        results_frame = ttk.Frame(self.notebook)
-        self.notebook.add(results_frame, text="📄 Results")
-        
         # Search controls at top of results tab
         search_controls = ttk.LabelFrame(results_frame, text="🔍 Refine Search")
         search_controls.pack(fill='x', padx=10, pady=(5,0))
@@ -398,6 +569,7 @@ class EQInventoryGUI:
         results_search_entry = ttk.Entry(search_row, textvariable=self.search_term_var, width=25)
         results_search_entry.pack(side='left', padx=5)
         results_search_entry.bind('<Return>', lambda e: self.perform_search())
+        self.results_search_entry = results_search_entry
         
         # Character filter
         ttk.Label(search_row, text="Character:").pack(side='left', padx=(15,5))
@@ -423,6 +595,8 @@ class EQInventoryGUI:
         
         ttk.Button(left_buttons, text="🔍 Search", command=self.perform_search).pack(side='left', padx=2)
         ttk.Button(left_buttons, text="🔄 Find Duplicates", command=self.find_duplicates).pack(side='left', padx=2)
+        ttk.Combobox(left_buttons, textvariable=self.duplicate_mode_var, values=list(DUPLICATE_MODE_LABELS),
+                     state='readonly', width=16).pack(side='left', padx=2)
         ttk.Button(left_buttons, text="📊 Character Summary", command=self.show_character_summary).pack(side='left', padx=2)
         
         # Right side buttons
@@ -436,6 +610,7 @@ class EQInventoryGUI:
         # Store references to combo boxes for updating values
         self.results_character_combo = results_character_combo
         self.results_type_combo = results_type_combo
+        results_character_combo['values'] = self.character_combo['values']
         
         # Results count
         count_frame = ttk.Frame(results_frame)
@@ -444,9 +619,12 @@ class EQInventoryGUI:
         self.results_count_var = tk.StringVar(value="No search performed")
         ttk.Label(count_frame, textvariable=self.results_count_var, font=('Arial', 10, 'bold')).pack(side='left')
         
-        # Results treeview
+        # Results treeview - only the visible rows are materialized, so large result sets scroll instantly
         columns = ('Character', 'Item Name', 'Location', 'Type', 'Count', 'ID')
-        self.results_tree = ttk.Treeview(results_frame, columns=columns, show='headings')
+        self.results_view = VirtualResultsView(results_frame, list(columns),
+                                               ['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID'])
+        self.results_view.bind_row_double_click(self.on_result_double_click)
+        self.results_tree = self.results_view.tree
         
         for col in columns:
             self.results_tree.heading(col, text=col)
@@ -457,13 +635,13 @@ class EQInventoryGUI:
             else:
                 self.results_tree.column(col, width=100)
         
-        results_scrollbar_y = ttk.Scrollbar(results_frame, orient='vertical', command=self.results_tree.yview)
-        results_scrollbar_x = ttk.Scrollbar(results_frame, orient='horizontal', command=self.results_tree.xview)
-        self.results_tree.configure(yscrollcommand=results_scrollbar_y.set, xscrollcommand=results_scrollbar_x.set)
-        
-        self.results_tree.pack(side='left', fill='both', expand=True, padx=(10,0), pady=5)
-        results_scrollbar_y.pack(side='right', fill='y', pady=5)
-        results_scrollbar_x.pack(side='bottom', fill='x', padx=10)
+        self.results_view.pack(fill='both', expand=True, padx=10, pady=5)
+    
+    def on_result_double_click(self, row):
+        """Show every copy of the double-clicked item across all characters."""
+        name = row['Name']
+        self.run_job(f"Searching for '{name}'", lambda: self.search_items(name, exact_match=True),
+                     lambda results: self.display_results(results, f"All copies of '{name}'"))
     
     def on_character_summary_double_click(self, event):
         """Handle double-click on character in summary overview."""
@@ -484,9 +662,14 @@ class EQInventoryGUI:
             
             self.display_results(char_items, f"All items for {character}")
     
-    def update_overview(self):
-        """Update the embedded overview section with current data."""
-        if self.items_df.empty:
+    def update_overview(self, characters=None):
+        """
+        Update the embedded overview section with current data.
+        
+        Args:
+            characters: Only refresh these characters' rows of the character summary
+        """
+        if not self.has_inventory():
             return
         
         # Update statistics text
@@ -505,6 +688,8 @@ Empty Slots: {total_items - non_empty_items:,}
 Equipped: {equipped_items:,}
 Inventory: {inventory_items:,}
 Bank: {bank_items:,}"""
+        if self.compact_memory:
+            stats_text += f"\nMemory: {self.items_df.memory_usage(deep=True).sum() / (1024 * 1024):.1f} MB (compact)"
         
         # Update the stats summary text widget
         self.stats_summary.config(state='normal')
@@ -512,18 +697,29 @@ Bank: {bank_items:,}"""
         self.stats_summary.insert(1.0, stats_text)
         self.stats_summary.config(state='disabled')
         
-        # Update character summary tree
-        for item in self.char_summary_tree.get_children():
-            self.char_summary_tree.delete(item)
+        # Update character summary tree (rows are keyed by character name)
+        if characters is None:
+            summary_df = self.items_df
+            for item in self.char_summary_tree.get_children():
+                self.char_summary_tree.delete(item)
+        else:
+            summary_df = self.items_df[self.items_df['Character'].isin(characters)]
+            for character in characters:
+                if self.char_summary_tree.exists(character):
+                    self.char_summary_tree.delete(character)
         
-        char_summary = self.items_df.groupby('Character').agg({
+        char_summary = summary_df.groupby('Character', observed=True).agg({
             'Name': lambda x: len(x[x != 'Empty']),
             'UpdatedAt': 'max'
         }).rename(columns={'Name': 'ItemCount'}).reset_index()
         
         for _, row in char_summary.iterrows():
-            self.char_summary_tree.insert('', 'end', values=(
-                row['Character'],
+            character = str(row['Character'])
+            # Keep the tree in character order when a single character is added back
+            position = 'end' if characters is None else sum(
+                1 for item in self.char_summary_tree.get_children() if item < character)
+            self.char_summary_tree.insert('', position, iid=character, values=(
+                character,
                 f"{row['ItemCount']:,}",
                 row['UpdatedAt'].strftime('%Y-%m-%d %H:%M')
             ))
@@ -534,12 +730,16 @@ Bank: {bank_items:,}"""
         pattern = os.path.join(current_dir, "*-Inventory.txt")
         inventory_files = glob.glob(pattern)
         
+        self._startup_load_pending = bool(inventory_files)
         if inventory_files:
             self.status_var.set(f"Found {len(inventory_files)} inventory files in current directory. Loading...")
             self.root.update()
             
-            # Delay the loading slightly to let the GUI appear first
-            self.root.after(500, lambda: self.load_inventory_auto())
+            # Let the GUI appear first (with lazy startup it is already drawn, so start as soon as it is idle)
+            if self.lazy_startup:
+                self.root.after(1, self.load_inventory_auto)
+            else:
+                self.root.after(500, lambda: self.load_inventory_auto())
         else:
             dir_name = os.path.basename(current_dir) if current_dir else "current directory"
             self.status_var.set(f"No inventory files found in {dir_name}. Use Browse button to select a different directory.")
@@ -591,8 +791,11 @@ Bank: {bank_items:,}"""
     def _load_inventory_thread(self, directory):
         """Background thread for loading inventory."""
         try:
+            _import_dataframe_modules()  # Waits for the startup import if it is still running
+            if self.search_cache is None:
+                self.search_cache = SearchResultCache()
             self.data_dir = directory
-            self.items_df = self.load_inventory_files(directory)
+            self._use_loaded_items(self.load_inventory_files(directory))
             
             # Update UI in main thread
             self.root.after(0, self._on_inventory_loaded)
@@ -600,11 +803,25 @@ Bank: {bank_items:,}"""
         except Exception as e:
             self.root.after(0, lambda: self._on_inventory_error(str(e)))
     
+    def _use_loaded_items(self, items_df):
+        """Index a freshly loaded items DataFrame and make it current."""
+        name_index = TrigramIndex(items_df['Name']) if not items_df.empty else None
+        name_search = IncrementalSearch(name_index) if name_index is not None else None
+        item_catalog = ItemCatalog(items_df) if not items_df.empty else None
+        # Swap together so background searches never pair an index (or cached results) with the wrong frame.
+        # Worker code reads _search_state once; the separate attributes are for the Tk thread.
+        def swap():
+            self._search_state = (items_df, name_index, name_search, item_catalog)
+            self.items_df, self.name_index, self.name_search = items_df, name_index, name_search
+            self.item_catalog = item_catalog
+        self.search_cache.invalidate(swap)
+    
     def _on_inventory_loaded(self):
         """Called when inventory loading completes successfully."""
         self.progress.stop()
+        self._on_startup_load_finished()
         
-        if self.items_df.empty:
+        if not self.has_inventory():
             self.status_var.set("No inventory files found")
             messagebox.showwarning("Warning", "No *-Inventory.txt files found in the selected directory")
             return
@@ -614,7 +831,18 @@ Bank: {bank_items:,}"""
         characters = self.items_df['Character'].nunique()
         shared_bank_items = len(self.items_df[self.items_df['Character'] == 'SHARED-BANK'])
         
-        self.status_var.set(f"Loaded {non_empty_items:,} items from {characters} characters")
+        status_text = f"Loaded {non_empty_items:,} items from {characters} characters"
+        reload_info = self.inventory_loader.last_reload if self.inventory_loader is not None else {}
+        if reload_info.get('from_cache') and not reload_info['parsed']:
+            status_text += " (from cache)"
+        elif not reload_info.get('full_rebuild', True):
+            status_text += (f" (reparsed {len(reload_info['parsed'])} of {len(self.inventory_loader.fingerprints)} files, "
+                            f"{len(reload_info['removed'])} removed)")
+        if reload_info.get('duplicates'):
+            status_text += f" - {reload_info['duplicates']:,} duplicate rows removed"
+        if self.show_load_timings and reload_info.get('timings') is not None:
+            status_text += f" | {reload_info['timings'].format_line()}"
+        self.status_var.set(status_text)
         
         # Update character dropdown (both Dashboard and Results tabs)
         char_list = ['All'] + sorted(self.items_df['Character'].unique().tolist())
@@ -630,6 +858,7 @@ Bank: {bank_items:,}"""
         
         # Update overview tab
         self.update_overview()
+        self.update_watcher()
         
         # Show appropriate message based on load type
         if hasattr(self, '_manual_load') and self._manual_load:
@@ -649,145 +878,157 @@ Bank: {bank_items:,}"""
     def _on_inventory_error(self, error_msg):
         """Called when inventory loading fails."""
         self.progress.stop()
+        self._on_startup_load_finished()
         self.status_var.set("Error loading inventory")
         messagebox.showerror("Error", f"Failed to load inventory:\n{error_msg}")
     
     def load_inventory_files(self, directory):
-        """Load all inventory files from directory."""
-        pattern = os.path.join(directory, "*-Inventory.txt")
-        inventory_files = glob.glob(pattern)
-        
-        if not inventory_files:
-            return pd.DataFrame()
-        
-        result_list = []
-        shared_bank_data = {}  # Track shared bank data to detect duplicates
-        
-        for file_path in inventory_files:
+        """Load all inventory files from directory, reparsing only files changed since the last load."""
+        if self.inventory_loader is None or self.inventory_loader.directory != directory:
+            self.inventory_loader = InventoryLoader(directory, mode=self.load_mode, cache=self.use_load_cache,
+                                                   compact=self.compact_memory,
+                                                   duplicate_keep='newest' if self.keep_newest_duplicates else 'first')
+        return self.inventory_loader.load()
+    
+    def update_watcher(self):
+        """Start or stop watching the loaded directory to match the "Watch folder" checkbox."""
+        watching = self.watch_files_var.get() and self.inventory_loader is not None
+        watcher = self.inventory_watcher
+        if watcher is not None and (not watching or watcher.directory != self.inventory_loader.directory):
+            watcher.stop()
+            self.inventory_watcher = watcher = None
+        if watching and watcher is None:
             try:
-                file_name = os.path.basename(file_path)
-                modified_epoch = os.path.getmtime(file_path)
-                modified_ts = datetime.fromtimestamp(modified_epoch)
-                
-                # Extract character name
-                match = re.match(r"(.+?)-", file_name)
-                if not match:
-                    continue
-                    
-                char_name = match.group(1)
-                
-                # Read file
-                df = pd.read_csv(file_path, sep='\t')
-                df.insert(0, 'Character', char_name)
-                df['UpdatedAt'] = modified_ts
-                df['FileName'] = file_name
-                
-                # Separate shared bank items for duplicate detection
-                shared_bank_items = df[df['Location'].str.startswith('SharedBank', na=False)].copy()
-                character_items = df[~df['Location'].str.startswith('SharedBank', na=False)].copy()
-                
-                # Process shared bank duplicate detection
-                if not shared_bank_items.empty:
-                    # Create a signature for this shared bank based on all items
-                    shared_bank_signature = self._create_shared_bank_signature(shared_bank_items)
-                    
-                    if shared_bank_signature in shared_bank_data:
-                        # This shared bank already exists - skip it to avoid duplicates
-                        print(f"  Skipping duplicate shared bank from {char_name} (same as {shared_bank_data[shared_bank_signature]['source_char']})")
-                    else:
-                        # New unique shared bank - add it
-                        shared_bank_items['Character'] = 'SHARED-BANK'
-                        shared_bank_data[shared_bank_signature] = {
-                            'data': shared_bank_items,
-                            'source_char': char_name,
-                            'updated_at': modified_ts
-                        }
-                
-                # Always add character-specific items
-                character_items['Character'] = char_name
-                
-                # Add derived columns
-                for df_part in [character_items]:
-                    if not df_part.empty:
-                        df_part['ItemType'] = df_part['Location'].apply(self._categorize_location)
-                        df_part['IsEquipped'] = df_part['Location'].apply(lambda x: not any(word in str(x) for word in ['Slot', 'Bank', 'Bag']))
-                        df_part['IsEmpty'] = df_part['Name'] == 'Empty'
-                        result_list.append(df_part)
-                
-            except Exception as e:
-                print(f"Error processing {file_path}: {e}")
-                continue
-        
-        # Add all unique shared banks
-        for signature, bank_info in shared_bank_data.items():
-            shared_bank_df = bank_info['data']
-            shared_bank_df['ItemType'] = shared_bank_df['Location'].apply(self._categorize_location)
-            shared_bank_df['IsEquipped'] = shared_bank_df['Location'].apply(lambda x: not any(word in str(x) for word in ['Slot', 'Bank', 'Bag']))
-            shared_bank_df['IsEmpty'] = shared_bank_df['Name'] == 'Empty'
-            result_list.append(shared_bank_df)
-        
-        if not result_list:
-            return pd.DataFrame()
-            
-        final_df = pd.concat(result_list, axis=0, ignore_index=True)
-        
-        # Remove duplicates from character-specific items only (shared bank already deduplicated)
-        character_items_df = final_df[final_df['Character'] != 'SHARED-BANK']
-        shared_bank_df = final_df[final_df['Character'] == 'SHARED-BANK']
+                self.inventory_watcher = InventoryWatcher(self.inventory_loader.directory, self._on_watched_files_changed,
+                                                          backend=self.watch_backend).start()
+            except OSError as e:
+                self.watch_files_var.set(False)
+                messagebox.showerror("Error", f"Cannot watch {self.inventory_loader.directory}:\n{e}")
+                return
+            self.status_var.set(f"Watching {self.inventory_loader.directory} for new exports "
+                                f"({self.inventory_watcher.backend})")
+        elif not watching and self.watch_files_var.get():
+            self.status_var.set("Load inventory files to start watching the folder")
+    
+    def _on_watched_files_changed(self, paths):
+        """Watcher thread callback: hand the changed paths to the Tk thread."""
+        self.root.after(0, lambda: self._queue_watch_reload(paths))
+    
+    def _queue_watch_reload(self, paths):
+        """Reload changed files in the background, one reload at a time."""
+        if self._watch_pending is not None:
+            self._watch_pending = None if paths is None else self._watch_pending.union(paths)
+        if self._watch_reload_running or self.inventory_watcher is None:
+            return
         
-        if not character_items_df.empty:
-            unique_cols = [col for col in character_items_df.columns if col not in ['UpdatedAt', 'FileName']]
-            character_items_df = character_items_df.drop_duplicates(subset=unique_cols)
+        paths = None if self._watch_pending is None else sorted(self._watch_pending)
+        self._watch_pending = set()
+        self._watch_reload_running = True
+        self.status_var.set("Inventory files changed, updating...")
         
-        if not shared_bank_df.empty:
-            final_df = pd.concat([character_items_df, shared_bank_df], axis=0, ignore_index=True)
+        thread = threading.Thread(target=self._watch_reload_thread, args=(paths,))
+        thread.daemon = True
+        thread.start()
+    
+    def _watch_reload_thread(self, paths):
+        """Background thread: reparse only the reported files and splice them into items_df."""
+        try:
+            self._use_loaded_items(self.inventory_loader.load(paths))
+            reload_info = dict(self.inventory_loader.last_reload)
+            self.root.after(0, lambda: self._on_watch_reload(reload_info))
+        except Exception as e:
+            error_msg = str(e)
+            self.root.after(0, lambda: self._on_watch_reload(None, error_msg))
+    
+    def _on_watch_reload(self, reload_info, error_msg=None):
+        """Refresh the affected characters' rows and counts after a watch reload."""
+        self._watch_reload_running = False
+        if error_msg is not None:
+            self.status_var.set(f"Error reloading changed inventory files: {error_msg}")
+        elif self.has_inventory():
+            characters = None if reload_info['full_rebuild'] else reload_info['characters']
+            if characters != []:
+                char_list = ['All'] + sorted(self.items_df['Character'].unique().tolist())
+                self.character_combo['values'] = char_list
+                if hasattr(self, 'results_character_combo'):
+                    self.results_character_combo['values'] = char_list
+                self.update_overview(characters)
+            
+            changed_names = [os.path.basename(file_path)
+                             for file_path in reload_info['added'] + reload_info['changed'] + reload_info['removed']]
+            status_text = f"{datetime.now():%H:%M:%S} updated {', '.join(changed_names) or 'timestamps'}"
+            if reload_info.get('duplicates'):
+                status_text += f" - {reload_info['duplicates']:,} duplicate rows removed"
+            if self.show_load_timings:
+                status_text += f" | {reload_info['timings'].format_line()}"
+            self.status_var.set(status_text)
         else:
-            final_df = character_items_df
+            self.status_var.set("No inventory files left in the watched folder")
         
-        return final_df
+        if self._watch_pending is None or self._watch_pending:
+            self._queue_watch_reload([])
     
     def _create_shared_bank_signature(self, shared_bank_df):
         """Create a unique signature for shared bank contents to detect duplicates."""
-        # Sort by location and name to ensure consistent ordering
-        sorted_items = shared_bank_df.sort_values(['Location', 'Name', 'ID', 'Count'])
-        
-        # Create signature from non-empty items only (empty slots can vary)
-        non_empty_items = sorted_items[sorted_items['Name'] != 'Empty']
-        
-        if non_empty_items.empty:
-            # If shared bank is completely empty, create signature based on structure
-            return f"empty_bank_{len(sorted_items)}_slots"
-        
-        # Create signature from item data (location, name, id, count)
-        signature_parts = []
-        for _, row in non_empty_items.iterrows():
-            signature_parts.append(f"{row['Location']}|{row['Name']}|{row['ID']}|{row['Count']}")
-        
-        # Hash the signature for efficient comparison
-        import hashlib
-        signature_string = ":::".join(signature_parts)
-        return hashlib.md5(signature_string.encode()).hexdigest()
-    
-    def _categorize_location(self, location):
-        """Categorize item location."""
-        location = str(location).lower()
-        
-        if 'bank' in location:
-            return 'Bank'
-        elif 'bag' in location or 'slot' in location:
-            return 'Inventory'
-        elif location in ['charm', 'ear', 'head', 'face', 'neck', 'shoulders', 'arms', 'wrist', 
-                         'hands', 'finger', 'chest', 'legs', 'feet', 'waist', 'primary', 
-                         'secondary', 'range', 'ammo']:
-            return 'Equipped'
-        else:
-            return 'Other'
+        return create_shared_bank_signature(shared_bank_df)
     
 
     
+    def run_job(self, label, func, on_done):
+        """Run func on the job worker and hand its result to on_done on the Tk thread."""
+        self.jobs.submit(label, func, on_done, self._on_job_error)
+    
+    def cancel_job(self):
+        """Cancel the running search or analysis (its result is discarded)."""
+        if self.jobs.cancel():
+            self.status_var.set(f"{self.jobs.current_label} cancelled")
+    
+    def _on_job_busy_changed(self, busy, label):
+        if busy:
+            if self._status_before_job is None:
+                self._status_before_job = self.status_var.get()
+            self.status_var.set(f"{label}...")
+            self.cancel_button.config(state='normal')
+            self.progress.start()
+        else:
+            if self._status_before_job is not None:
+                self.status_var.set(self._status_before_job)
+                self._status_before_job = None
+            self.cancel_button.config(state='disabled')
+            self.progress.stop()
+    
+    def _on_job_error(self, error):
+        messagebox.showerror("Error", f"{self.jobs.current_label} failed:\n{error}")
+    
+    def _on_search_term_changed(self, *args):
+        """Schedule a live search once typing pauses."""
+        self._cancel_live_search()
+        if self.live_search_var.get() and self.has_inventory():
+            self._live_search_after = self.root.after(self.live_search_delay_ms, self._run_live_search)
+    
+    def _cancel_live_search(self):
+        if self._live_search_after is not None:
+            self.root.after_cancel(self._live_search_after)
+            self._live_search_after = None
+    
+    def _run_live_search(self):
+        self._live_search_after = None
+        search_term = self.search_term_var.get().strip()
+        if len(search_term) < self.live_search_min_chars:
+            return
+        
+        character = self.character_var.get() if self.character_var.get() != 'All' else None
+        item_type = self.item_type_var.get() if self.item_type_var.get() != 'All' else None
+        exact_match = self.exact_match_var.get()
+        
+        self.run_job(f"Searching for '{search_term}'",
+                     lambda: self.search_items(search_term, character, exact_match, item_type),
+                     lambda results: self.display_results(results, f"Search: '{search_term}'", live=True))
+    
     def perform_search(self):
         """Perform search based on current filters."""
-        if self.items_df.empty:
+        self._cancel_live_search()
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
@@ -801,21 +1042,28 @@ Bank: {bank_items:,}"""
         item_type = self.item_type_var.get() if self.item_type_var.get() != 'All' else None
         exact_match = self.exact_match_var.get()
         
-        # Perform search
-        results = self.search_items(search_term, character, exact_match, item_type)
-        self.display_results(results, f"Search: '{search_term}'")
+        # Perform search on the worker; a newer search replaces this one
+        self.run_job(f"Searching for '{search_term}'",
+                     lambda: self.search_items(search_term, character, exact_match, item_type),
+                     lambda results: self.display_results(results, f"Search: '{search_term}'"))
     
     def search_items(self, search_term, character=None, exact_match=False, item_type=None):
-        """Search for items with filters."""
-        df = self.items_df[self.items_df['IsEmpty'] == False].copy()
-        
-        # Handle regex patterns for quick searches
-        if '|' in search_term:
-            df = df[df['Name'].str.contains(search_term, case=False, na=False, regex=True)]
-        elif exact_match:
-            df = df[df['Name'].str.lower() == search_term.lower()]
+        """Search for items with filters. Repeated searches are served from search_cache."""
+        return self.search_cache.get_or_compute(
+            search_term, character, item_type, exact_match,
+            lambda: self._search_items_uncached(search_term, character, exact_match, item_type))
+    
+    def _search_items_uncached(self, search_term, character=None, exact_match=False, item_type=None):
+        items_df, _, name_search, _ = self._search_state  # One read: a reload may swap in a new frame meanwhile
+        if name_search is None:  # Nothing loaded
+            return pd.DataFrame(columns=['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID'])
+        # Quick searches use 'A|B' patterns, which stay regex searches even with exact match set
+        if exact_match and '|' not in search_term:
+            df = items_df[items_df['Name'].str.lower() == search_term.lower()]
         else:
-            df = df[df['Name'].str.contains(search_term, case=False, na=False)]
+            # Substring and regex patterns go through the name index
+            df = name_search.search(items_df, search_term)
+        df = df[df['IsEmpty'] == False].copy()
         
         if character:
             df = df[df['Character'].str.lower() == character.lower()]
@@ -825,15 +1073,24 @@ Bank: {bank_items:,}"""
         
         return df[['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID']].sort_values(['Character', 'Name'])
     
+    def search_items_any(self, item_names):
+        """Search for items whose name contains any of item_names (case-insensitive, literal)."""
+        items_df, name_index, _, _ = self._search_state
+        if name_index is None:
+            return pd.DataFrame(columns=['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID'])
+        df = name_index.search_any(items_df, item_names)
+        df = df[df['IsEmpty'] == False]
+        return df[['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID']].sort_values(['Character', 'Name'])
+    
     def debug_fragment_locations(self):
         """Debug function to show where fragments are located."""
-        if self.items_df.empty:
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
-        # Find all Fragment of Truth items
+        # Find all Fragment of Truth items by ID
         fragment_items = self.items_df[
-            (self.items_df['Name'].str.contains('Fragment of Truth', case=False, na=False)) &
+            (self.items_df['ID'].isin(self.item_catalog.resolve('Fragment of Truth'))) &
             (self.items_df['IsEmpty'] == False)
         ]
         
@@ -849,33 +1106,9 @@ Bank: {bank_items:,}"""
         debug_info.append("")
         
         # Categorize locations using the SAME logic as the main analyzer
-        def count_slot_levels(location):
-            return str(location).count('-Slot')
-        
-        def is_equipped_location(location):
-            """Determine if location represents an equipped augment."""
-            location_str = str(location)
-            slot_count = location_str.count('-Slot')
-            
-            if slot_count == 0:
-                # No slots = loose item/gear
-                return False
-            elif slot_count == 1:
-                # One slot level - check if it's in a container or worn gear
-                if ('General' in location_str or 'Bank' in location_str or 'SharedBank' in location_str):
-                    # General1-Slot1 = item in bag = Available
-                    return False
-                else:
-                    # Primary-Slot1 = augment in worn gear = Equipped
-                    return True
-            else:
-                # 2+ slot levels = augment in item = Equipped
-                return True
-        
-        # Add analysis columns
         fragment_items = fragment_items.copy()
-        fragment_items['SlotLevel'] = fragment_items['Location'].apply(count_slot_levels)
-        fragment_items['IsEquippedLocation'] = fragment_items['Location'].apply(is_equipped_location)
+        fragment_items['SlotLevel'] = fragment_items['SlotDepth']
+        fragment_items['IsEquippedLocation'] = equipped_location_mask(fragment_items)
         
         # Available = items in non-equipped locations
         available_items = fragment_items[fragment_items['IsEquippedLocation'] == False]
@@ -884,23 +1117,13 @@ Bank: {bank_items:,}"""
         equipped_items = fragment_items[fragment_items['IsEquippedLocation'] == True]
         
         # Split available items by container type
-        available_general = available_items[available_items['Location'].str.contains('General', case=False, na=False)]
-        available_bank = available_items[available_items['Location'].str.contains('Bank', case=False, na=False)]
-        available_other = available_items[
-            ~available_items['Location'].str.contains('General', case=False, na=False) &
-            ~available_items['Location'].str.contains('Bank', case=False, na=False)
-        ]
+        available_general = available_items[available_items['RootKind'] == ROOT_GENERAL]
+        available_bank = available_items[available_items['RootKind'].isin([ROOT_BANK, ROOT_SHARED_BANK])]
+        available_other = available_items[available_items['RootKind'] == ROOT_WORN]
         
         # Split equipped items by location (worn vs spare gear)
-        equipped_worn = equipped_items[
-            ~equipped_items['Location'].str.contains('General', case=False, na=False) &
-            ~equipped_items['Location'].str.contains('Bank', case=False, na=False)
-        ]
-        
-        equipped_spare = equipped_items[
-            (equipped_items['Location'].str.contains('General', case=False, na=False)) |
-            (equipped_items['Location'].str.contains('Bank', case=False, na=False))
-        ]
+        equipped_worn = equipped_items[equipped_items['RootKind'] == ROOT_WORN]
+        equipped_spare = equipped_items[equipped_items['RootKind'] != ROOT_WORN]
         
         debug_info.append(f"📦 Available in Bags: {len(available_general)}")
         for _, item in available_general.head(10).iterrows():
@@ -956,199 +1179,20 @@ Bank: {bank_items:,}"""
     
     def check_zeb_weapon_components(self):
         """Check if player has components needed for Zeb Weapon creation."""
-        if self.items_df.empty:
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
-        # Define required components
-        required_fragments = [
-            "Akhevan Fragment of Truth",
-            "Fiery Fragment of Truth", 
-            "Gelid Fragment of Truth",
-            "Hastened Fragment of Truth",
-            "Healing Fragment of Truth",
-            "Icy Fragment of Truth",
-            "Lethal Fragment of Truth",
-            "Magical Fragment of Truth",
-            "Replenishing Fragment of Truth",
-            "Runic Fragment of Truth",
-            "Ssraeshzian Fragment of Truth",
-            "Yttrium Fragment of Truth"
-        ]
-        
-        other_components = [
-            "Time Phased Quintessence",
-            "Vortex of the Past"
-        ]
-        
-        # Check inventory for all components
+        # Check inventory for all components on the worker, then display results in a new window
         include_equipped = self.include_equipped_var.get()
-        results = self._analyze_zeb_components(required_fragments, other_components, include_equipped)
-        
-        # Display results in a new window
-        self._show_zeb_weapon_results(results)
+        self.run_job("Checking Zeb weapon components",
+                     lambda: self._analyze_zeb_components(ZEB_REQUIRED_FRAGMENTS, ZEB_OTHER_COMPONENTS, include_equipped),
+                     self._show_zeb_weapon_results)
     
     def _analyze_zeb_components(self, required_fragments, other_components, include_equipped=False):
         """Analyze inventory for Zeb weapon components."""
-        # Get all non-empty items
-        all_non_empty_items = self.items_df[self.items_df['IsEmpty'] == False]
-        
-        # Define what constitutes "available" (not equipped) items
-        if not include_equipped:
-            # Available = items that are loose in containers (not augmented into any gear)
-            # Equipped = items that are augmented into gear (worn OR spare)
-            
-            # Count the number of "-Slot" occurrences and analyze location pattern
-            # Available patterns:
-            #   Level 0: Primary, Head, General1 (loose gear/items)
-            #   Level 1: General1-Slot1, Bank4-Slot7 (items IN containers)
-            # Equipped patterns:
-            #   Level 1: Range-Slot1, Primary-Slot2 (augments IN worn gear)
-            #   Level 2+: General2-Slot1-Slot2 (augments IN items IN containers)
-            
-            def count_slot_levels(location):
-                return str(location).count('-Slot')
-            
-            def is_equipped_location(location):
-                """Determine if location represents an equipped augment."""
-                location_str = str(location)
-                slot_count = location_str.count('-Slot')
-                
-                if slot_count == 0:
-                    # No slots = loose item/gear
-                    return False
-                elif slot_count == 1:
-                    # One slot level - check if it's in a container or worn gear
-                    if ('General' in location_str or 'Bank' in location_str or 'SharedBank' in location_str):
-                        # General1-Slot1 = item in bag = Available
-                        return False
-                    else:
-                        # Primary-Slot1 = augment in worn gear = Equipped
-                        return True
-                else:
-                    # 2+ slot levels = augment in item = Equipped
-                    # General2-Slot1-Slot2 = augment in item in bag = Equipped
-                    return True
-            
-            # Add analysis columns
-            all_non_empty_items = all_non_empty_items.copy()
-            all_non_empty_items['SlotLevel'] = all_non_empty_items['Location'].apply(count_slot_levels)
-            all_non_empty_items['IsEquippedLocation'] = all_non_empty_items['Location'].apply(is_equipped_location)
-            
-            # Equipped = items in equipped locations
-            equipped_items = all_non_empty_items[all_non_empty_items['IsEquippedLocation'] == True]
-            
-            # Available = items in non-equipped locations
-            available_items = all_non_empty_items[all_non_empty_items['IsEquippedLocation'] == False]
-        else:
-            # If including equipped, all non-empty items are "available"
-            available_items = all_non_empty_items
-            equipped_items = pd.DataFrame()  # Empty dataframe
-        
-        # Debug output - let's see what we're working with
-        print(f"Debug: Total non-empty items: {len(all_non_empty_items)}")
-        print(f"Debug: Available items: {len(available_items)}")
-        if not include_equipped:
-            print(f"Debug: Equipped items: {len(equipped_items)}")
-            print(f"Debug: Sample available locations: {available_items['Location'].head(10).tolist()}")
-            if len(equipped_items) > 0:
-                print(f"Debug: Sample equipped locations: {equipped_items['Location'].head(10).tolist()}")
-        
-        results = {
-            'fragments': {},
-            'other_components': {},
-            'missing_fragments': [],
-            'missing_other': [],
-            'can_make_weapon': False,
-            'total_fragments_ready': 0,
-            'include_equipped': include_equipped,
-            'equipped_fragments': {},
-            'available_fragments': {}
-        }
-        
-        # Check each required fragment
-        for fragment_base in required_fragments:
-            legendary_name = f"{fragment_base} (Legendary)"
-            enchanted_name = f"{fragment_base} (Enchanted)"
-            
-            # Count from available items (for crafting)
-            legendary_count = len(available_items[
-                available_items['Name'].str.contains(legendary_name, case=False, na=False, regex=False)
-            ])
-            
-            enchanted_count = len(available_items[
-                available_items['Name'].str.contains(enchanted_name, case=False, na=False, regex=False)
-            ])
-            
-            # Count equipped versions for reporting (ALL equipped: worn + spare gear)
-            equipped_legendary = 0
-            equipped_enchanted = 0
-            
-            if not include_equipped and len(all_non_empty_items) > 0:
-                # Count ALL equipped fragments (both worn and spare gear)
-                all_equipped_legendary = len(all_non_empty_items[
-                    (all_non_empty_items['Name'].str.contains(legendary_name, case=False, na=False, regex=False)) &
-                    (all_non_empty_items['IsEquippedLocation'] == True)
-                ])
-                
-                all_equipped_enchanted = len(all_non_empty_items[
-                    (all_non_empty_items['Name'].str.contains(enchanted_name, case=False, na=False, regex=False)) &
-                    (all_non_empty_items['IsEquippedLocation'] == True)
-                ])
-                
-                equipped_legendary = all_equipped_legendary
-                equipped_enchanted = all_equipped_enchanted
-            
-            # Debug output for specific fragments
-            print(f"Debug {fragment_base}: Available L:{legendary_count} E:{enchanted_count}, Equipped L:{equipped_legendary} E:{equipped_enchanted}")
-            
-            # Calculate if we can make a legendary (need 4 enchanted available)
-            can_make_legendary = enchanted_count >= 4
-            has_legendary = legendary_count > 0
-            
-            results['fragments'][fragment_base] = {
-                'legendary_count': legendary_count,
-                'enchanted_count': enchanted_count,
-                'equipped_legendary': equipped_legendary,
-                'equipped_enchanted': equipped_enchanted,
-                'has_legendary': has_legendary,
-                'can_make_legendary': can_make_legendary,
-                'ready': has_legendary or can_make_legendary
-            }
-            
-            if has_legendary or can_make_legendary:
-                results['total_fragments_ready'] += 1
-            else:
-                missing_info = {
-                    'name': fragment_base,
-                    'legendary_count': legendary_count,
-                    'enchanted_count': enchanted_count,
-                    'equipped_legendary': equipped_legendary,
-                    'equipped_enchanted': equipped_enchanted,
-                    'need_more': 4 - enchanted_count if enchanted_count < 4 else 0
-                }
-                results['missing_fragments'].append(missing_info)
-        
-        # Check other components
-        for component in other_components:
-            count = len(available_items[
-                available_items['Name'].str.contains(component, case=False, na=False, regex=False)
-            ])
-            
-            results['other_components'][component] = {
-                'count': count,
-                'ready': count > 0
-            }
-            
-            if count == 0:
-                results['missing_other'].append(component)
-        
-        # Determine if weapon can be made
-        all_fragments_ready = results['total_fragments_ready'] == len(required_fragments)
-        all_other_ready = len(results['missing_other']) == 0
-        results['can_make_weapon'] = all_fragments_ready and all_other_ready
-        
-        return results
+        items_df, _, _, item_catalog = self._search_state
+        return analyze_zeb_components(items_df, item_catalog, required_fragments, other_components, include_equipped)
     
     def _show_zeb_weapon_results(self, results):
         """Display Zeb weapon component analysis in a popup window and update embedded results."""
@@ -1492,17 +1536,11 @@ Bank: {bank_items:,}"""
         for component in results['other_components'].keys():
             all_components.append(component)
         
-        # Create a regex pattern to match any component
-        search_pattern = "|".join([f"({comp.replace('(', '\\(').replace(')', '\\)')})" for comp in all_components])
-        
-        # Perform search
-        search_results = self.search_items(search_pattern, character=None, exact_match=False, item_type=None)
-        
-        # Display results
-        self.display_results(search_results, "All Zeb Weapon Components")
-        
-        # Switch to main window
-        self.root.lift()
+        # Match any component in one pass over the distinct item names, then switch to the main window
+        def show(search_results):
+            self.display_results(search_results, "All Zeb Weapon Components")
+            self.root.lift()
+        self.run_job("Searching for Zeb weapon components", lambda: self.search_items_any(all_components), show)
     
     def quick_search(self, search_term):
         """Perform a quick search."""
@@ -1514,7 +1552,7 @@ Bank: {bank_items:,}"""
     
     def find_duplicates(self):
         """Find duplicate items across characters."""
-        if self.items_df.empty:
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
@@ -1525,37 +1563,31 @@ Bank: {bank_items:,}"""
         if not min_count:
             return
         
-        item_counts = self.items_df[self.items_df['IsEmpty'] == False].groupby(['Name', 'ID']).agg({
-            'Character': 'count',
-            'Count': 'sum'
-        }).rename(columns={'Character': 'CharacterCount'}).reset_index()
-        
-        duplicates = item_counts[item_counts['CharacterCount'] >= min_count]
-        
+        mode = DUPLICATE_MODE_LABELS[self.duplicate_mode_var.get()]
+        self.run_job("Finding duplicates", lambda: self._find_duplicate_rows(min_count, mode),
+                     lambda results: self._show_duplicates(results, min_count))
+    
+    def _find_duplicate_rows(self, min_count, mode='name_id'):
+        """Rows of every item group appearing at least min_count times (runs on the job worker)."""
+        duplicates = find_duplicate_rows(self.items_df, min_count, mode)
         if duplicates.empty:
+            return pd.DataFrame()
+        return duplicates[['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID']]
+    
+    def _show_duplicates(self, results, min_count):
+        if results.empty:
             messagebox.showinfo("No Duplicates", f"No items found appearing {min_count}+ times")
             return
-        
-        # Get details for duplicate items
-        result_list = []
-        for _, row in duplicates.iterrows():
-            item_details = self.items_df[
-                (self.items_df['Name'] == row['Name']) & 
-                (self.items_df['ID'] == row['ID']) &
-                (self.items_df['IsEmpty'] == False)
-            ][['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID']].copy()
-            result_list.append(item_details)
-            
-        results = pd.concat(result_list, ignore_index=True)
         self.display_results(results, f"Duplicates ({min_count}+ occurrences)")
     
     def show_character_summary(self):
         """Show detailed character summary."""
-        if not hasattr(self, 'last_search_results') or self.last_search_results.empty:
+        if self.last_search_results is None or self.last_search_results.empty:
             messagebox.showinfo("Character Summary", "Please perform a search first to see character details")
             return
         
         char_counts = self.last_search_results['Character'].value_counts()
+        char_counts = char_counts[char_counts > 0]  # Unused categories in compact mode
         
         summary_text = "CHARACTER BREAKDOWN OF CURRENT RESULTS:\n" + "="*50 + "\n\n"
         for char, count in char_counts.items():
@@ -1563,30 +1595,25 @@ Bank: {bank_items:,}"""
         
         messagebox.showinfo("Character Summary", summary_text)
     
-    def display_results(self, results, title):
+    def display_results(self, results, title, live=False):
         """Display search results in the results tab."""
+        self._ensure_tab(self.results_tab)
         self.last_search_results = results
         
-        # Clear existing results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
         # Update count
         self.results_count_var.set(f"{title} - {len(results)} items found")
         
-        # Add results to tree
-        for _, row in results.iterrows():
-            self.results_tree.insert('', 'end', values=(
-                row['Character'],
-                row['Name'],
-                row['Location'],
-                row['ItemType'],
-                row['Count'],
-                row['ID']
-            ))
+        # Hand the whole DataFrame to the virtual view; it renders only the visible window
+        self.results_view.set_data(results)
         
         # Switch to results tab automatically
-        self.notebook.select(1)  # Results tab is index 1
+        if live and self.notebook.index('current') != 1:
+            # Keep typing in the Results tab's entry (it shares the search term)
+            self.notebook.select(1)
+            self.results_search_entry.focus_set()
+            self.results_search_entry.icursor('end')
+        elif not live:
+            self.notebook.select(1)  # Results tab is index 1
     
     def clear_search(self):
         """Clear search fields and results."""
@@ -1595,16 +1622,15 @@ Bank: {bank_items:,}"""
         self.item_type_var.set('All')
         self.exact_match_var.set(False)
         
-        # Clear results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        self.results_count_var.set("No search performed")
-        self.last_search_results = pd.DataFrame()
+        # Clear results (nothing to clear if the Results tab was never opened)
+        if str(self.results_tab) not in self._lazy_tabs:
+            self.results_view.clear()
+            self.results_count_var.set("No search performed")
+        self.last_search_results = None
     
     def export_results(self):
         """Export current search results."""
-        if not hasattr(self, 'last_search_results') or self.last_search_results.empty:
+        if self.last_search_results is None or self.last_search_results.empty:
             messagebox.showwarning("Warning", "No search results to export")
             return
         
@@ -1623,11 +1649,8 @@ Bank: {bank_items:,}"""
     
 
     
-    def create_signet_quest_tab(self):
+    def create_signet_quest_tab(self, quest_frame):
         """Create the Signet of Might quest tracking tab."""
-        quest_frame = ttk.Frame(self.notebook)
-        self.notebook.add(quest_frame, text="🏺 Signet of Might")
-        
         # Initialize quest data
         self.signet_quest = SignetOfMightQuest()
         
@@ -1835,13 +1858,20 @@ Bank: {bank_items:,}"""
     
     def analyze_signet_quest_progress(self):
         """Analyze inventory for Signet of Might quest progress."""
-        if self.items_df.empty:
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
-        # Get progress for all quests
-        progress = self.signet_quest.get_quest_progress_summary(self.items_df)
-        
+        # Get progress for all quests on the worker
+        self.run_job("Analyzing quest progress", self._quest_progress_summary, self._on_signet_quest_progress)
+    
+    def _quest_progress_summary(self):
+        """Progress of every quest for the loaded inventory (runs on the job worker)."""
+        items_df, _, _, item_catalog = self._search_state
+        return self.signet_quest.get_quest_progress_summary(items_df, item_catalog)
+    
+    def _on_signet_quest_progress(self, progress):
+        """Show quest progress computed by analyze_signet_quest_progress."""
         # Update overview
         self.update_quest_overview(progress)
         
@@ -1933,7 +1963,7 @@ Bank: {bank_items:,}"""
     
     def show_all_quest_items(self):
         """Show all quest items in the main search results."""
-        if self.items_df.empty:
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
@@ -1941,18 +1971,13 @@ Bank: {bank_items:,}"""
         all_items = self.signet_quest.get_all_unique_items()
         item_names = list(all_items.keys())
         
-        # Create a regex pattern to match any quest item
-        search_pattern = "|".join([f"({name.replace('(', '\\(').replace(')', '\\)')})" for name in item_names])
-        
-        # Perform search
-        search_results = self.search_items(search_pattern, character=None, exact_match=False, item_type=None)
-        
-        # Display results
-        self.display_results(search_results, "All Signet of Might Quest Items")
+        # Match any quest item in one pass over the distinct item names
+        self.run_job("Searching for quest items", lambda: self.search_items_any(item_names),
+                     lambda search_results: self.display_results(search_results, "All Signet of Might Quest Items"))
     
     def export_quest_report(self):
         """Export a detailed quest progress report."""
-        if self.items_df.empty:
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
@@ -2358,7 +2383,7 @@ Bank: {bank_items:,}"""
     
     def search_recipe_components(self, recipe_name, recipe_data):
         """Search for all components of a recipe in inventory."""
-        if self.items_df.empty:
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
@@ -2367,27 +2392,21 @@ Bank: {bank_items:,}"""
             messagebox.showinfo("No Components", f"No components found for {recipe_name}")
             return
         
-        # Create search pattern for all components
+        # Match any component in one pass over the distinct item names
         component_names = list(components.keys())
-        search_pattern = "|".join([f"({name.replace('(', '\\(').replace(')', '\\)')})" for name in component_names])
-        
-        # Perform search
-        search_results = self.search_items(search_pattern, character=None, exact_match=False, item_type=None)
-        
-        # Display results
-        self.display_results(search_results, f"Components for {recipe_name}")
+        self.run_job(f"Searching for {recipe_name} components", lambda: self.search_items_any(component_names),
+                     lambda search_results: self.display_results(search_results, f"Components for {recipe_name}"))
     
     def search_for_item(self, item_name):
         """Search for a specific item in inventory."""
-        if self.items_df.empty:
+        if not self.has_inventory():
             messagebox.showwarning("Warning", "No inventory data loaded")
             return
         
-        # Perform search
-        search_results = self.search_items(item_name, character=None, exact_match=False, item_type=None)
-        
-        # Display results
-        self.display_results(search_results, f"Search: {item_name}")
+        # Perform search on the worker
+        self.run_job(f"Searching for '{item_name}'",
+                     lambda: self.search_items(item_name, character=None, exact_match=False, item_type=None),
+                     lambda search_results: self.display_results(search_results, f"Search: {item_name}"))
     
     def create_items_to_farm_tab(self):
         """Create the Items to Farm tab showing all dropped items needed for the quest."""
@@ -2487,13 +2506,22 @@ Bank: {bank_items:,}"""
 
     def run(self):
         """Start the GUI application."""
+        self.root.after_idle(self._on_first_idle)
         self.root.mainloop()
+        self.jobs.shutdown()
+        if self.inventory_watcher is not None:
+            self.inventory_watcher.stop()
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description='FDT EQ Emu Inventory Parser')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='Write cProfile and peak memory reports of loads, searches and analyses to DIR')
+    args = parser.parse_args()
+    
     try:
-        app = EQInventoryGUI()
+        app = EQInventoryGUI(profile_dir=args.profile)
         app.run()
     except Exception as e:
         import traceback
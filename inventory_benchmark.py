@@ -0,0 +1,243 @@
+"""
+Inventory Benchmark
+Times the hot paths on synthetic folders of increasing size and writes a JSON report.
+
+For every size a seeded folder is written with inventory_synthetic, then each step is
+timed a few times: a cold load, a warm start from the cache, a reload with nothing
+changed, a reload after one re-export, the cross-file row dedup on its own, the streaming
+search, search_items, duplicate detection, the Zeb weapon analysis and the Signet of Might quest summary. The per-stage
+breakdown of one cold load (see inventory_timing) is stored with each size. Reports from
+two versions (or two machines) can be compared with --baseline.
+
+Usage:
+    python inventory_benchmark.py --sizes 10 100 1000 5000 --output benchmark.json
+    python inventory_benchmark.py --sizes 10 100 --baseline benchmark.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from enhanced_inv_monitor import EQInventoryMonitor
+from inventory_catalog import ItemCatalog
+from inventory_loader import InventoryLoader, drop_duplicate_rows
+from inventory_stream import read_inventory_directory
+from inventory_synthetic import generate_inventory_directory
+from inventory_zeb import analyze_zeb_components
+from signet_of_might_data import SignetOfMightQuest
+
+
+BENCHMARK_SIZES = (10, 100, 1000, 5000)
+REPORT_VERSION = 1
+
+# Searches timed against search_items (plain substring, regex alternation, filtered)
+SEARCH_TERMS = [
+    ('Fragment of Truth', None, None),
+    ('Mana Potion|Bread|Pearl', None, None),
+    ('Ring', None, 'Equipped'),
+]
+
+
+def time_call(func: Callable[[], object], repeat: int = 3) -> Dict:
+    """
+    Time func repeat times with its output suppressed.
+
+    Returns:
+        Dict with 'best' and 'median' seconds and every run in 'runs'
+    """
+    runs = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            runs.append(time.perf_counter() - start)
+    return {'best': min(runs), 'median': statistics.median(runs), 'runs': runs}
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark_directory(directory: str, repeat: int = 3) -> Dict:
+    """Time every hot path on one inventory folder."""
+    timings = {}
+
+    def cold_load():
+        return InventoryLoader(directory).load()
+    timings['load_cold'] = time_call(cold_load, repeat)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        InventoryLoader(directory, cache=True).load()
+    timings['load_from_cache'] = time_call(lambda: InventoryLoader(directory, cache=True).load(), repeat)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader = InventoryLoader(directory)
+        items_df = loader.load()
+    cold_stages = loader.last_reload['timings'].as_dict()  # Where a cold load spends its time
+    timings['reload_unchanged'] = time_call(loader.load, repeat)
+
+    # The merge's dedup over every file's character rows, before any were dropped
+    character_rows = pd.concat([parsed['character_items'] for parsed in loader.parsed_files.values()],
+                               ignore_index=True)
+    timings['dedup'] = time_call(lambda: drop_duplicate_rows(character_rows), repeat)
+    timings['dedup_newest'] = time_call(lambda: drop_duplicate_rows(character_rows, keep='newest'), repeat)
+
+    reexported = sorted(loader.fingerprints)[0]
+    with open(reexported, encoding='utf-8') as f:
+        original = f.read()
+    exports = iter(range(repeat))
+
+    def reload_one_file():
+        with open(reexported, 'a', encoding='utf-8', newline='') as f:
+            f.write(f"General10-Slot99\tBenchmark Token\t1\t{next(exports) + 1}\t0\n")
+        loader.load()
+    try:
+        timings['reload_one_file'] = time_call(reload_one_file, repeat)
+    finally:
+        with open(reexported, 'w', encoding='utf-8', newline='') as f:
+            f.write(original)
+
+    def stream_search():
+        return read_inventory_directory(directory).matching_positions('Fragment of Truth')
+    timings['stream_search'] = time_call(stream_search, repeat)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        monitor = EQInventoryMonitor(directory)
+
+    def search_items():
+        monitor.search_cache.invalidate()  # Time the searches, not cache hits
+        for search_term, character, item_type in SEARCH_TERMS:
+            monitor.search_items(search_term, character, item_type=item_type)
+    timings['search_items'] = time_call(search_items, repeat)
+    timings['find_duplicates'] = time_call(monitor.find_duplicates, repeat)
+
+    item_catalog = ItemCatalog(items_df)  # Built at load time in the app
+    timings['analyze_zeb_components'] = time_call(lambda: analyze_zeb_components(items_df, item_catalog), repeat)
+
+    # A new quest object per run, so its per-inventory item totals are not reused
+    timings['quest_progress_summary'] = time_call(
+        lambda: SignetOfMightQuest().get_quest_progress_summary(items_df, item_catalog), repeat)
+
+    return {
+        'files': len(loader.fingerprints),
+        'rows': len(items_df),
+        'memory_mb': round(items_df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
+        'timings': timings,
+        'load_stages': cold_stages,
+    }
+
+
+def run_benchmarks(sizes: List[int], seed: int = 0, repeat: int = 3, work_dir: Optional[str] = None) -> Dict:
+    """
+    Generate a folder per size and benchmark it.
+
+    Args:
+        sizes: Character counts
+        seed: Seed for the synthetic folders
+        repeat: Runs per timing
+        work_dir: Keep the generated folders here (a temporary directory otherwise)
+    """
+    report = {
+        'report_version': REPORT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'repeat': repeat,
+        'results': [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix='inventory-benchmark-') as temp_dir:
+        for characters in sizes:
+            directory = os.path.join(work_dir or temp_dir, f"{characters}-characters")
+            if os.path.isdir(directory) and os.listdir(directory):
+                raise ValueError(f"{directory} is not empty")
+
+            print(f"Benchmarking {characters:,} characters...")
+            start = time.perf_counter()
+            generate_inventory_directory(directory, characters, seed)
+            generate_seconds = time.perf_counter() - start
+
+            result = {'characters': characters, 'generate_seconds': generate_seconds}
+            result.update(benchmark_directory(directory, repeat))
+            report['results'].append(result)
+            print(format_result(result))
+    return report
+
+
+def format_result(result: Dict) -> str:
+    lines = [f"  {result['characters']:,} characters: {result['rows']:,} rows, {result['memory_mb']} MB"]
+    for name, timing in result['timings'].items():
+        lines.append(f"    {name:<24} {timing['best'] * 1000:10.1f} ms")
+    return '\n'.join(lines)
+
+
+def compare_reports(report: Dict, baseline: Dict) -> str:
+    """Best times of report next to those of baseline, for every size and step both contain."""
+    baseline_results = {result['characters']: result for result in baseline['results']}
+    lines = [f"{'characters':>10}  {'step':<24} {'baseline ms':>12} {'current ms':>12} {'speedup':>8}"]
+    for result in report['results']:
+        previous = baseline_results.get(result['characters'])
+        if previous is None:
+            continue
+        for name, timing in result['timings'].items():
+            if name not in previous['timings']:
+                continue
+            before, after = previous['timings'][name]['best'], timing['best']
+            speedup = f"{before / after:7.2f}x" if after > 0 else '      -'
+            lines.append(f"{result['characters']:>10,}  {name:<24} {before * 1000:12.1f} {after * 1000:12.1f} {speedup}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the inventory hot paths on synthetic folders')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(BENCHMARK_SIZES),
+                        help=f"Character counts (default: {' '.join(map(str, BENCHMARK_SIZES))})")
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic folders (default: 0)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per timing; the best is reported (default: 3)')
+    parser.add_argument('-o', '--output', default='benchmark_report.json', help='JSON report path')
+    parser.add_argument('--baseline', help='Earlier JSON report to compare against')
+    parser.add_argument('--work-dir', help='Keep the generated folders in this directory')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    try:
+        report = run_benchmarks(args.sizes, args.seed, args.repeat, args.work_dir)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"✓ Report written to {args.output}")
+
+    if baseline is not None:
+        print(compare_reports(report, baseline))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
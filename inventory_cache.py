@@ -0,0 +1,159 @@
+"""
+Inventory Cache
+Persists the fully derived items DataFrame next to the inventory files so a warm start skips parsing.
+
+The cache is a metadata file plus one data file inside the inventory directory:
+    .fdt_inventory_cache.json      - version, file fingerprints and per-file metadata
+    .fdt_inventory_cache.feather   - items DataFrame (when pyarrow is installed)
+    .fdt_inventory_cache.npz       - items DataFrame as NumPy columns (fallback)
+"""
+
+import os
+import json
+from datetime import datetime
+from typing import Optional, Dict
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401 - only needed for Feather support
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+# Bump whenever the derived columns, their meaning or the shared bank signature change so old caches are ignored
+CACHE_VERSION = 6
+CACHE_BASENAME = '.fdt_inventory_cache'
+
+
+def _cache_paths(directory: str) -> Dict[str, str]:
+    base = os.path.join(directory, CACHE_BASENAME)
+    return {
+        'meta': base + '.json',
+        'feather': base + '.feather',
+        'npz': base + '.npz'
+    }
+
+
+def _write_npz(items_df: pd.DataFrame, path: str):
+    """Write a DataFrame as one NumPy array per column, without pickling objects."""
+    arrays = {}
+    for i, col in enumerate(items_df.columns):
+        series = items_df[col]
+        key = f"c{i}"
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series) or \
+                pd.api.types.is_datetime64_any_dtype(series):
+            arrays[key] = series.to_numpy()
+        else:
+            # Strings are stored as fixed-width unicode with a separate null mask
+            is_null = series.isna().to_numpy()
+            arrays[key] = np.array(series.astype(object).where(~is_null, '').tolist(), dtype=str)
+            arrays[key + '_null'] = is_null
+    arrays['columns'] = np.array(list(items_df.columns), dtype=str)
+
+    with open(path, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def _read_npz(path: str) -> pd.DataFrame:
+    with np.load(path, allow_pickle=False) as data:
+        columns = data['columns'].tolist()
+        frame = {}
+        for i, col in enumerate(columns):
+            key = f"c{i}"
+            values = data[key]
+            if values.dtype.kind == 'U':
+                values = values.astype(object)
+                values[data[key + '_null']] = None
+            frame[col] = values
+    return pd.DataFrame(frame, columns=columns)
+
+
+def save_inventory_cache(directory: str, items_df: pd.DataFrame, fingerprints: Dict, file_info: Dict,
+                         shared_bank_mode: str):
+    """
+    Write the derived items DataFrame and the fingerprints it was built from.
+
+    Args:
+        directory: Inventory directory the cache belongs to
+        items_df: Fully derived and deduplicated items DataFrame
+        fingerprints: Mapping of file path to FileFingerprint
+        file_info: Mapping of file path to per-file metadata (character, shared bank signature)
+        shared_bank_mode: Shared bank dedup mode the DataFrame was built with
+    """
+    paths = _cache_paths(directory)
+    data_format = 'feather' if HAS_PYARROW else 'npz'
+    data_path = paths[data_format]
+    tmp_data_path = data_path + '.tmp'
+
+    data_df = items_df.reset_index(drop=True)
+    if data_format == 'feather':
+        data_df.to_feather(tmp_data_path)
+    else:
+        _write_npz(data_df, tmp_data_path)
+    os.replace(tmp_data_path, data_path)
+
+    files = []
+    for file_path, fingerprint in fingerprints.items():
+        info = file_info.get(file_path)
+        if info is None:
+            continue
+        files.append({
+            'name': os.path.basename(file_path),
+            'mtime': fingerprint.mtime,
+            'size': fingerprint.size,
+            'content_hash': fingerprint.content_hash,
+            'char_name': info['char_name'],
+            'updated_at': info['updated_at'].isoformat(),
+            'shared_bank_signature': info['shared_bank_signature']
+        })
+
+    meta = {
+        'version': CACHE_VERSION,
+        'format': data_format,
+        'data_size': os.path.getsize(data_path),
+        'shared_bank_mode': shared_bank_mode,
+        'files': files
+    }
+
+    # The metadata file is written last so a partially written cache is never trusted
+    tmp_meta_path = paths['meta'] + '.tmp'
+    with open(tmp_meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(tmp_meta_path, paths['meta'])
+
+
+def load_inventory_cache(directory: str, shared_bank_mode: str) -> Optional[Dict]:
+    """
+    Read a previously written cache.
+
+    Returns:
+        Dict with 'items_df', 'files' (per-file metadata including fingerprints), or
+        None if there is no usable cache for this directory and shared bank mode
+    """
+    paths = _cache_paths(directory)
+    if not os.path.exists(paths['meta']):
+        return None
+
+    with open(paths['meta'], 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+
+    if meta.get('version') != CACHE_VERSION or meta.get('shared_bank_mode') != shared_bank_mode:
+        return None
+
+    data_format = meta.get('format')
+    if data_format == 'feather' and not HAS_PYARROW:
+        return None
+    data_path = paths.get(data_format)
+    if data_path is None or not os.path.exists(data_path) or os.path.getsize(data_path) != meta.get('data_size'):
+        return None
+
+    items_df = pd.read_feather(data_path) if data_format == 'feather' else _read_npz(data_path)
+
+    files = []
+    for entry in meta['files']:
+        files.append(dict(entry, updated_at=datetime.fromisoformat(entry['updated_at'])))
+
+    return {'items_df': items_df, 'files': files}
@@ -0,0 +1,160 @@
+"""
+Inventory Catalog
+Item ID catalog built once per load, so requirement checks count integers instead of names.
+
+Every non-empty row carries an integer ID. The catalog keeps the distinct IDs (sorted),
+a canonical name per ID and every name seen for it. Requirement names (Zeb fragments,
+quest items) are resolved once to the set of IDs whose names match them, the same way
+str.contains(case=False) matches a name. Counting is then a single bincount over the ID
+column, whose per-ID totals are summed for each requirement.
+
+In real exports an ID always carries the same name. If one shows up under several names,
+the ID matches a requirement when any of its names does, and all of its rows count.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from inventory_search import get_pattern_matcher, is_literal_term
+
+
+class ItemCatalog:
+    """Distinct item IDs of one items DataFrame, with their names."""
+
+    def __init__(self, items_df: pd.DataFrame):
+        """
+        Args:
+            items_df: Items DataFrame with 'ID', 'Name' and 'IsEmpty' columns
+        """
+        rows = items_df.loc[items_df['IsEmpty'] == False, ['ID', 'Name']]
+        rows = rows.assign(ID=pd.to_numeric(rows['ID'], errors='coerce')).dropna()  # Uploaded files keep IDs as text
+        pair_rows = rows.groupby([rows['ID'].astype('int64'), rows['Name'].astype(str)], sort=True).size()
+
+        # Every distinct (ID, name) pair, sorted by ID
+        self._pair_ids = pair_rows.index.get_level_values(0).to_numpy(dtype='int64')
+        self._pair_names: List[str] = list(pair_rows.index.get_level_values(1))
+
+        self.ids = np.unique(self._pair_ids)
+
+        # Canonical name: the name held in the most rows (first alphabetically on ties)
+        canonical = pd.Series(pair_rows.to_numpy(), index=np.arange(len(pair_rows)))
+        canonical = canonical.groupby(self._pair_ids, sort=True).idxmax()
+        self.names: List[str] = [self._pair_names[pair] for pair in canonical.to_numpy()]
+
+        self._name_by_id = dict(zip(self.ids.tolist(), self.names))
+        self._ids_by_name: Dict[str, List[int]] = {}
+        for item_id, name in zip(self._pair_ids.tolist(), self._pair_names):
+            self._ids_by_name.setdefault(name.lower(), []).append(item_id)
+        self._resolved: Dict[Tuple[str, bool], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def name(self, item_id: int) -> Optional[str]:
+        """Canonical name of item_id, or None if it is not in the catalog."""
+        return self._name_by_id.get(int(item_id))
+
+    def ids_for_name(self, name: str) -> np.ndarray:
+        """IDs of items named exactly name (case-insensitive)."""
+        return np.unique(np.array(self._ids_by_name.get(name.lower(), []), dtype='int64'))
+
+    def resolve(self, requirement: str, regex: bool = True) -> np.ndarray:
+        """
+        IDs of items whose name contains requirement (case-insensitive).
+
+        Args:
+            requirement: Item name or name fragment
+            regex: Treat requirement as a regular expression, as str.contains does
+
+        Returns:
+            Sorted array of matching IDs
+        """
+        key = (requirement, regex and not is_literal_term(requirement))
+        if key not in self._resolved:
+            if key[1]:
+                pattern = re.compile(requirement, re.IGNORECASE)
+                matched = [item_id for item_id, name in zip(self._pair_ids, self._pair_names) if pattern.search(name)]
+            else:
+                needle = requirement.lower()
+                matched = [item_id for item_id, name in zip(self._pair_ids, self._pair_names) if needle in name.lower()]
+            self._resolved[key] = np.unique(np.array(matched, dtype='int64'))
+        return self._resolved[key]
+
+    def requirement_table(self, requirements: List[str], regex: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Resolve many requirement names at once.
+
+        Literal names are found with one multi-pattern pass over the catalog's names.
+
+        Returns:
+            Dict of requirement -> sorted array of matching IDs, in the order given
+        """
+        requirements = list(dict.fromkeys(requirements))
+        literal = [requirement for requirement in requirements
+                   if (not regex or is_literal_term(requirement)) and (requirement, False) not in self._resolved]
+        if literal:
+            matcher = get_pattern_matcher(tuple(literal))
+            matched: List[List[int]] = [[] for _ in literal]
+            for item_id, name in zip(self._pair_ids.tolist(), self._pair_names):
+                for pattern_id in matcher.find(name):
+                    matched[pattern_id].append(item_id)
+            for requirement, item_ids in zip(literal, matched):
+                self._resolved[(requirement, False)] = np.unique(np.array(item_ids, dtype='int64'))
+        return {requirement: self.resolve(requirement, regex) for requirement in requirements}
+
+    def id_totals(self, items_df: pd.DataFrame, weights: Optional[pd.Series] = None,
+                  groups: Optional[pd.Series] = None) -> Tuple[np.ndarray, list]:
+        """
+        Rows (or summed weights) of items_df per catalog ID, optionally split by a group column.
+
+        Rows whose ID is not in the catalog are ignored.
+
+        Args:
+            items_df: Rows to count, usually the non-empty rows of the catalog's DataFrame
+            weights: Optional column aligned with items_df to sum instead of counting rows
+            groups: Optional column aligned with items_df (e.g. an equipped flag) to split by
+
+        Returns:
+            (totals, group values): totals has one row per catalog ID (aligned with ids)
+            and one column per group value
+        """
+        row_ids = pd.to_numeric(items_df['ID'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        known = ~np.isnan(row_ids)
+        positions = np.searchsorted(self.ids, row_ids[known].astype('int64'))
+        in_catalog = positions < len(self.ids)
+        in_catalog[in_catalog] = self.ids[positions[in_catalog]] == row_ids[known][in_catalog]
+        known[known] = in_catalog
+        positions = positions[in_catalog]
+
+        if groups is None:
+            group_codes, group_values = np.zeros(int(known.sum()), dtype='int64'), ['Count']
+        else:
+            codes, uniques = pd.factorize(groups, sort=True)
+            group_codes, group_values = codes[known], list(uniques)
+        n_groups = len(group_values)
+
+        row_weights = None if weights is None else weights.to_numpy(dtype='float64')[known]
+        totals = np.bincount(positions * n_groups + group_codes, weights=row_weights,
+                             minlength=len(self.ids) * n_groups)
+        return totals.reshape(len(self.ids), n_groups), group_values
+
+    def sum_ids(self, totals: np.ndarray, item_ids: np.ndarray) -> np.ndarray:
+        """Add up the id_totals rows of item_ids (one value per group column)."""
+        return totals[np.searchsorted(self.ids, item_ids)].sum(axis=0)
+
+    def count(self, items_df: pd.DataFrame, table: Dict[str, np.ndarray], weights: Optional[pd.Series] = None,
+              groups: Optional[pd.Series] = None) -> pd.DataFrame:
+        """
+        Count the rows of items_df matching each requirement of a requirement_table.
+
+        Returns:
+            DataFrame indexed by requirement with one count column per group value
+            (a single 'Count' column when groups is None), like count_pattern_hits
+        """
+        totals, group_values = self.id_totals(items_df, weights, groups)
+        counts = np.array([self.sum_ids(totals, item_ids) for item_ids in table.values()]).reshape(
+            len(table), totals.shape[1])
+        return pd.DataFrame(np.rint(counts).astype('int64'), index=list(table), columns=group_values)
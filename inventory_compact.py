@@ -0,0 +1,140 @@
+"""
+Inventory Compact Mode
+Stores the repetitive items DataFrame columns as categoricals and narrow numbers to cut memory.
+
+Categories are kept in a CategoryRegistry that outlives a single load, so frames built on
+different reloads share one dtype per column and concatenate without falling back to objects.
+"""
+
+from typing import Optional, Dict
+
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+
+# Columns whose values repeat across many rows
+CATEGORY_COLUMNS = ['Character', 'Location', 'Name', 'ItemType', 'FileName', 'SlotPath']
+BOOL_COLUMNS = ['IsEmpty', 'IsEquipped']
+INTEGER_COLUMNS = ['Count', 'ID', 'Slots']
+
+
+class CategoryRegistry:
+    """
+    Append-only category sets, one per column.
+
+    Categories are kept sorted so sorting a categorical column gives the same order
+    as sorting the original strings.
+    """
+
+    def __init__(self):
+        self.dtypes: Dict[str, CategoricalDtype] = {}
+
+    def dtype_for(self, column: str, values: pd.Series) -> CategoricalDtype:
+        """Return the shared dtype for column, growing it if values contain new categories."""
+        if isinstance(values.dtype, CategoricalDtype):
+            observed = values.cat.categories
+        else:
+            observed = pd.Index(values.dropna().unique())
+
+        current = self.dtypes.get(column)
+        if current is None:
+            self.dtypes[column] = CategoricalDtype(observed.sort_values())
+        else:
+            new_values = observed.difference(current.categories)
+            if len(new_values):
+                self.dtypes[column] = CategoricalDtype(current.categories.union(new_values))
+
+        return self.dtypes[column]
+
+
+def compact_items_df(items_df: pd.DataFrame, registry: Optional[CategoryRegistry] = None) -> pd.DataFrame:
+    """
+    Return items_df with categorical string columns, bool flags and narrow integers.
+
+    Args:
+        items_df: Items DataFrame (already compact or not)
+        registry: Categories shared across loads; a fresh registry is used if None
+
+    Returns:
+        Compacted copy of items_df
+    """
+    if items_df.empty:
+        return items_df
+
+    if registry is None:
+        registry = CategoryRegistry()
+
+    compact_df = items_df.copy()
+    for col in CATEGORY_COLUMNS:
+        if col in compact_df.columns:
+            dtype = registry.dtype_for(col, compact_df[col])
+            if compact_df[col].dtype != dtype:
+                compact_df[col] = compact_df[col].astype(dtype)
+
+    for col in BOOL_COLUMNS:
+        if col in compact_df.columns and compact_df[col].dtype != bool:
+            compact_df[col] = compact_df[col].astype(bool)
+
+    for col in INTEGER_COLUMNS:
+        # Columns with missing values stay float - there is no narrow integer for NaN
+        if col in compact_df.columns and pd.api.types.is_integer_dtype(compact_df[col]):
+            compact_df[col] = pd.to_numeric(compact_df[col], downcast='integer')
+
+    return compact_df
+
+
+def expand_items_df(items_df: pd.DataFrame) -> pd.DataFrame:
+    """Return items_df with categorical columns turned back into strings and integers widened to int64."""
+    categorical = [col for col in items_df.columns if isinstance(items_df[col].dtype, CategoricalDtype)]
+    narrow = [col for col in INTEGER_COLUMNS if col in items_df.columns and
+              pd.api.types.is_integer_dtype(items_df[col]) and items_df[col].dtype != 'int64']
+    if not categorical and not narrow:
+        return items_df
+
+    expanded_df = items_df.copy()
+    for col in categorical:
+        expanded_df[col] = expanded_df[col].astype(object)
+    for col in narrow:
+        expanded_df[col] = expanded_df[col].astype('int64')
+    return expanded_df
+
+
+def memory_report(items_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare the memory used by each column in the plain and the compact representation.
+
+    Returns:
+        DataFrame with Column, PlainDtype, PlainBytes, CompactDtype and CompactBytes,
+        plus a final 'Total' row
+    """
+    plain_df = expand_items_df(items_df)
+    compact_df = compact_items_df(plain_df)
+
+    plain_usage = plain_df.memory_usage(deep=True, index=False)
+    compact_usage = compact_df.memory_usage(deep=True, index=False)
+
+    report = pd.DataFrame({
+        'Column': list(plain_df.columns),
+        'PlainDtype': [str(plain_df[col].dtype) for col in plain_df.columns],
+        'PlainBytes': [int(plain_usage[col]) for col in plain_df.columns],
+        'CompactDtype': [str(compact_df[col].dtype) for col in plain_df.columns],
+        'CompactBytes': [int(compact_usage[col]) for col in plain_df.columns]
+    })
+    total = pd.DataFrame([{
+        'Column': 'Total',
+        'PlainDtype': '',
+        'PlainBytes': int(report['PlainBytes'].sum()),
+        'CompactDtype': '',
+        'CompactBytes': int(report['CompactBytes'].sum())
+    }])
+    return pd.concat([report, total], ignore_index=True)
+
+
+def format_memory_report(report: pd.DataFrame) -> str:
+    """Render a memory_report() table with sizes in KiB and the saving per column."""
+    lines = [f"{'Column':<14} {'Plain':>12} {'Compact':>12}  Saving"]
+    for _, row in report.iterrows():
+        saving = 1 - row['CompactBytes'] / row['PlainBytes'] if row['PlainBytes'] else 0.0
+        lines.append(f"{row['Column']:<14} {row['PlainBytes'] / 1024:>10.1f}Ki {row['CompactBytes'] / 1024:>10.1f}Ki"
+                     f"  {saving:>6.1%}")
+    return "\n".join(lines)
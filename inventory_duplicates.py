@@ -0,0 +1,52 @@
+"""
+Inventory Duplicates
+Finds items stored more than once across the loaded inventory.
+
+Group sizes are broadcast back onto the rows with groupby().transform, so the detail rows
+of every duplicate group come out of a single pass instead of one filter per group.
+"""
+
+from typing import Dict, List
+
+import pandas as pd
+
+
+# Grouping used by each duplicate mode
+DUPLICATE_KEYS: Dict[str, List[str]] = {
+    'name_id': ['Name', 'ID'],          # Same item: name and ID both match
+    'id': ['ID'],                       # Same ID, whatever the name
+    'name': ['Name'],                   # Same name, whatever the ID
+    'cross_character': ['Name', 'ID'],  # Same item held by different characters
+}
+
+
+def find_duplicate_rows(items_df: pd.DataFrame, min_count: int = 2, mode: str = 'name_id') -> pd.DataFrame:
+    """
+    Non-empty rows of every item group that occurs at least min_count times.
+
+    Args:
+        items_df: Items DataFrame
+        min_count: Minimum occurrences for a group to count as duplicated
+        mode: 'name_id', 'id', 'name', or 'cross_character'. The first three count rows;
+              'cross_character' counts distinct characters, so stacks kept by a single
+              character are never reported.
+
+    Returns:
+        Matching rows with a TotalFound column (the group's count), ordered by group
+        key and then by original row order
+    """
+    if mode not in DUPLICATE_KEYS:
+        raise ValueError(f"Unknown duplicate mode: {mode}")
+    keys = DUPLICATE_KEYS[mode]
+
+    df = items_df[items_df['IsEmpty'] == False].dropna(subset=keys)
+    if df.empty:
+        return df.assign(TotalFound=pd.Series(dtype='int64'))
+
+    grouped = df.groupby(keys, observed=True, sort=False)['Character']
+    totals = grouped.transform('nunique') if mode == 'cross_character' else grouped.transform('size')
+
+    duplicated = totals >= min_count
+    result = df[duplicated].copy()
+    result['TotalFound'] = totals[duplicated].astype('int64')
+    return result.sort_values(keys, kind='stable').reset_index(drop=True)
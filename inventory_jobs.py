@@ -0,0 +1,106 @@
+"""
+Inventory Jobs
+Runs GUI searches and analyses on a background worker, keeping only the newest result.
+
+Every submitted job gets a generation number. A result is only delivered if its
+generation is still the latest when it finishes, so a slow query that was replaced or
+cancelled can never overwrite newer results. Delivery goes through a caller-supplied
+post function (root.after in the GUI) so callbacks always run on the UI thread.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Optional
+
+
+class JobScheduler:
+    """Single-worker job queue with generation-based cancellation."""
+
+    def __init__(self, post: Callable[[Callable[[], None]], Any],
+                 on_busy_changed: Optional[Callable[[bool, str], None]] = None):
+        """
+        Args:
+            post: Schedules a callable on the UI thread (e.g. lambda fn: root.after(0, fn))
+            on_busy_changed: Called on the UI thread with (busy, label) when a job starts or ends
+        """
+        self.post = post
+        self.on_busy_changed = on_busy_changed
+        self.generation = 0
+        self.current_label = ''
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='inventory-job')
+        self._pending: Optional[Future] = None
+
+    def submit(self, label: str, func: Callable[[], Any], on_done: Callable[[Any], None],
+               on_error: Optional[Callable[[Exception], None]] = None) -> int:
+        """
+        Run func on the worker and pass its result to on_done on the UI thread.
+
+        A job that has not started yet is dropped when a newer one is submitted; a job
+        that is already running finishes, but its result is discarded.
+
+        Returns:
+            Generation number of the submitted job
+        """
+        if on_error is None:
+            on_error = lambda e: print(f"Error in {label}: {e}")
+
+        with self._lock:
+            self.generation += 1
+            generation = self.generation
+            self.current_label = label
+            if self._pending is not None:
+                self._pending.cancel()
+            self._pending = self._executor.submit(self._run, generation, func, on_done, on_error)
+
+        self._notify(True, label)
+        return generation
+
+    def cancel(self) -> bool:
+        """Drop the result of the current job. Returns False if nothing was running."""
+        with self._lock:
+            if self._pending is None or self._pending.done():
+                return False
+            self.generation += 1
+            self._pending.cancel()
+            self._pending = None
+            label = self.current_label
+
+        self._notify(False, label)
+        return True
+
+    def is_current(self, generation: int) -> bool:
+        """True if generation belongs to the newest submitted, uncancelled job."""
+        return generation == self.generation
+
+    def shutdown(self):
+        """Drop any pending result and stop accepting jobs."""
+        with self._lock:
+            self.generation += 1
+        self._executor.shutdown(wait=False)
+
+    def _run(self, generation: int, func, on_done, on_error):
+        if not self.is_current(generation):
+            return
+        try:
+            result = func()
+        except Exception as e:
+            self.post(lambda error=e: self._deliver(generation, on_error, error))
+            return
+        self.post(lambda: self._deliver(generation, on_done, result))
+
+    def _deliver(self, generation: int, callback, value):
+        """Runs on the UI thread: hand over the value unless a newer job replaced this one."""
+        if not self.is_current(generation):
+            return
+
+        with self._lock:
+            self._pending = None
+        self._notify(False, self.current_label)
+
+        callback(value)
+
+    def _notify(self, busy: bool, label: str):
+        if self.on_busy_changed is not None:
+            self.on_busy_changed(busy, label)
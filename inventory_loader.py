@@ -0,0 +1,781 @@
+"""
+Inventory Loader
+Parses *-Inventory.txt files into the consolidated items DataFrame used by the desktop GUI and CLI monitor.
+"""
+
+import bisect
+import os
+import re
+import hashlib
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, List, Dict, NamedTuple, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from inventory_cache import load_inventory_cache, save_inventory_cache
+from inventory_compact import CategoryRegistry, compact_items_df, expand_items_df
+from inventory_locations import categorize_locations, worn_locations, decompose_locations
+from inventory_stream import INVENTORY_FILE_PATTERN, SHARED_BANK_CHARACTER, find_inventory_files
+from inventory_timing import StageTimings, report_load_timings
+
+
+# Loader modes: 'auto' picks the process pool once there are enough files to pay for worker startup
+LOAD_MODES = ('auto', 'serial', 'process', 'thread')
+PARALLEL_MIN_FILES = 16
+
+# Shared bank columns that identify its contents
+SIGNATURE_COLUMNS = ['Location', 'Name', 'ID', 'Count']
+
+# Natural key of an item row; the derived columns all follow from Location and Name
+NATURAL_KEY_COLUMNS = ['Character', 'Location', 'Name', 'ID', 'Count', 'Slots']
+
+# Which of several identical rows survives deduplication
+DUPLICATE_KEEP_MODES = ('first', 'newest')
+
+class FileFingerprint(NamedTuple):
+    """Identity of an inventory file at the time it was parsed."""
+    path: str
+    mtime: float
+    size: int
+    content_hash: str
+
+
+def fingerprint_file(file_path: str, previous: Optional[FileFingerprint] = None) -> FileFingerprint:
+    """
+    Fingerprint an inventory file.
+
+    The content hash is only recomputed when mtime or size differ from the previous
+    fingerprint, so unchanged files cost a single stat call.
+    """
+    stat = os.stat(file_path)
+    if previous is not None and previous.mtime == stat.st_mtime and previous.size == stat.st_size:
+        return previous
+
+    with open(file_path, 'rb') as f:
+        content_hash = hashlib.md5(f.read()).hexdigest()
+    return FileFingerprint(file_path, stat.st_mtime, stat.st_size, content_hash)
+
+
+def create_shared_bank_signature(shared_bank_df: pd.DataFrame) -> str:
+    """Create a unique signature for shared bank contents to detect duplicates."""
+    # One tab-separated line per non-empty item (empty slots can vary), sorted so row order doesn't matter.
+    # A bank is a few dozen rows, where plain Python beats any DataFrame operation.
+    columns = [shared_bank_df[col].tolist() for col in SIGNATURE_COLUMNS]
+    name_position = SIGNATURE_COLUMNS.index('Name')
+    lines = sorted('\t'.join(map(str, row)) for row in zip(*columns) if row[name_position] != 'Empty')
+
+    if not lines:
+        # If shared bank is completely empty, create signature based on structure
+        return f"empty_bank_{len(shared_bank_df)}_slots"
+
+    return hashlib.md5('\n'.join(lines).encode()).hexdigest()
+
+
+def parse_inventory_file(file_path: str, known_shared_banks: Optional[Set[str]] = None) -> Optional[Dict]:
+    """
+    Parse a single inventory file and split off its shared bank.
+
+    This is a module-level function so it can run inside a process pool worker.
+
+    Args:
+        file_path: Path to a *-Inventory.txt file
+        known_shared_banks: Signatures of shared banks already loaded from other files.
+                            A shared bank with one of these signatures is dropped right
+                            after it is hashed, before any derived columns are built.
+
+    Returns:
+        Dict with the character items, the shared bank items and their signature,
+        or None if the character name cannot be parsed from the file name.
+        'shared_bank_skipped' is True when the shared bank rows were dropped as known,
+        and 'timings' holds the StageTimings of this file's read_csv, signature and
+        derive stages.
+    """
+    file_name = os.path.basename(file_path)
+    modified_epoch = os.path.getmtime(file_path)
+    modified_ts = datetime.fromtimestamp(modified_epoch)
+
+    # Extract character name
+    match = re.match(r"(.+?)-", file_name)
+    if not match:
+        return None
+
+    char_name = match.group(1)
+    timings = StageTimings()
+
+    # Read file
+    with timings.stage('read_csv'):
+        df = pd.read_csv(file_path, sep='\t')
+    timings.count('read_csv', len(df))
+
+    # Separate shared bank items for duplicate detection; the signature only needs the raw columns
+    is_shared_bank = df['Location'].str.startswith('SharedBank', na=False)
+    shared_bank_signature = None
+    shared_bank_skipped = False
+    if is_shared_bank.any():
+        with timings.stage('signature'):
+            shared_bank_signature = create_shared_bank_signature(df[is_shared_bank])
+        if known_shared_banks is not None and shared_bank_signature in known_shared_banks:
+            df = df[~is_shared_bank]
+            is_shared_bank = is_shared_bank[~is_shared_bank]
+            shared_bank_skipped = True
+
+    derive_start = time.perf_counter()
+    df.insert(0, 'Character', char_name)
+    df['UpdatedAt'] = modified_ts
+    df['FileName'] = file_name
+
+    shared_bank_items = df[is_shared_bank].copy()
+    character_items = df[~is_shared_bank].copy()
+    if not shared_bank_items.empty:
+        shared_bank_items['Character'] = SHARED_BANK_CHARACTER
+    timings.add('derive', time.perf_counter() - derive_start)
+
+    return {
+        'file_path': file_path,
+        'file_name': file_name,
+        'char_name': char_name,
+        'updated_at': modified_ts,
+        'character_items': character_items,
+        'shared_bank_items': shared_bank_items,
+        'shared_bank_signature': shared_bank_signature,
+        'shared_bank_skipped': shared_bank_skipped,
+        'timings': timings
+    }
+
+
+def drop_duplicate_rows(df: pd.DataFrame, keep: str = 'first') -> Tuple[pd.DataFrame, int]:
+    """
+    Drop rows whose natural key was already seen, keeping the remaining rows in their order.
+
+    The key is NATURAL_KEY_COLUMNS, leaving out any column missing from an export.
+
+    Args:
+        df: Items from one or more parsed files
+        keep: 'first' keeps the first row in merge order, 'newest' the row with the
+              latest UpdatedAt. Ties go to the first FileName, which is the merge order
+              of a directory load, so the kept row does not depend on how df was assembled
+
+    Returns:
+        The deduplicated DataFrame and the number of rows dropped
+    """
+    if keep not in DUPLICATE_KEEP_MODES:
+        raise ValueError(f"Unknown duplicate keep mode: {keep} (expected one of {', '.join(DUPLICATE_KEEP_MODES)})")
+    if df.empty:
+        return df, 0
+
+    keys = df[[col for col in NATURAL_KEY_COLUMNS if col in df.columns]]
+    if keep == 'newest':
+        file_order = pd.factorize(df['FileName'], sort=True)[0]
+        newest_first = np.lexsort((file_order, -df['UpdatedAt'].to_numpy().astype('int64')))
+        duplicated = np.empty(len(df), dtype=bool)
+        duplicated[newest_first] = keys.iloc[newest_first].duplicated().to_numpy()
+    else:
+        duplicated = keys.duplicated().to_numpy()
+
+    removed = int(duplicated.sum())
+    return (df[~duplicated] if removed else df), removed
+
+
+def _concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the non-empty frames, returning an empty DataFrame if there are none."""
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, axis=0, ignore_index=True)
+
+
+def _insert_in_file_order(items_df: pd.DataFrame, inserted: pd.DataFrame, file_names: List[str]) -> pd.DataFrame:
+    """
+    Insert rows into items_df where a full load would have merged them.
+
+    Args:
+        items_df: Rows grouped by file, in file_names order
+        inserted: Rows of other files, also grouped by file in file_names order
+        file_names: FileName of every loaded file, in merge order
+
+    Returns:
+        The rows of both frames grouped by file in file_names order
+    """
+    if items_df.empty or inserted.empty:
+        return _concat_frames([items_df, inserted])
+
+    position = {file_name: i for i, file_name in enumerate(file_names)}
+    present_files = items_df['FileName'].array  # Indexed by the binary search only, never converted as a whole
+    inserted_positions = inserted['FileName'].map(position).to_numpy()
+    block_starts = np.flatnonzero(np.r_[True, inserted_positions[1:] != inserted_positions[:-1]])
+    block_ends = np.r_[block_starts[1:], len(inserted)]
+
+    # Every file is contiguous, so a binary search over items_df finds where each inserted file goes
+    pieces, start = [], 0
+    for block_start, block_end in zip(block_starts, block_ends):
+        at = bisect.bisect_left(present_files, inserted_positions[block_start], key=position.__getitem__)
+        pieces += [items_df.iloc[start:at], inserted.iloc[block_start:block_end]]
+        start = at
+    pieces.append(items_df.iloc[start:])
+    return _concat_frames(pieces)
+
+
+def derive_item_columns(items_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the searchable columns derived from Location and Name to merged items.
+
+    Runs on the concatenated rows of every file being merged rather than once per file:
+    each file's locations are almost all distinct, but every file repeats the same few
+    hundred, so classifying the distinct locations of the merged rows does each one once.
+    """
+    if items_df.empty:
+        return items_df
+    items_df['ItemType'] = categorize_locations(items_df['Location'])
+    items_df['IsEquipped'] = worn_locations(items_df['Location'])
+    items_df['IsEmpty'] = items_df['Name'] == 'Empty'
+
+    # Parse each location once into root container, slot depth and slot path
+    location_parts = decompose_locations(items_df['Location'])
+    for col in location_parts.columns:
+        items_df[col] = location_parts[col]
+    return items_df
+
+
+def _concat_derived(frames: List[pd.DataFrame], timings: StageTimings) -> pd.DataFrame:
+    """Concatenate parsed frames and add their derived columns, timing both stages."""
+    with timings.stage('concat'):
+        df = _concat_frames(frames)
+    with timings.stage('derive'):
+        return derive_item_columns(df)
+
+
+def _concat_and_dedup(frames: List[pd.DataFrame], keep: str,
+                      timings: Optional[StageTimings]) -> Tuple[pd.DataFrame, int]:
+    """Concatenate frames, derive their columns and drop duplicate rows, timing each stage."""
+    timings = timings if timings is not None else StageTimings()
+    df = _concat_derived(frames, timings)
+    with timings.stage('dedup'):
+        result = drop_duplicate_rows(df, keep)
+    timings.count('dedup', len(df))
+    return result
+
+
+def _merge_character_items(parsed_files: List[Dict], keep: str = 'first',
+                           timings: Optional[StageTimings] = None) -> Tuple[pd.DataFrame, int]:
+    """
+    Combine character-specific items, removing rows repeated across files of the same character.
+
+    Returns:
+        The merged items and the number of duplicate rows removed
+    """
+    return _concat_and_dedup([parsed['character_items'] for parsed in parsed_files], keep, timings)
+
+
+def _select_shared_bank_sources(file_infos: List[Dict]) -> List[int]:
+    """
+    Pick the files whose shared bank is kept: the first file carrying each distinct signature.
+
+    Args:
+        file_infos: Parsed files (or their metadata) in merge order
+
+    Returns:
+        Indices into file_infos of the kept shared banks
+    """
+    shared_bank_sources = {}  # Track shared bank signatures to detect duplicates
+
+    for i, info in enumerate(file_infos):
+        shared_bank_signature = info['shared_bank_signature']
+        if shared_bank_signature is None:
+            continue
+
+        if shared_bank_signature in shared_bank_sources:
+            # This shared bank already exists - skip it to avoid duplicates
+            source_char = file_infos[shared_bank_sources[shared_bank_signature]]['char_name']
+            print(f"  Skipping duplicate shared bank from {info['char_name']} (same as {source_char})")
+        else:
+            # New unique shared bank - keep it
+            shared_bank_sources[shared_bank_signature] = i
+
+    return list(shared_bank_sources.values())
+
+
+def _merge_shared_bank_items(parsed_files: List[Dict], shared_bank_mode: str = 'signature',
+                             keep: str = 'first', timings: Optional[StageTimings] = None) -> Tuple[pd.DataFrame, int]:
+    """
+    Combine shared bank items from all files.
+
+    In 'signature' mode each distinct shared bank is kept once, from the first file
+    that carries it. In 'rows' mode every shared bank row is kept once regardless of
+    which bank it came from.
+
+    Returns:
+        The shared bank items and the number of duplicate rows removed ('rows' mode only)
+    """
+    if shared_bank_mode == 'rows':
+        return _concat_and_dedup([parsed['shared_bank_items'] for parsed in parsed_files], keep, timings)
+
+    timings = timings if timings is not None else StageTimings()
+    with timings.stage('shared_bank'):
+        source_indices = _select_shared_bank_sources(parsed_files)
+    return _concat_derived([parsed_files[i]['shared_bank_items'] for i in source_indices], timings), 0
+
+
+def _merge_inventory_files(parsed_files: List[Dict], shared_bank_mode: str = 'signature',
+                           keep: str = 'first', timings: Optional[StageTimings] = None) -> Tuple[pd.DataFrame, int]:
+    """merge_inventory_files, also returning the number of duplicate rows removed."""
+    timings = timings if timings is not None else StageTimings()
+    # Remove duplicates from character-specific items only (shared bank deduplicated separately)
+    character_items_df, character_duplicates = _merge_character_items(parsed_files, keep, timings)
+    shared_bank_df, shared_bank_duplicates = _merge_shared_bank_items(parsed_files, shared_bank_mode, keep, timings)
+
+    duplicates = character_duplicates + shared_bank_duplicates
+    if not shared_bank_df.empty:
+        with timings.stage('concat'):
+            return _concat_frames([character_items_df, shared_bank_df]), duplicates
+    return character_items_df, duplicates
+
+
+def merge_inventory_files(parsed_files: List[Dict], shared_bank_mode: str = 'signature',
+                          keep: str = 'first') -> pd.DataFrame:
+    """
+    Merge parsed inventory files into one DataFrame.
+
+    Files are merged in list order, so the first file carrying a given shared bank
+    is the one that is kept. Rows repeated across files are dropped by their natural
+    key hash; keep='newest' keeps the most recently exported copy instead of the first.
+    """
+    return _merge_inventory_files(parsed_files, shared_bank_mode, keep)[0]
+
+
+def _parse_files_serial(inventory_files: List[str], known_shared_banks: Optional[Set[str]] = None) -> List[Dict]:
+    """Parse files one at a time on the calling thread, skipping shared banks already seen."""
+    if known_shared_banks is not None:
+        known_shared_banks = set(known_shared_banks)
+
+    parsed_files = []
+    for file_path in inventory_files:
+        try:
+            parsed = parse_inventory_file(file_path, known_shared_banks)
+        except Exception as e:
+            print(f"Error processing {file_path}: {e}")
+            continue
+        if parsed is not None:
+            parsed_files.append(parsed)
+            if known_shared_banks is not None and parsed['shared_bank_signature'] is not None:
+                known_shared_banks.add(parsed['shared_bank_signature'])
+    return parsed_files
+
+
+def _parse_files_with_executor(inventory_files: List[str], executor_class, max_workers: Optional[int],
+                               known_shared_banks: Optional[Set[str]] = None) -> List[Dict]:
+    """Parse files on an executor, collecting results in input order."""
+    parsed_files = []
+    with executor_class(max_workers=max_workers) as executor:
+        futures = [executor.submit(parse_inventory_file, file_path, known_shared_banks) for file_path in inventory_files]
+
+        for file_path, future in zip(inventory_files, futures):
+            try:
+                parsed = future.result()
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                print(f"Error processing {file_path}: {e}")
+                continue
+            if parsed is not None:
+                parsed_files.append(parsed)
+    return parsed_files
+
+
+def parse_inventory_files(inventory_files: List[str], mode: str = 'auto',
+                          max_workers: Optional[int] = None,
+                          known_shared_banks: Optional[Set[str]] = None) -> List[Dict]:
+    """
+    Parse inventory files using the requested loader mode.
+
+    Args:
+        inventory_files: Files to parse, in merge order
+        mode: 'serial', 'process', 'thread' or 'auto'
+        max_workers: Worker count for the parallel modes (None for the executor default)
+        known_shared_banks: Shared bank signatures whose rows are not needed again (None keeps
+                            every shared bank). Serial parsing also skips banks repeated
+                            within inventory_files; parallel workers only know this set.
+
+    Returns:
+        Parsed file dicts in the same order as inventory_files
+    """
+    if mode not in LOAD_MODES:
+        raise ValueError(f"Unknown load mode: {mode} (expected one of {', '.join(LOAD_MODES)})")
+
+    if mode == 'auto':
+        mode = 'process' if len(inventory_files) >= PARALLEL_MIN_FILES else 'serial'
+
+    if mode == 'serial' or len(inventory_files) <= 1:
+        return _parse_files_serial(inventory_files, known_shared_banks)
+
+    if mode == 'process':
+        try:
+            return _parse_files_with_executor(inventory_files, ProcessPoolExecutor, max_workers, known_shared_banks)
+        except (BrokenProcessPool, OSError, NotImplementedError) as e:
+            # Some environments cannot start worker processes - fall back to threads
+            print(f"Process pool unavailable ({e}), falling back to thread pool")
+
+    return _parse_files_with_executor(inventory_files, ThreadPoolExecutor, max_workers, known_shared_banks)
+
+
+def load_inventory_directory(directory: str, mode: str = 'auto',
+                             max_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load all inventory files from a directory.
+
+    Args:
+        directory: Directory containing *-Inventory.txt files
+        mode: Loader mode ('auto', 'serial', 'process' or 'thread')
+        max_workers: Worker count for the parallel modes
+
+    Returns:
+        DataFrame containing consolidated inventory data with shared banks deduplicated
+    """
+    inventory_files = find_inventory_files(directory)
+
+    if not inventory_files:
+        return pd.DataFrame()
+
+    # Only the first copy of each shared bank is kept, so later copies need no parsing
+    parsed_files = parse_inventory_files(inventory_files, mode=mode, max_workers=max_workers, known_shared_banks=set())
+    return merge_inventory_files(parsed_files)
+
+
+def _file_info(parsed: Dict) -> Dict:
+    """Per-file metadata kept for every loaded file, even when its parsed frames are not in memory."""
+    return {
+        'char_name': parsed['char_name'],
+        'file_name': parsed['file_name'],
+        'updated_at': parsed['updated_at'],
+        'shared_bank_signature': parsed['shared_bank_signature']
+    }
+
+
+class InventoryLoader:
+    """
+    Loads an inventory directory and keeps it current across reloads.
+
+    A fingerprint (path, mtime, size, content hash) is kept for every file. Each call
+    to load() parses only added or changed files, drops removed ones, and splices the
+    affected characters' rows into the existing items DataFrame. The shared bank
+    section is only rebuilt when a file's shared bank block changes. A spliced items_df
+    is identical to a full load of the same files, row order and source files included.
+
+    With the cache enabled, the derived DataFrame and fingerprints are also written
+    to disk, and a new loader starts from that state instead of parsing every file.
+
+    In compact mode items_df stores its repetitive string columns as categoricals whose
+    categories are shared by every reload of this loader (see inventory_compact).
+
+    Every load records per-stage timings and counts in last_reload['timings'] (see
+    inventory_timing), logs them and passes them to timing_hook.
+    """
+
+    def __init__(self, directory: str, mode: str = 'auto', max_workers: Optional[int] = None,
+                 shared_bank_mode: str = 'signature', cache: bool = False, compact: bool = False,
+                 duplicate_keep: str = 'first', timing_hook: Optional[Callable[[StageTimings], None]] = None):
+        """
+        Args:
+            directory: Directory containing *-Inventory.txt files
+            mode: Loader mode used when files need parsing
+            max_workers: Worker count for the parallel modes
+            shared_bank_mode: 'signature' keeps each distinct shared bank once,
+                              'rows' keeps each distinct shared bank row once
+            cache: Persist the loaded state next to the inventory files
+            compact: Store items_df with categorical columns and narrow numbers
+            duplicate_keep: 'first' keeps the first of identical rows in file order,
+                            'newest' the one with the latest UpdatedAt
+            timing_hook: Called with the StageTimings of every load
+        """
+        if duplicate_keep not in DUPLICATE_KEEP_MODES:
+            raise ValueError(f"Unknown duplicate keep mode: {duplicate_keep} "
+                             f"(expected one of {', '.join(DUPLICATE_KEEP_MODES)})")
+        self.directory = directory
+        self.mode = mode
+        self.max_workers = max_workers
+        self.shared_bank_mode = shared_bank_mode
+        self.use_cache = cache
+        self.compact = compact
+        self.duplicate_keep = duplicate_keep
+        self.timing_hook = timing_hook
+        self.categories = CategoryRegistry()
+
+        self.fingerprints: Dict[str, FileFingerprint] = {}
+        self.file_info: Dict[str, Dict] = {}
+        # Parsed frames; files restored from the cache are only parsed again when a splice needs them
+        self.parsed_files: Dict[str, Dict] = {}
+        self.items_df = pd.DataFrame()
+        self.last_reload: Dict = {}
+
+        self._lock = threading.Lock()
+        self._timings = StageTimings()  # Timings of the load in progress
+
+    def load(self, paths: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Bring items_df up to date with the directory and return it.
+
+        Args:
+            paths: Only check these files (e.g. those reported by a directory watcher);
+                   every other file is assumed unchanged. None checks the whole directory.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            timings = self._timings = StageTimings()
+            from_cache = False
+            if self.use_cache and not self.fingerprints:
+                with timings.stage('cache_read'):
+                    from_cache = self._restore_cache()
+
+            items_df = self._reload(paths)
+            self.last_reload['from_cache'] = from_cache
+
+            reload_info = self.last_reload
+            updated = (reload_info['full_rebuild'] or reload_info['parsed'] or
+                       reload_info['touched'] or reload_info['removed'])
+
+            if self.compact and (updated or from_cache):
+                with timings.stage('compact'):
+                    items_df = self.items_df = compact_items_df(items_df, self.categories)
+
+            if self.use_cache and updated:
+                with timings.stage('cache_write'):
+                    self._save_cache()
+
+            timings.elapsed = time.perf_counter() - start
+            reload_info['timings'] = timings
+            report_load_timings(timings, self.directory, self.timing_hook)
+            return items_df
+
+    def _restore_cache(self) -> bool:
+        """Start from the on-disk cache, if there is one for this directory."""
+        try:
+            cached = load_inventory_cache(self.directory, self.shared_bank_mode)
+        except Exception as e:
+            print(f"Ignoring unreadable inventory cache: {e}")
+            return False
+
+        if cached is None:
+            return False
+
+        for entry in cached['files']:
+            file_path = os.path.join(self.directory, entry['name'])
+            self.fingerprints[file_path] = FileFingerprint(file_path, entry['mtime'], entry['size'], entry['content_hash'])
+            self.file_info[file_path] = {
+                'char_name': entry['char_name'],
+                'file_name': entry['name'],
+                'updated_at': entry['updated_at'],
+                'shared_bank_signature': entry['shared_bank_signature']
+            }
+        # Feather keeps categoricals, so a cache written in compact mode needs expanding otherwise
+        self.items_df = cached['items_df'] if self.compact else expand_items_df(cached['items_df'])
+        return True
+
+    def _save_cache(self):
+        try:
+            save_inventory_cache(self.directory, self.items_df, self.fingerprints, self.file_info,
+                                 self.shared_bank_mode)
+        except Exception as e:
+            print(f"Could not write inventory cache: {e}")
+
+    def _reload(self, paths: Optional[List[str]] = None) -> pd.DataFrame:
+        timings = self._timings
+        with timings.stage('glob'):
+            if paths is None or not self.fingerprints:
+                inventory_files = find_inventory_files(self.directory)
+                unchecked = set()
+            else:
+                checked = set(paths)
+                unchecked = set(self.fingerprints) - checked
+                inventory_files = sorted(unchecked | {file_path for file_path in checked if os.path.isfile(file_path)})
+        timings.count('glob', len(inventory_files), 'files')
+
+        fingerprint_start = time.perf_counter()
+        added, changed, touched = [], [], []
+        new_fingerprints = {}
+        for file_path in inventory_files:
+            previous = self.fingerprints.get(file_path)
+            if file_path in unchecked:
+                new_fingerprints[file_path] = previous
+                continue
+            try:
+                fingerprint = fingerprint_file(file_path, previous)
+            except OSError as e:
+                print(f"Error processing {file_path}: {e}")
+                continue
+
+            new_fingerprints[file_path] = fingerprint
+            if previous is None:
+                added.append(file_path)
+            elif fingerprint is previous:
+                continue
+            elif fingerprint.content_hash == previous.content_hash:
+                # Re-exported with identical contents - only the timestamp moves
+                touched.append(file_path)
+            else:
+                changed.append(file_path)
+
+        removed = [file_path for file_path in self.fingerprints if file_path not in new_fingerprints]
+        timings.add('fingerprint', time.perf_counter() - fingerprint_start)
+        timings.count('fingerprint', len(inventory_files) - len(unchecked), 'files')
+
+        to_parse = added + changed
+        parsed_list = self._parse(to_parse, self._known_shared_banks()) if to_parse else []
+        newly_parsed = {parsed['file_path']: parsed for parsed in parsed_list}
+
+        # Files that failed to parse get no fingerprint so the next load retries them
+        for file_path in to_parse:
+            if file_path not in newly_parsed:
+                new_fingerprints.pop(file_path, None)
+
+        affected = to_parse + touched + removed
+        old_info = {file_path: self.file_info[file_path] for file_path in affected if file_path in self.file_info}
+
+        for file_path in removed + to_parse:
+            self.parsed_files.pop(file_path, None)
+            self.file_info.pop(file_path, None)
+        for file_path, parsed in newly_parsed.items():
+            self.parsed_files[file_path] = parsed
+            self.file_info[file_path] = _file_info(parsed)
+        for file_path in touched:
+            modified_ts = datetime.fromtimestamp(new_fingerprints[file_path].mtime)
+            self.file_info[file_path] = dict(self.file_info[file_path], updated_at=modified_ts)
+            if file_path in self.parsed_files:
+                self.parsed_files[file_path] = self._with_updated_timestamp(self.parsed_files[file_path], modified_ts)
+
+        first_load = not self.fingerprints
+        self.fingerprints = new_fingerprints
+        self.last_reload = {
+            'added': added,
+            'changed': changed,
+            'touched': touched,
+            'removed': removed,
+            'parsed': list(newly_parsed),
+            'full_rebuild': first_load,
+            'duplicates': 0,  # Duplicate rows dropped from the sections rebuilt by this load
+            'characters': []  # Characters whose rows were rebuilt (SHARED-BANK if the shared bank was)
+        }
+
+        ordered_paths = [file_path for file_path in inventory_files if file_path in self.file_info]
+
+        if first_load:
+            self.items_df, self.last_reload['duplicates'] = _merge_inventory_files(
+                [self.parsed_files[file_path] for file_path in ordered_paths], self.shared_bank_mode, self.duplicate_keep,
+                timings)
+            self.last_reload['characters'] = sorted(self.items_df['Character'].unique()) if not self.items_df.empty else []
+        elif affected:
+            self.items_df = self._splice(ordered_paths, affected, old_info)
+
+        return self.items_df
+
+    def _parse(self, file_paths: List[str], known_shared_banks: Optional[Set[str]] = None) -> List[Dict]:
+        """parse_inventory_files with this loader's settings, adding the files' stage timings to 'parse'."""
+        timings = self._timings
+        with timings.stage('parse'):
+            parsed_list = parse_inventory_files(file_paths, mode=self.mode, max_workers=self.max_workers,
+                                                known_shared_banks=known_shared_banks)
+        timings.count('parse', len(parsed_list), 'files')
+        for parsed in parsed_list:
+            timings.add_details('parse', parsed['timings'])
+        return parsed_list
+
+    def _with_updated_timestamp(self, parsed: Dict, modified_ts: datetime) -> Dict:
+        """Return a copy of a parsed file with its UpdatedAt moved to modified_ts."""
+        updated = dict(parsed, updated_at=modified_ts)
+        for key in ('character_items', 'shared_bank_items'):
+            frame = parsed[key].copy()
+            frame['UpdatedAt'] = modified_ts
+            updated[key] = frame
+        return updated
+
+    def _known_shared_banks(self) -> Optional[Set[str]]:
+        """Shared bank signatures whose rows need not be parsed again (None in 'rows' mode)."""
+        if self.shared_bank_mode != 'signature':
+            return None
+        return {info['shared_bank_signature'] for info in self.file_info.values()
+                if info['shared_bank_signature'] is not None}
+
+    def _ensure_parsed(self, file_paths: List[str], with_shared_bank: bool = False) -> List[Dict]:
+        """
+        Return parsed files for file_paths, parsing any that were restored from the cache.
+
+        With with_shared_bank, files whose shared bank rows were skipped as a known bank
+        are parsed again in full.
+        """
+        missing = [file_path for file_path in file_paths if file_path not in self.parsed_files or
+                   (with_shared_bank and self.parsed_files[file_path].get('shared_bank_skipped'))]
+        if missing:
+            for parsed in self._parse(missing):
+                self.parsed_files[parsed['file_path']] = parsed
+        return [self.parsed_files[file_path] for file_path in file_paths if file_path in self.parsed_files]
+
+    def _splice(self, ordered_paths: List[str], affected: List[str], old_info: Dict[str, Dict]) -> pd.DataFrame:
+        """Replace the rows of affected characters (and the shared bank, if it changed) in items_df."""
+        items_df = self.items_df
+
+        # Rebuild every file of an affected character so cross-file duplicate removal stays exact
+        affected_chars = {info['char_name'] for info in old_info.values()}
+        affected_chars.update(self.file_info[file_path]['char_name'] for file_path in affected if file_path in self.file_info)
+
+        rebuilt_character_items, duplicates = _merge_character_items(self._ensure_parsed(
+            [file_path for file_path in ordered_paths if self.file_info[file_path]['char_name'] in affected_chars]
+        ), self.duplicate_keep, self._timings)
+
+        with self._timings.stage('splice'):
+            if items_df.empty:
+                remaining_items = items_df
+                shared_bank_df = items_df
+            else:
+                is_shared_bank = items_df['Character'] == SHARED_BANK_CHARACTER
+                remaining_items = items_df[~is_shared_bank & ~items_df['Character'].isin(affected_chars)]
+                shared_bank_df = items_df[is_shared_bank]
+
+        shared_bank_changed = any(
+            (old_info[file_path]['shared_bank_signature'] if file_path in old_info else None) !=
+            (self.file_info[file_path]['shared_bank_signature'] if file_path in self.file_info else None)
+            for file_path in affected
+        )
+        # Files still carrying the same shared bank under a new export time (re-exported, or only their
+        # character rows changed)
+        restamped = [file_path for file_path in self.last_reload['touched'] + self.last_reload['changed']
+                     if self.file_info.get(file_path, {}).get('shared_bank_signature') is not None]
+        if self.shared_bank_mode == 'rows' and self.duplicate_keep == 'newest':
+            # A re-exported bank becomes the newest copy of its rows
+            shared_bank_changed = shared_bank_changed or bool(restamped)
+
+        shared_bank_updated = shared_bank_changed
+        if shared_bank_changed:
+            shared_bank_df, shared_bank_duplicates = self._rebuild_shared_bank(ordered_paths)
+            duplicates += shared_bank_duplicates
+        elif not shared_bank_df.empty:
+            # Same shared bank contents, kept from the same files - only refresh their timestamps
+            for file_path in restamped:
+                info = self.file_info[file_path]
+                from_file = shared_bank_df['FileName'] == info['file_name']
+                if from_file.any():
+                    shared_bank_df = shared_bank_df.copy()
+                    shared_bank_df.loc[from_file, 'UpdatedAt'] = info['updated_at']
+                    shared_bank_updated = True
+
+        self.last_reload['duplicates'] = duplicates
+        self.last_reload['characters'] = sorted(affected_chars | ({SHARED_BANK_CHARACTER} if shared_bank_updated else set()))
+        with self._timings.stage('concat'):
+            # Rows in the same order as a full load: character rows by file, then the shared bank
+            character_items = _insert_in_file_order(
+                remaining_items, rebuilt_character_items,
+                [self.file_info[file_path]['file_name'] for file_path in ordered_paths])
+            return _concat_frames([character_items, shared_bank_df])
+
+    def _rebuild_shared_bank(self, ordered_paths: List[str]) -> Tuple[pd.DataFrame, int]:
+        """Recompute the shared bank section, parsing only the files whose banks are kept."""
+        carriers = [file_path for file_path in ordered_paths if self.file_info[file_path]['shared_bank_signature'] is not None]
+
+        if self.shared_bank_mode == 'rows':
+            return _merge_shared_bank_items(self._ensure_parsed(carriers), 'rows', self.duplicate_keep, self._timings)
+
+        source_indices = _select_shared_bank_sources([self.file_info[file_path] for file_path in carriers])
+        sources = self._ensure_parsed([carriers[i] for i in source_indices], with_shared_bank=True)
+        return _concat_derived([parsed['shared_bank_items'] for parsed in sources], self._timings), 0
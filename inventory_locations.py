@@ -0,0 +1,107 @@
+"""
+Inventory Locations
+Classifies and decomposes inventory Location strings (Primary, General1-Slot3, SharedBank2, ...).
+
+All column-level functions work on the distinct Location values and map the results back,
+so their cost grows with the number of distinct locations rather than the number of rows.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# The row-level rules live in the pandas-free streaming module and are re-exported here
+from inventory_stream import EQUIPPED_LOCATIONS, categorize_location, is_worn_location
+
+
+def _map_unique(locations: pd.Series, func, dtype) -> pd.Series:
+    """Apply func once per distinct location and broadcast the results back to every row."""
+    codes, uniques = pd.factorize(locations)
+    # Missing locations get code -1, which indexes the trailing NaN entry
+    values = [func(location) for location in uniques] + [func(np.nan)]
+    return pd.Series(np.array(values, dtype=dtype)[codes], index=locations.index)
+
+
+def categorize_locations(locations: pd.Series) -> pd.Series:
+    """Vectorized categorize_location for a whole Location column."""
+    return _map_unique(locations, categorize_location, object)
+
+
+def worn_locations(locations: pd.Series) -> pd.Series:
+    """Vectorized is_worn_location for a whole Location column."""
+    return _map_unique(locations, is_worn_location, bool)
+
+
+# Root container kinds for the RootKind column
+ROOT_WORN = 0
+ROOT_GENERAL = 1
+ROOT_BANK = 2
+ROOT_SHARED_BANK = 3
+
+_ROOT_INDEX_PATTERN = re.compile(r'(\d+)$')
+_SLOT_PATTERN = re.compile(r'-Slot(\d+)')
+
+
+def decompose_location(location) -> tuple:
+    """
+    Split a location into (root kind, root index, slot depth, slot path).
+
+    Examples:
+        Primary               -> (ROOT_WORN, 0, 0, '')
+        Range-Slot1           -> (ROOT_WORN, 0, 1, '1')
+        General2-Slot1-Slot2  -> (ROOT_GENERAL, 2, 2, '1-2')
+        SharedBank1-Slot4     -> (ROOT_SHARED_BANK, 1, 1, '4')
+    """
+    location = str(location)
+    root = location.split('-', 1)[0]
+
+    if 'SharedBank' in root:
+        root_kind = ROOT_SHARED_BANK
+    elif 'Bank' in root:
+        root_kind = ROOT_BANK
+    elif 'General' in root:
+        root_kind = ROOT_GENERAL
+    else:
+        root_kind = ROOT_WORN
+
+    index_match = _ROOT_INDEX_PATTERN.search(root)
+    root_index = int(index_match.group(1)) if index_match else 0
+
+    slot_depth = location.count('-Slot')
+    slot_path = '-'.join(_SLOT_PATTERN.findall(location))
+
+    return root_kind, root_index, slot_depth, slot_path
+
+
+def decompose_locations(locations: pd.Series) -> pd.DataFrame:
+    """
+    Decompose a whole Location column into RootKind, RootIndex, SlotDepth and SlotPath columns.
+
+    Each distinct location is parsed once, so analyses can filter on the integer
+    columns instead of scanning Location strings.
+    """
+    codes, uniques = pd.factorize(locations)
+    parts = [decompose_location(location) for location in uniques] + [decompose_location(np.nan)]
+
+    return pd.DataFrame({
+        'RootKind': np.array([part[0] for part in parts], dtype=np.int8)[codes],
+        'RootIndex': np.array([part[1] for part in parts], dtype=np.int16)[codes],
+        'SlotDepth': np.array([part[2] for part in parts], dtype=np.int8)[codes],
+        'SlotPath': np.array([part[3] for part in parts], dtype=object)[codes]
+    }, index=locations.index)
+
+
+def equipped_location_mask(items_df: pd.DataFrame) -> pd.Series:
+    """
+    True where an item sits in an augment slot of another item (worn or spare gear).
+
+    Available patterns:
+        Level 0: Primary, Head, General1 (loose gear/items)
+        Level 1: General1-Slot1, Bank4-Slot7 (items IN containers)
+    Equipped patterns:
+        Level 1: Range-Slot1, Primary-Slot2 (augments IN worn gear)
+        Level 2+: General2-Slot1-Slot2 (augments IN items IN containers)
+    """
+    slot_depth = items_df['SlotDepth']
+    return (slot_depth >= 2) | ((slot_depth == 1) & (items_df['RootKind'] == ROOT_WORN))
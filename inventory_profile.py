@@ -0,0 +1,172 @@
+"""
+Inventory Profile
+Profiling mode (--profile DIR) for the desktop GUI and the command-line monitor.
+
+Each profiled operation (a load, a search, a Zeb check, a quest analysis, ...) runs
+under its own cProfile session and, optionally, tracemalloc. Every call writes:
+
+    DIR/NNN-operation.prof   cProfile stats (open with pstats, snakeviz, ...)
+    DIR/NNN-operation.txt    peak memory, top allocation sites and the slowest functions
+    DIR/summary.jsonl        one JSON line per call: seconds, peak and retained memory
+
+Operations are profiled one at a time: cProfile only sees the thread that enabled it,
+and tracemalloc's peak is process-wide, so overlapping sessions would blur each other.
+An operation called from inside another one runs unprofiled as part of the outer one.
+One started on another thread meanwhile (a search while a background load is profiled)
+also runs unprofiled instead of waiting, and is logged as skipped.
+Worker processes are invisible to both, so callers parse files serially while profiling.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from typing import Callable, Dict
+
+
+# Entries in each operation's .txt report
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 15
+
+_REPORT_NUMBER = re.compile(r'^(\d+)-.*\.prof$')
+
+
+class OperationProfiler:
+    """Writes a cProfile and tracemalloc report for every profiled operation."""
+
+    def __init__(self, directory: str, memory: bool = True):
+        """
+        Args:
+            directory: Output directory (created if missing)
+            memory: Also trace allocations (slower, but reports peak memory)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.memory = memory
+        # Number after the reports already in the directory, so earlier runs are kept
+        numbers = [int(match.group(1)) for match in map(_REPORT_NUMBER.match, os.listdir(directory)) if match]
+        self.count = max(numbers, default=0)
+
+        self.skipped = 0  # Operations not profiled because another thread's was
+        self._lock = threading.Lock()
+        self._active = threading.local()
+        self._running = None  # Operation currently profiled, on any thread
+
+    def _next_path(self, operation: str) -> str:
+        self.count += 1
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', operation).strip('_') or 'operation'
+        return os.path.join(self.directory, f"{self.count:03d}-{slug}")
+
+    @contextmanager
+    def profile(self, operation: str):
+        """Profile the body of a with block as operation."""
+        if getattr(self._active, 'operation', None) is not None:
+            yield  # Nested: already covered by the outer session
+            return
+
+        if not self._lock.acquire(blocking=False):
+            # Never block the caller (often the UI thread) until another thread's operation finishes
+            self.skipped += 1
+            print(f"Not profiling {operation}: {self._running} is being profiled on another thread")
+            yield
+            return
+
+        try:
+            self._active.operation = self._running = operation
+            started_tracing = self.memory and not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            elif self.memory:
+                tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0] if self.memory else 0
+
+            profiler = cProfile.Profile()
+            started_at = datetime.now()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                seconds = time.perf_counter() - start
+                snapshot = None
+                current = peak = 0
+                if self.memory:
+                    current, peak = tracemalloc.get_traced_memory()
+                    snapshot = tracemalloc.take_snapshot()
+                    if started_tracing:
+                        tracemalloc.stop()
+                self._active.operation = self._running = None
+                self._write_report(operation, profiler, started_at, seconds,
+                                   peak - memory_before, current - memory_before, snapshot)
+        finally:
+            self._lock.release()
+
+    def _write_report(self, operation, profiler, started_at, seconds, peak_bytes, retained_bytes, snapshot):
+        base_path = self._next_path(operation)
+        try:
+            profiler.dump_stats(base_path + '.prof')
+
+            lines = [f"Operation: {operation}",
+                     f"Started: {started_at.isoformat(timespec='seconds')}",
+                     f"Elapsed: {seconds:.3f}s"]
+            if snapshot is not None:
+                lines.append(f"Peak memory: {peak_bytes / (1024 * 1024):.1f} MB above the start of the operation")
+                lines.append(f"Retained: {retained_bytes / (1024 * 1024):.1f} MB")
+                lines.append("")
+                lines.append(f"Top {TOP_ALLOCATIONS} allocation sites still held at the end:")
+                lines.extend(f"  {stat}" for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS])
+
+            stats_text = io.StringIO()
+            pstats.Stats(profiler, stream=stats_text).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+            lines.append("")
+            lines.append(stats_text.getvalue())
+            with open(base_path + '.txt', 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines))
+
+            summary = {
+                'operation': operation,
+                'file': os.path.basename(base_path) + '.prof',
+                'started_at': started_at.isoformat(timespec='seconds'),
+                'seconds': round(seconds, 6),
+                'peak_mb': round(peak_bytes / (1024 * 1024), 3) if snapshot is not None else None,
+                'retained_mb': round(retained_bytes / (1024 * 1024), 3) if snapshot is not None else None,
+                'thread': threading.current_thread().name,
+            }
+            with open(os.path.join(self.directory, 'summary.jsonl'), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(summary) + '\n')
+        except OSError as e:
+            print(f"Could not write profile for {operation}: {e}")
+            return
+
+        memory_text = f", peak {summary['peak_mb']:.1f} MB" if snapshot is not None else ""
+        print(f"Profiled {operation}: {seconds:.2f}s{memory_text} -> {base_path}.prof")
+
+    def wrap(self, operation: str, func: Callable) -> Callable:
+        """Return func profiled as operation on every call."""
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            with self.profile(operation):
+                return func(*args, **kwargs)
+        return profiled
+
+
+def profile_methods(obj, operations: Dict[str, str], profiler: OperationProfiler):
+    """
+    Profile the given methods of one object.
+
+    Args:
+        obj: Instance whose methods are replaced (the class is left alone)
+        operations: Method name -> operation name used for the output files
+        profiler: Profiler writing the reports
+    """
+    for method_name, operation in operations.items():
+        setattr(obj, method_name, profiler.wrap(operation, getattr(obj, method_name)))
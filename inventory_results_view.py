@@ -0,0 +1,255 @@
+"""
+Inventory Results View
+Virtual-scrolling Treeview that only materializes the visible rows of a results DataFrame.
+
+The Treeview holds a fixed pool of items (visible rows plus a small overscan) whose values
+are rewritten as the view scrolls, so showing 100 or 100,000 results costs the same.
+The scroll position and selection are kept by ResultWindow, which needs no display.
+"""
+
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+
+DEFAULT_ROW_HEIGHT = 20
+HEADING_HEIGHT = 24
+
+
+def clamp_offset(offset: int, total_rows: int, visible_rows: int) -> int:
+    """Keep the first visible row inside the data so the last page is always full."""
+    return max(0, min(offset, total_rows - visible_rows))
+
+
+class ResultWindow:
+    """
+    Which rows of a result set are rendered and selected, by DataFrame row position.
+
+    offset is the first visible row; the rendered window adds overscan rows below the
+    visible ones. Selection (a single row) and the keyboard focus survive scrolling out
+    of the window, since the widget's pooled items are renumbered on every render.
+    """
+
+    def __init__(self, overscan: int = 5):
+        self.overscan = overscan
+        self.total_rows = 0
+        self.visible_rows = 1
+        self.offset = 0
+        self.selected: Set[int] = set()
+        self.focus: Optional[int] = None
+
+    def reset(self, total_rows: int):
+        """Start over on a new result set: scrolled to the top, nothing selected or focused."""
+        self.total_rows = total_rows
+        self.offset = 0
+        self.selected = set()
+        self.focus = None
+
+    def rows(self) -> range:
+        """Row positions to render, top to bottom."""
+        return range(self.offset, self.offset + max(0, min(self.visible_rows + self.overscan,
+                                                           self.total_rows - self.offset)))
+
+    def scroll(self, delta: int):
+        self.jump(self.offset + delta)
+
+    def jump(self, position: int):
+        """Scroll so position is the first visible row (or as close as the last page allows)."""
+        self.offset = clamp_offset(position, self.total_rows, self.visible_rows)
+
+    def move_to(self, fraction: float):
+        """Scroll to a scrollbar position (0.0 is the top)."""
+        self.jump(int(fraction * self.total_rows))
+
+    def resize(self, visible_rows: int) -> bool:
+        """Set the number of visible rows; returns whether it changed."""
+        if visible_rows == self.visible_rows:
+            return False
+        self.visible_rows = visible_rows
+        self.jump(self.offset)
+        return True
+
+    def move_selection(self, delta: int) -> int:
+        """
+        Select and focus the row delta rows from the focused one, scrolling it into view.
+
+        Args:
+            delta: Rows to move (negative is up); with no focus yet, from the first visible row
+
+        Returns:
+            The newly selected row
+        """
+        focus = self.offset if self.focus is None else self.focus
+        target = max(0, min(focus + delta, self.total_rows - 1))
+        if target < self.offset or target >= self.offset + self.visible_rows:
+            self.jump(target if delta < 0 else target - self.visible_rows + 1)
+        self.selected = {target}
+        self.focus = target
+        return target
+
+    def select_rendered(self, selected_rows: Set[int]):
+        """
+        Take the selection of the rendered rows from the widget.
+
+        Rendering a window without the selected row leaves nothing selected in the widget,
+        which keeps the selection; choosing a rendered row replaces it and takes the focus.
+        """
+        if selected_rows or not (self.selected - set(self.rows())):
+            self.selected = set(selected_rows)
+        if selected_rows:
+            self.focus = min(selected_rows)
+
+    def scrollbar_range(self) -> Tuple[float, float]:
+        """Visible part of the result set as scrollbar fractions."""
+        if not self.total_rows:
+            return 0.0, 1.0
+        return (self.offset / self.total_rows,
+                min(1.0, (self.offset + self.visible_rows) / self.total_rows))
+
+
+class VirtualResultsView(ttk.Frame):
+    """
+    Treeview with its own scrollbar that renders a window of a DataFrame.
+
+    Selection (a single row) is tracked by DataFrame row position, so the selected row
+    stays selected when it scrolls out of view and back in.
+    """
+
+    def __init__(self, master, columns: List[str], value_columns: List[str], overscan: int = 5):
+        """
+        Args:
+            master: Parent widget
+            columns: Column headings shown in the Treeview
+            value_columns: DataFrame column shown under each heading
+            overscan: Extra rows rendered below the visible window
+        """
+        super().__init__(master)
+        self.value_columns = value_columns
+        self.window = ResultWindow(overscan)
+
+        self.tree = ttk.Treeview(self, columns=columns, show='headings', selectmode='browse')
+        self.scrollbar_y = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.scrollbar_x = ttk.Scrollbar(self, orient='horizontal', command=self.tree.xview)
+        self.tree.configure(yscrollcommand=lambda *args: None, xscrollcommand=self.scrollbar_x.set)
+
+        self.scrollbar_x.pack(side='bottom', fill='x')
+        self.scrollbar_y.pack(side='right', fill='y')
+        self.tree.pack(side='left', fill='both', expand=True)
+
+        self.data = pd.DataFrame()
+        self._values: List = []
+        self._item_rows: Dict[str, int] = {}  # Treeview item id -> DataFrame row position
+        self._rendering = False
+        self._double_click_callback: Optional[Callable[[pd.Series], None]] = None
+
+        row_height = ttk.Style().lookup('Treeview', 'rowheight')
+        self._row_height = int(row_height) if row_height else DEFAULT_ROW_HEIGHT
+
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<Double-1>', self._on_double_click)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll_rows(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_rows(3))
+        for key, delta in (('<Up>', -1), ('<Down>', 1), ('<Prior>', None), ('<Next>', None)):
+            self.tree.bind(key, lambda e, k=key, d=delta: self._on_key(k, d))
+        self.tree.bind('<Home>', lambda e: self._jump(0))
+        self.tree.bind('<End>', lambda e: self._jump(len(self.data)))
+
+    def set_data(self, data: pd.DataFrame):
+        """Show a new results DataFrame, scrolled to the top with nothing selected."""
+        self.data = data
+        # One array per shown column; only the rendered window is ever turned into row tuples
+        self._values = [data[col].to_numpy() for col in self.value_columns] if not data.empty else []
+        self.window.reset(len(data))
+        self._render()
+
+    def clear(self):
+        self.set_data(pd.DataFrame())
+
+    def selected_rows(self) -> pd.DataFrame:
+        """Selected rows of the current DataFrame, in display order."""
+        return self.data.iloc[sorted(self.window.selected)]
+
+    def bind_row_double_click(self, callback: Callable[[pd.Series], None]):
+        """Call callback with the DataFrame row that was double-clicked."""
+        self._double_click_callback = callback
+
+    def scroll_rows(self, delta: int):
+        self.window.scroll(delta)
+        self._render()
+
+    def _jump(self, position: int):
+        self.window.jump(position)
+        self._render()
+        return 'break'
+
+    def _render(self):
+        """Rewrite the pooled Treeview items with the rows of the current window."""
+        rows = self.window.rows()
+        pool = self.tree.get_children()
+
+        self._rendering = True
+        try:
+            for i in range(len(rows), len(pool)):
+                self.tree.delete(pool[i])
+            for i in range(len(pool), len(rows)):
+                self.tree.insert('', 'end', iid=f"row{i}")
+
+            self._item_rows = {}
+            selected_items = []
+            for i, row_position in enumerate(rows):
+                item_id = f"row{i}"
+                self.tree.item(item_id, values=tuple(values[row_position] for values in self._values))
+                self._item_rows[item_id] = row_position
+                if row_position in self.window.selected:
+                    selected_items.append(item_id)
+            self.tree.selection_set(selected_items)
+            self.tree.yview_moveto(0)
+        finally:
+            self._rendering = False
+
+        self.scrollbar_y.set(*self.window.scrollbar_range())
+
+    def _on_configure(self, event):
+        if self.window.resize(max(1, (event.height - HEADING_HEIGHT) // self._row_height)):
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.window.move_to(float(amount))
+            self._render()
+        elif action == 'scroll':
+            step = self.window.visible_rows if unit == 'pages' else 1
+            self.scroll_rows(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+        return 'break'
+
+    def _on_key(self, key: str, delta: Optional[int]):
+        """Move the keyboard focus row, scrolling the window when it leaves the visible rows."""
+        if self.data.empty:
+            return 'break'
+        if delta is None:
+            delta = -self.window.visible_rows if key == '<Prior>' else self.window.visible_rows
+
+        target = self.window.move_selection(delta)
+        self._render()
+
+        item_id = f"row{target - self.window.offset}"
+        if item_id in self._item_rows:
+            self.tree.focus(item_id)
+        return 'break'
+
+    def _on_select(self, event):
+        if self._rendering:
+            return
+        self.window.select_rendered(
+            {self._item_rows[item_id] for item_id in self.tree.selection() if item_id in self._item_rows})
+
+    def _on_double_click(self, event):
+        item_id = self.tree.identify_row(event.y)
+        if item_id in self._item_rows and self._double_click_callback is not None:
+            self._double_click_callback(self.data.iloc[self._item_rows[item_id]])
@@ -0,0 +1,361 @@
+"""
+Inventory Search
+Trigram inverted index over item names for fast case-insensitive substring search.
+
+The index maps every lowercase character trigram of the distinct item names to the
+names containing it, and every name to the rows holding it. A substring query
+intersects the postings of its trigrams and only verifies the surviving names, so
+its cost follows the number of matches rather than the size of the inventory.
+
+Searches for many names at once (quest items, recipe components) use an Aho-Corasick
+automaton instead, which finds every pattern in a name in a single pass.
+
+For search-as-you-type, IncrementalSearch remembers recent results and narrows them
+when a new term extends an earlier one. SearchResultCache keeps whole filtered result
+frames for repeated searches until the inventory is reloaded.
+"""
+
+import re
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Characters that give a search term regex meaning (str.contains treats terms as regexes)
+REGEX_METACHARACTERS = set('.^$*+?{}[]\\|()')
+
+
+def is_literal_term(term: str) -> bool:
+    """True if term matches the same names as a plain substring and as a regex."""
+    return not any(char in REGEX_METACHARACTERS for char in term)
+
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class AhoCorasick:
+    """Case-insensitive multi-pattern substring matcher."""
+
+    def __init__(self, patterns: List[str]):
+        """
+        Args:
+            patterns: Literal patterns; find() reports indices into this list
+        """
+        self.patterns = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern_id)
+
+        # Breadth-first failure links; each state also reports the patterns of its fallback
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                if state:
+                    fallback = self._fail[state]
+                    while fallback and char not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> set:
+        """Return the ids of all patterns occurring in text."""
+        found = set(self._output[0])  # An empty pattern occurs everywhere
+        state = 0
+        for char in text.lower():
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found.update(self._output[state])
+        return found
+
+
+@lru_cache(maxsize=32)
+def get_pattern_matcher(patterns: Tuple[str, ...]) -> AhoCorasick:
+    """Build (or reuse) the matcher for a pattern set, so repeated quest-wide searches skip construction."""
+    return AhoCorasick(list(patterns))
+
+
+def tag_pattern_hits(names: pd.Series, patterns: List[str]) -> pd.Series:
+    """
+    Tag every row with the patterns its name contains, case-insensitively.
+
+    Each distinct name is scanned once and the result is broadcast back to its rows.
+
+    Returns:
+        Series (same index as names) of tuples of matched patterns, empty where nothing matched
+    """
+    matcher = get_pattern_matcher(tuple(patterns))
+    codes, uniques = pd.factorize(names)
+    hits = [tuple(matcher.patterns[i] for i in sorted(matcher.find(str(name)))) for name in uniques] + [()]
+    tags = np.empty(len(hits), dtype=object)
+    tags[:] = hits
+    return pd.Series(tags[codes], index=names.index)
+
+
+def count_pattern_hits(names: pd.Series, patterns: List[str], groups: Optional[pd.Series] = None) -> pd.DataFrame:
+    """
+    Count the rows whose name contains each pattern, optionally split by a group column.
+
+    All patterns are matched in one pass (see tag_pattern_hits) and counted with a single groupby,
+    giving the same numbers as one str.contains(pattern, case=False, regex=False) scan per pattern.
+
+    Args:
+        names: Item name column
+        patterns: Literal patterns to count
+        groups: Optional column aligned with names (e.g. an equipped flag) to split counts by
+
+    Returns:
+        DataFrame indexed by pattern with one count column per group value
+        (a single 'Count' column when groups is None), zero-filled
+    """
+    columns = None
+    if groups is None:
+        groups = pd.Series('Count', index=names.index)
+        columns = ['Count']
+
+    hits = pd.DataFrame({'Pattern': tag_pattern_hits(names, patterns), 'Group': groups})
+    hits = hits.explode('Pattern').dropna(subset=['Pattern'])
+    counts = hits.groupby(['Pattern', 'Group'], observed=True).size().unstack(fill_value=0)
+    return counts.reindex(index=list(dict.fromkeys(patterns)), columns=columns, fill_value=0)
+
+
+class TrigramIndex:
+    """
+    Substring index over a Name column.
+
+    Positions returned by the index are row positions (for .iloc) in the Series
+    the index was built from, so it must be rebuilt whenever that DataFrame changes.
+    """
+
+    def __init__(self, names: pd.Series):
+        """
+        Args:
+            names: Item name column, one entry per inventory row
+        """
+        codes, uniques = pd.factorize(names)
+        self.size = len(names)
+        self.names: List[str] = [str(name) for name in uniques]
+        self._lower_names = [name.lower() for name in self.names]
+
+        postings: Dict[str, List[int]] = {}
+        for name_id, name in enumerate(self._lower_names):
+            for trigram in _trigrams(name):
+                postings.setdefault(trigram, []).append(name_id)
+        self._postings = {trigram: np.array(ids, dtype=np.int32) for trigram, ids in postings.items()}
+
+        # Rows grouped by name id; missing names (code -1) sort first and are skipped
+        self._row_order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        self._row_starts = np.concatenate(([0], np.cumsum(counts))) + int((codes < 0).sum())
+
+    def _literal_name_ids(self, term: str) -> np.ndarray:
+        term = term.lower()
+        term_trigrams = _trigrams(term)
+
+        if not term_trigrams:
+            # Too short for trigrams - check every distinct name
+            return np.array([i for i, name in enumerate(self._lower_names) if term in name], dtype=np.int32)
+
+        # Intersect the rarest postings first so the candidate set shrinks fast
+        candidates = None
+        for trigram in sorted(term_trigrams, key=lambda t: len(self._postings.get(t, ()))):
+            posting = self._postings.get(trigram)
+            if posting is None:
+                return np.array([], dtype=np.int32)
+            candidates = posting if candidates is None else np.intersect1d(candidates, posting, assume_unique=True)
+            if len(candidates) == 0:
+                return candidates
+
+        # Trigrams can match out of order - confirm the full substring
+        return self.narrow_name_ids(candidates, term)
+
+    def matching_name_ids(self, term: str, regex: bool = True) -> np.ndarray:
+        """
+        Return ids of distinct names containing term, case-insensitively.
+
+        Args:
+            term: Search term
+            regex: Treat term as a regular expression (like str.contains). Literal terms
+                   and alternations of literals ('Bread|Water') are still answered from the index.
+        """
+        if not regex or is_literal_term(term):
+            return self._literal_name_ids(term)
+
+        alternatives = term.split('|')
+        if all(alternative and is_literal_term(alternative) for alternative in alternatives):
+            return np.unique(np.concatenate([self._literal_name_ids(alternative) for alternative in alternatives]))
+
+        pattern = re.compile(term, re.IGNORECASE)
+        return np.array([i for i, name in enumerate(self.names) if pattern.search(name)], dtype=np.int32)
+
+    def narrow_name_ids(self, name_ids, term: str) -> np.ndarray:
+        """Keep the name ids whose name contains the literal term."""
+        term = term.lower()
+        return np.array([i for i in name_ids if term in self._lower_names[i]], dtype=np.int32)
+
+    def positions_for_name_ids(self, name_ids) -> np.ndarray:
+        """Return the sorted row positions holding any of the given name ids."""
+        if len(name_ids) == 0:
+            return np.array([], dtype=np.intp)
+        rows = [self._row_order[self._row_starts[i]:self._row_starts[i + 1]] for i in name_ids]
+        return np.sort(np.concatenate(rows))
+
+    def matching_positions(self, term: str, regex: bool = True) -> np.ndarray:
+        """Return sorted row positions whose name contains term (see matching_name_ids)."""
+        return self.positions_for_name_ids(self.matching_name_ids(term, regex))
+
+    def matching_positions_any(self, patterns: List[str]) -> np.ndarray:
+        """Return sorted row positions whose name contains any of the literal patterns."""
+        matcher = get_pattern_matcher(tuple(patterns))
+        return self.positions_for_name_ids([i for i, name in enumerate(self._lower_names) if matcher.find(name)])
+
+    def search_any(self, items_df: pd.DataFrame, patterns: List[str]) -> pd.DataFrame:
+        """Return the rows of items_df whose name contains any of the literal patterns."""
+        return items_df.iloc[self.matching_positions_any(patterns)]
+
+    def search(self, items_df: pd.DataFrame, term: str, regex: bool = True) -> pd.DataFrame:
+        """Return the rows of items_df (the frame this index was built from) whose name contains term."""
+        return items_df.iloc[self.matching_positions(term, regex)]
+
+
+class IncrementalSearch:
+    """
+    Recent-term cache on top of a TrigramIndex for search-as-you-type.
+
+    When a literal term contains an earlier cached term ("frag" -> "fragm"), only the
+    names that matched the earlier term are checked again. The cache belongs to one
+    index, so a reload (which builds a new index) starts with an empty cache.
+    """
+
+    def __init__(self, index: TrigramIndex, max_terms: int = 32):
+        """
+        Args:
+            index: Name index of the current inventory
+            max_terms: Number of recent terms kept (least recently used are dropped)
+        """
+        self.index = index
+        self.max_terms = max_terms
+        self.hits = 0
+        self.narrowed = 0
+        self._cache: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def matching_name_ids(self, term: str, regex: bool = True) -> np.ndarray:
+        """Same result as TrigramIndex.matching_name_ids, reusing earlier results where possible."""
+        if regex and not is_literal_term(term):
+            return self.index.matching_name_ids(term, regex)
+
+        key = term.lower()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+            # Narrow the smallest earlier result whose term is contained in this one
+            base = None
+            for previous_term, previous_ids in self._cache.items():
+                if previous_term in key and (base is None or len(previous_ids) < len(base)):
+                    base = previous_ids
+
+        if base is not None:
+            name_ids = self.index.narrow_name_ids(base, key)
+            self.narrowed += 1
+        else:
+            name_ids = self.index.matching_name_ids(term, regex=False)
+
+        with self._lock:
+            self._cache[key] = name_ids
+            while len(self._cache) > self.max_terms:
+                self._cache.popitem(last=False)
+        return name_ids
+
+    def matching_positions(self, term: str, regex: bool = True) -> np.ndarray:
+        return self.index.positions_for_name_ids(self.matching_name_ids(term, regex))
+
+    def search(self, items_df: pd.DataFrame, term: str, regex: bool = True) -> pd.DataFrame:
+        """Return the rows of items_df (the frame the index was built from) whose name contains term."""
+        return items_df.iloc[self.matching_positions(term, regex)]
+
+
+class SearchResultCache:
+    """
+    Bounded LRU cache of search result frames, keyed by the normalized query and a data version.
+
+    invalidate() bumps the version and empties the cache in one step, and results computed
+    against an older version are never stored, so a reload can't leave stale entries behind.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[tuple, pd.DataFrame]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(search_term: str, character: Optional[str], item_type: Optional[str], exact_match: bool) -> tuple:
+        """Searches are case-insensitive, so queries differing only in case share an entry."""
+        return (search_term.lower(), (character or '').lower(), (item_type or '').lower(), bool(exact_match))
+
+    def get_or_compute(self, search_term: str, character: Optional[str], item_type: Optional[str],
+                       exact_match: bool, compute: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the cached result for this query, computing and storing it on a miss."""
+        key = self.make_key(search_term, character, item_type, exact_match)
+        with self._lock:
+            version = self.version
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        result = compute()
+
+        with self._lock:
+            if version == self.version:
+                self._entries[key] = result
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, swap: Optional[Callable[[], None]] = None):
+        """
+        Start a new data version (call on every reload).
+
+        Args:
+            swap: Optional callable that installs the reloaded data; it runs under the cache
+                  lock so no lookup can pair the new data with results from the old version
+        """
+        with self._lock:
+            if swap is not None:
+                swap()
+            self.version += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'version': self.version, 'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
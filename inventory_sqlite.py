@@ -0,0 +1,423 @@
+"""
+Inventory SQLite
+Optional SQLite storage backend for very large collections (--backend sqlite).
+
+Inventory files are ingested into a local database instead of one in-memory DataFrame.
+A file is re-read only when its modification time or size changes, and then only its rows
+are replaced. Searches, duplicate detection and character summaries run as SQL, so only
+their results are loaded into pandas.
+
+Rows are deduplicated like the DataFrame loader in 'rows' shared bank mode: of identical
+rows (character, location, name, ID, count, slots) only the first one stored is visible,
+so each shared bank slot appears once however many characters exported it. Every copy is
+kept, so deleting or re-exporting one file never loses rows another file still holds.
+
+Names are indexed case-insensitively and, when SQLite has the FTS5 trigram tokenizer
+(SQLite 3.34+), through a full-text table for substring search. Search terms with regex
+characters are matched with a Python REGEXP function, once per distinct name.
+"""
+
+import csv
+import os
+import re
+import sqlite3
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from inventory_duplicates import DUPLICATE_KEYS
+from inventory_search import is_literal_term
+from inventory_stream import (RESULT_COLUMNS, SHARED_BANK_CHARACTER, StreamedInventory, StreamFormatError,
+                              categorize_location, find_inventory_files, is_worn_location, read_inventory_file)
+from inventory_timing import StageTimings, report_load_timings
+
+
+DATABASE_NAME = '.fdt_inventory.sqlite'
+SCHEMA_VERSION = 1
+
+# Shortest literal search term the trigram index can answer
+FTS_MIN_TERM_LENGTH = 3
+
+# DataFrame column -> items table column
+COLUMN_NAMES = {
+    'Character': 'character', 'Location': 'location', 'Name': 'name', 'ID': 'item_id', 'Count': 'count',
+    'Slots': 'slots', 'UpdatedAt': 'updated_at', 'FileName': 'file_name', 'ItemType': 'item_type',
+    'IsEquipped': 'is_equipped', 'IsEmpty': 'is_empty',
+}
+
+NATURAL_KEY = ['character', 'location', 'name', 'item_id', 'count', 'slots']
+
+_SCHEMA = """
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    character TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE items (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    character TEXT NOT NULL,
+    location TEXT NOT NULL,
+    name TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    slots INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    item_type TEXT NOT NULL,
+    is_equipped INTEGER NOT NULL,
+    is_empty INTEGER NOT NULL,
+    visible INTEGER NOT NULL
+);
+CREATE INDEX items_name ON items (name COLLATE NOCASE);
+CREATE INDEX items_item_id ON items (item_id);
+CREATE INDEX items_character ON items (character COLLATE NOCASE);
+CREATE INDEX items_location ON items (location);
+CREATE INDEX items_path ON items (path);
+CREATE INDEX items_natural_key ON items (character, location, name, item_id, count, slots);
+"""
+
+# Full-text index over the names of non-empty rows, kept in step with items by triggers
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE items_fts USING fts5(name, content='items', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER items_fts_insert AFTER INSERT ON items WHEN NOT new.is_empty BEGIN
+    INSERT INTO items_fts (rowid, name) VALUES (new.id, new.name);
+END;
+CREATE TRIGGER items_fts_delete AFTER DELETE ON items WHEN NOT old.is_empty BEGIN
+    INSERT INTO items_fts (items_fts, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+"""
+
+
+@lru_cache(maxsize=64)
+def _compile_search(pattern: str):
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _regexp(pattern: str, name: Optional[str]) -> bool:
+    """SQLite REGEXP: name contains a match of pattern, case-insensitively (like str.contains)."""
+    return name is not None and _compile_search(pattern).search(name) is not None
+
+
+def _read_rows(file_path: str) -> Optional[List[Tuple]]:
+    """
+    Rows (character, location, name, ID, count, slots) of one inventory file, deduplicated.
+
+    Returns:
+        None if the character name cannot be parsed from the file name
+    """
+    character_rows, shared_bank_rows = StreamedInventory(), StreamedInventory()
+    try:
+        if not read_inventory_file(file_path, character_rows, shared_bank_rows):
+            return None
+    except StreamFormatError:
+        # Quoted fields and the like need the full CSV parser
+        char_name = re.match(r"(.+?)-", os.path.basename(file_path))
+        if not char_name:
+            return None
+        df = pd.read_csv(file_path, sep='\t')
+        character_rows, shared_bank_rows = StreamedInventory(), StreamedInventory()
+        for row in df.itertuples(index=False):
+            location, name = str(row.Location), str(row.Name)
+            values = [int(getattr(row, column, 0)) for column in ('ID', 'Count', 'Slots')]
+            if location.startswith('SharedBank'):
+                shared_bank_rows.append(SHARED_BANK_CHARACTER, location, name, *values)
+            else:
+                character_rows.append(char_name.group(1), location, name, *values)
+
+    character_rows.extend(shared_bank_rows)
+    return list(zip(character_rows.characters, character_rows.locations, character_rows.names,
+                    character_rows.ids, character_rows.counts, character_rows.slots))
+
+
+class SQLiteInventoryStore:
+    """Inventory rows of one directory, kept in a SQLite database."""
+
+    def __init__(self, directory: str, database: Optional[str] = None, timing_hook=None):
+        """
+        Args:
+            directory: Directory containing *-Inventory.txt files
+            database: Database path (default: DATABASE_NAME inside directory)
+            timing_hook: Called with the StageTimings of every ingest (see inventory_timing)
+        """
+        self.directory = directory
+        self.database = database or os.path.join(directory, DATABASE_NAME)
+        self.timing_hook = timing_hook
+        self.connection = sqlite3.connect(self.database)
+        self.connection.create_function('regexp', 2, _regexp, deterministic=True)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        self.fts = self._create_schema()
+
+        # Summary of the last ingest: added, changed and removed paths, characters touched
+        self.last_ingest: Optional[Dict] = None
+
+    def _create_schema(self) -> bool:
+        """Create (or rebuild, after a schema change) the tables. Returns True if FTS5 is available."""
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        has_fts = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'items_fts'").fetchone() is not None
+        if version == SCHEMA_VERSION:
+            return has_fts
+
+        with self.connection:
+            # The database only mirrors the inventory files, so it is simply rebuilt
+            for kind, name in self.connection.execute(
+                    "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'trigger') "
+                    "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE 'items_fts_%'").fetchall():
+                self.connection.execute(f"DROP {kind} IF EXISTS {name}")
+            self.connection.executescript(_SCHEMA)
+            try:
+                self.connection.executescript(_FTS_SCHEMA)
+                has_fts = True
+            except sqlite3.OperationalError as e:
+                print(f"SQLite full-text search unavailable ({e}), searching names with LIKE")
+                has_fts = False
+            self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        return has_fts
+
+    def close(self):
+        self.connection.close()
+
+    def ingest(self, paths: Optional[List[str]] = None) -> Dict:
+        """
+        Bring the database up to date with the inventory files.
+
+        Args:
+            paths: Only check these files (None checks the whole directory)
+
+        Returns:
+            Dict with 'added', 'changed' and 'removed' paths, and 'characters' whose
+            rows changed (including SHARED-BANK when a shared bank did)
+        """
+        timings = StageTimings()
+        stored = {path: (mtime_ns, size) for path, mtime_ns, size in
+                  self.connection.execute('SELECT path, mtime_ns, size FROM files')}
+
+        with timings.stage('glob'):
+            if paths is None:
+                candidates = find_inventory_files(self.directory)
+                removed = sorted(set(stored) - set(candidates))
+            else:
+                candidates = sorted({os.path.join(self.directory, os.path.basename(path)) for path in paths})
+                removed = [path for path in candidates if path in stored and not os.path.isfile(path)]
+                candidates = [path for path in candidates if os.path.isfile(path)]
+
+        added, changed, parsed = [], [], {}
+        with timings.stage('parse'):
+            for path in candidates:
+                try:
+                    stat = os.stat(path)
+                    if stored.get(path) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    rows = _read_rows(path)
+                except (OSError, UnicodeDecodeError, ValueError, pd.errors.ParserError) as e:
+                    print(f"Error processing {path}: {e}")
+                    continue
+                if rows is None:
+                    continue
+                (changed if path in stored else added).append(path)
+                parsed[path] = (stat, rows)
+        timings.count('parse', len(parsed), 'files')
+
+        characters = set()
+        with self.connection:
+            with timings.stage('delete'):
+                for path in removed + changed:
+                    characters.update(self._delete_file(path))
+                self.connection.executemany('DELETE FROM files WHERE path = ?', [(path,) for path in removed])
+
+            with timings.stage('insert'):
+                for path, (stat, rows) in parsed.items():
+                    characters.update(self._insert_file(path, stat, rows))
+                    timings.count('insert', len(rows))
+
+        report_load_timings(timings, self.directory, self.timing_hook)
+        self.last_ingest = {'added': added, 'changed': changed, 'removed': removed,
+                            'characters': sorted(characters), 'timings': timings}
+        return self.last_ingest
+
+    def _delete_file(self, path: str) -> set:
+        """Delete the rows of one file, promoting the next copy of any visible row. Returns its characters."""
+        characters = {character for character, in self.connection.execute(
+            'SELECT DISTINCT character FROM items WHERE path = ?', (path,))}
+        freed = self.connection.execute(
+            f"SELECT DISTINCT {', '.join(NATURAL_KEY)} FROM items WHERE path = ? AND visible", (path,)).fetchall()
+        self.connection.execute('DELETE FROM items WHERE path = ?', (path,))
+        self.connection.executemany(
+            f"UPDATE items SET visible = 1 WHERE id = (SELECT MIN(id) FROM items WHERE "
+            f"{' AND '.join(f'{column} = ?' for column in NATURAL_KEY)})", freed)
+        return characters
+
+    def _insert_file(self, path: str, stat: os.stat_result, rows: List[Tuple]) -> set:
+        """Insert the rows of one file; a row is visible unless an identical one already is."""
+        file_name = os.path.basename(path)
+        updated_at = datetime.fromtimestamp(stat.st_mtime).isoformat(sep=' ')
+        item_types, worn = {}, {}
+        for location in {row[1] for row in rows}:
+            item_types[location] = categorize_location(location)
+            worn[location] = int(is_worn_location(location))
+
+        self.connection.executemany(
+            f"INSERT INTO items (path, character, location, name, item_id, count, slots, updated_at, file_name, "
+            f"item_type, is_equipped, is_empty, visible) "
+            f"SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NOT EXISTS (SELECT 1 FROM items WHERE "
+            f"{' AND '.join(f'{column} = ?' for column in NATURAL_KEY)} AND visible)",
+            ((path, *row, updated_at, file_name, item_types[row[1]], worn[row[1]], int(row[2] == 'Empty'), *row)
+             for row in rows))
+
+        character = re.match(r"(.+?)-", file_name).group(1)
+        self.connection.execute('INSERT OR REPLACE INTO files (path, character, mtime_ns, size) VALUES (?, ?, ?, ?)',
+                                (path, character, stat.st_mtime_ns, stat.st_size))
+        return {row[0] for row in rows}
+
+    def row_counts(self) -> Tuple[int, int, int]:
+        """Visible (characters, rows, non-empty rows)."""
+        return self.connection.execute(
+            'SELECT COUNT(DISTINCT character), COUNT(*), COALESCE(SUM(NOT is_empty), 0) FROM items WHERE visible'
+        ).fetchone()
+
+    def search(self, search_term: str, character: Optional[str] = None, exact_match: bool = False,
+               item_type: Optional[str] = None) -> pd.DataFrame:
+        """
+        Non-empty rows whose name contains search_term, as the monitor's search_items returns them.
+
+        Args:
+            search_term: Case-insensitive regex (a plain substring uses the full-text index)
+            character: Only this character (case-insensitive)
+            exact_match: Match the whole name (case-insensitive) instead
+            item_type: Only this item type ('Equipped', 'Inventory', 'Bank')
+
+        Raises:
+            re.error: if search_term is not a valid regular expression
+        """
+        conditions, params = ['visible', 'NOT is_empty'], []
+        if exact_match:
+            conditions.append('name = ? COLLATE NOCASE')
+            params.append(search_term)
+        elif not is_literal_term(search_term):
+            _compile_search(search_term)  # Raise bad patterns here rather than inside SQLite
+            # Case variants of a name match alike, so one test per group of the NOCASE name index
+            conditions.append('name COLLATE NOCASE IN '
+                              '(SELECT name FROM items GROUP BY name COLLATE NOCASE HAVING name REGEXP ?)')
+            params.append(search_term)
+        elif self.fts and len(search_term) >= FTS_MIN_TERM_LENGTH:
+            conditions.append('id IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)')
+            params.append('"' + search_term.replace('"', '""') + '"')
+        else:
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params.append('%' + re.sub(r'([\\%_])', r'\\\1', search_term) + '%')
+
+        if character:
+            conditions.append('character = ? COLLATE NOCASE')
+            params.append(character)
+        if item_type:
+            conditions.append('item_type = ? COLLATE NOCASE')
+            params.append(item_type)
+
+        columns = ', '.join(COLUMN_NAMES[column] for column in RESULT_COLUMNS)
+        rows = self.connection.execute(
+            f"SELECT {columns} FROM items WHERE {' AND '.join(conditions)} ORDER BY character, name, id", params)
+        return pd.DataFrame(rows.fetchall(), columns=RESULT_COLUMNS)
+
+    def find_duplicates(self, min_count: int = 2, mode: str = 'name_id') -> pd.DataFrame:
+        """
+        Rows of every item group occurring at least min_count times, most frequent first.
+
+        Args:
+            min_count: Minimum occurrences for a group to count as duplicated
+            mode: 'name_id', 'id', 'name', or 'cross_character' (see inventory_duplicates)
+
+        Returns:
+            DataFrame with Character, Name, Location, Count and TotalFound columns
+        """
+        if mode not in DUPLICATE_KEYS:
+            raise ValueError(f"Unknown duplicate mode: {mode}")
+        keys = ', '.join(COLUMN_NAMES[column] for column in DUPLICATE_KEYS[mode])
+
+        # Group sizes as window functions, so the rows are read once (no join back to the groups)
+        item_rows = "SELECT id, character, name, location, count, item_id FROM items WHERE visible AND NOT is_empty"
+        if mode == 'cross_character':
+            # Window functions cannot count distinct values: count each character's first row instead
+            item_rows = (f"SELECT *, ROW_NUMBER() OVER (PARTITION BY {keys}, character) AS character_row "
+                         f"FROM ({item_rows})")
+            total = f"SUM(character_row = 1) OVER (PARTITION BY {keys})"
+        else:
+            total = f"COUNT(*) OVER (PARTITION BY {keys})"
+
+        rows = self.connection.execute(
+            f"SELECT character, name, location, count, total FROM "
+            f"(SELECT *, {total} AS total FROM ({item_rows})) "
+            f"WHERE total >= ? ORDER BY total DESC, {keys}, id", (min_count,))
+        return pd.DataFrame(rows.fetchall(), columns=['Character', 'Name', 'Location', 'Count', 'TotalFound'])
+
+    def character_info(self, characters: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Item count, first file and last update of each character (or only of characters).
+
+        Returns:
+            DataFrame with Character, ItemCount, FileName and LastUpdated columns, sorted by
+            ItemCount (descending) and Character
+        """
+        condition, params = '', []
+        if characters is not None:
+            condition = f"AND character IN ({', '.join('?' * len(characters))})"
+            params = list(characters)
+        rows = self.connection.execute(
+            f"SELECT summary.character, item_count, first.file_name, last_updated FROM "
+            f"(SELECT character, SUM(NOT is_empty) AS item_count, MIN(id) AS first_id, "
+            f"substr(MAX(updated_at), 1, 16) AS last_updated FROM items WHERE visible {condition} "
+            f"GROUP BY character) summary JOIN items first ON first.id = summary.first_id "
+            f"ORDER BY item_count DESC, summary.character", params)
+        return pd.DataFrame(rows.fetchall(), columns=['Character', 'ItemCount', 'FileName', 'LastUpdated'])
+
+    def character_summary(self, character_name: str) -> Dict:
+        """Item counts of one character, as the monitor's get_character_summary returns them."""
+        total, equipped, inventory, bank, last_updated, unique_items = self.connection.execute(
+            "SELECT COUNT(*), SUM(item_type = 'Equipped'), SUM(item_type = 'Inventory'), SUM(item_type = 'Bank'), "
+            "substr(MAX(updated_at), 1, 16), COUNT(DISTINCT name) FROM items "
+            "WHERE visible AND NOT is_empty AND character = ? COLLATE NOCASE", (character_name,)).fetchone()
+        if not total:
+            return {'error': f"Character '{character_name}' not found"}
+        return {
+            'character': character_name,
+            'total_items': total,
+            'equipped_items': equipped,
+            'inventory_items': inventory,
+            'bank_items': bank,
+            'last_updated': last_updated,
+            'unique_items': unique_items
+        }
+
+    def character_items(self, character_name: str) -> pd.DataFrame:
+        """Non-empty items of one character (Name, Location, ItemType, Count), by item type and name."""
+        rows = self.connection.execute(
+            "SELECT name, location, item_type, count FROM items WHERE visible AND NOT is_empty "
+            "AND character = ? COLLATE NOCASE ORDER BY item_type, name, id", (character_name,))
+        return pd.DataFrame(rows.fetchall(), columns=['Name', 'Location', 'ItemType', 'Count'])
+
+    def items_frame(self, non_empty: bool = False) -> pd.DataFrame:
+        """All visible rows as an items DataFrame (loads everything into memory)."""
+        columns = ', '.join(COLUMN_NAMES.values())
+        condition = 'AND NOT is_empty' if non_empty else ''
+        rows = self.connection.execute(f"SELECT {columns} FROM items WHERE visible {condition} ORDER BY id")
+        df = pd.DataFrame(rows.fetchall(), columns=list(COLUMN_NAMES))
+        df['UpdatedAt'] = pd.to_datetime(df['UpdatedAt'])
+        for column in ('IsEquipped', 'IsEmpty'):
+            df[column] = df[column].astype(bool)
+        return df
+
+    def export_csv(self, filename: str) -> int:
+        """Write every visible row to a CSV file without loading them all. Returns the row count."""
+        written = 0
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(list(COLUMN_NAMES))
+            for row in self.connection.execute(f"SELECT {', '.join(COLUMN_NAMES.values())} FROM items "
+                                               f"WHERE visible ORDER BY id"):
+                writer.writerow(row[:9] + (bool(row[9]), bool(row[10])))
+                written += 1
+        return written
@@ -0,0 +1,215 @@
+"""
+Inventory Stream
+Pandas-free reader for *-Inventory.txt files, used by one-shot command-line searches.
+
+Each file is read line by line into compact columns: array('i') for ID, Count and Slots,
+and interned strings for characters, locations and names, so a name repeated across
+thousands of slots is stored once. Rows are deduplicated on the same natural key as the
+DataFrame loader (with shared bank rows kept once per distinct row), so a search over
+these columns returns the same rows as the pandas path without importing pandas.
+
+The row-level location rules (categorize_location, is_worn_location) live here for the
+same reason; inventory_locations re-exports them next to its column-level versions.
+"""
+
+import glob
+import os
+import re
+import sys
+from array import array
+from typing import Dict, List, Tuple
+
+
+INVENTORY_FILE_PATTERN = "*-Inventory.txt"
+SHARED_BANK_CHARACTER = 'SHARED-BANK'
+
+# Output columns of a search, as in the monitor's search_items
+RESULT_COLUMNS = ['Character', 'Name', 'Location', 'ItemType', 'Count', 'ID']
+
+_INTEGER_COLUMNS = ('ID', 'Count', 'Slots')
+
+EQUIPPED_LOCATIONS = ['charm', 'ear', 'head', 'face', 'neck', 'shoulders', 'arms', 'wrist',
+                      'hands', 'finger', 'chest', 'legs', 'feet', 'waist', 'primary',
+                      'secondary', 'range', 'ammo']
+
+
+class StreamFormatError(ValueError):
+    """A file uses something the streaming parser does not handle (quoting, non-integer numbers)."""
+
+
+def find_inventory_files(directory: str) -> List[str]:
+    """Return the inventory files in a directory, sorted so every load merges in the same order."""
+    pattern = os.path.join(directory, INVENTORY_FILE_PATTERN)
+    return sorted(glob.glob(pattern))
+
+
+def categorize_location(location) -> str:
+    """Categorize item location."""
+    location = str(location).lower()
+
+    if 'bank' in location:
+        return 'Bank'
+    elif 'bag' in location or 'slot' in location:
+        return 'Inventory'
+    elif location in EQUIPPED_LOCATIONS:
+        return 'Equipped'
+    else:
+        return 'Other'
+
+
+def is_worn_location(location) -> bool:
+    """True for locations outside bags and banks (the IsEquipped column)."""
+    return not any(word in str(location) for word in ['Slot', 'Bank', 'Bag'])
+
+
+def _parse_int(value: str, column: str, file_path: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise StreamFormatError(f"{os.path.basename(file_path)}: {column} value {value!r} is not an integer")
+
+
+class StreamedInventory:
+    """Inventory rows held as parallel compact columns."""
+
+    def __init__(self):
+        self.characters: List[str] = []
+        self.locations: List[str] = []
+        self.names: List[str] = []
+        self.ids = array('i')
+        self.counts = array('i')
+        self.slots = array('i')
+        self._seen = set()  # Natural keys already stored
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, character: str, location: str, name: str, item_id: int, count: int, slots: int) -> bool:
+        """Store a row unless an identical one is already stored. Returns True if it was stored."""
+        key = (character, location, name, item_id, count, slots)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+
+        self.characters.append(character)
+        self.locations.append(location)
+        self.names.append(name)
+        self.ids.append(item_id)
+        self.counts.append(count)
+        self.slots.append(slots)
+        return True
+
+    def extend(self, other: 'StreamedInventory') -> int:
+        """Append the rows of other, skipping duplicates. Returns the number of duplicates skipped."""
+        skipped = 0
+        for i in range(len(other)):
+            if not self.append(other.characters[i], other.locations[i], other.names[i],
+                               other.ids[i], other.counts[i], other.slots[i]):
+                skipped += 1
+        return skipped
+
+    def matching_positions(self, search_term: str) -> List[int]:
+        """
+        Positions of non-empty rows whose name contains search_term.
+
+        search_term is a case-insensitive regular expression, like str.contains in the
+        pandas path. Each distinct name is tested once.
+        """
+        pattern = re.compile(search_term, re.IGNORECASE)
+        name_matches: Dict[str, bool] = {}
+        positions = []
+        for i, name in enumerate(self.names):
+            matched = name_matches.get(name)
+            if matched is None:
+                matched = name_matches[name] = bool(name) and name != 'Empty' and pattern.search(name) is not None
+            if matched:
+                positions.append(i)
+        return positions
+
+    def result_rows(self, positions: List[int]) -> List[Tuple]:
+        """RESULT_COLUMNS tuples for positions, sorted by character and name."""
+        item_types: Dict[str, str] = {}
+        rows = []
+        for i in positions:
+            location = self.locations[i]
+            if location not in item_types:
+                item_types[location] = categorize_location(location)
+            rows.append((self.characters[i], self.names[i], location, item_types[location],
+                         self.counts[i], self.ids[i]))
+        rows.sort(key=lambda row: (row[0], row[1]))
+        return rows
+
+
+def read_inventory_file(file_path: str, character_rows: StreamedInventory,
+                        shared_bank_rows: StreamedInventory) -> bool:
+    """
+    Stream one inventory file into character_rows and shared_bank_rows.
+
+    Returns:
+        False if the character name cannot be parsed from the file name
+
+    Raises:
+        StreamFormatError: if the file needs the full CSV parser
+    """
+    file_name = os.path.basename(file_path)
+    match = re.match(r"(.+?)-", file_name)
+    if not match:
+        return False
+    char_name = sys.intern(match.group(1))
+
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        header = f.readline().rstrip('\r\n').split('\t')
+        try:
+            location_col, name_col = header.index('Location'), header.index('Name')
+        except ValueError:
+            raise StreamFormatError(f"{file_name}: missing Location or Name column")
+        number_cols = [(column, header.index(column) if column in header else None) for column in _INTEGER_COLUMNS]
+
+        for line in f:
+            line = line.rstrip('\r\n')
+            if not line:
+                continue
+            if '"' in line:
+                raise StreamFormatError(f"{file_name}: quoted fields")
+            fields = line.split('\t')
+            if len(fields) != len(header):
+                raise StreamFormatError(f"{file_name}: expected {len(header)} fields, got {len(fields)}")
+
+            location = sys.intern(fields[location_col])
+            name = sys.intern(fields[name_col])
+            item_id, count, slots = (_parse_int(fields[col], column, file_path) if col is not None else 0
+                                     for column, col in number_cols)
+
+            if location.startswith('SharedBank'):
+                shared_bank_rows.append(SHARED_BANK_CHARACTER, location, name, item_id, count, slots)
+            else:
+                character_rows.append(char_name, location, name, item_id, count, slots)
+    return True
+
+
+def read_inventory_directory(directory: str) -> StreamedInventory:
+    """
+    Stream every inventory file in directory.
+
+    Character rows come first in file order, then each distinct shared bank row once,
+    matching the row order of the DataFrame loader in 'rows' shared bank mode.
+    """
+    character_rows = StreamedInventory()
+    shared_bank_rows = StreamedInventory()
+    for file_path in find_inventory_files(directory):
+        try:
+            read_inventory_file(file_path, character_rows, shared_bank_rows)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error processing {file_path}: {e}")
+
+    character_rows.extend(shared_bank_rows)
+    return character_rows
+
+
+def format_table(columns: List[str], rows: List[Tuple]) -> str:
+    """Right-aligned plain-text table, laid out like DataFrame.to_string(index=False)."""
+    cells = [[str(value) for value in row] for row in rows]
+    widths = [max([len(column)] + [len(row[i]) for row in cells]) for i, column in enumerate(columns)]
+    lines = [' '.join(column.rjust(width) for column, width in zip(columns, widths))]
+    lines.extend(' '.join(value.rjust(width) for value, width in zip(row, widths)) for row in cells)
+    return '\n'.join(lines)
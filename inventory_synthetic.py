@@ -0,0 +1,228 @@
+"""
+Inventory Synthetic
+Writes seeded, realistic *-Inventory.txt folders for tests and benchmarks.
+
+Every character gets worn gear with augment slots, ten General slots and twenty-four
+Bank slots holding bags (with -Slot nesting, spare gear inside bags carries its own
+augments) and the shared bank of its account. Characters are grouped into accounts, and
+every character of an account writes the same shared bank block, except for a few
+stale exports that still show an older copy. Fragments of Truth, the Zeb weapon
+components and Signet of Might quest items are scattered through bags and augment slots.
+
+Each character and account draws from its own random stream, so the first ten
+characters of a 1,000 character folder are the same as those of a 10 character folder.
+
+Usage:
+    python inventory_synthetic.py OUTPUT_DIR --characters 1000 --seed 0
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from signet_of_might_data import SignetOfMightQuest
+
+
+HEADER = "Location\tName\tID\tCount\tSlots\n"
+
+# Worn slots in the order the client writes them
+WORN_SLOTS = ['Charm', 'Ear', 'Head', 'Face', 'Ear', 'Neck', 'Shoulders', 'Arms', 'Back', 'Wrist', 'Wrist',
+              'Range', 'Hands', 'Primary', 'Secondary', 'Finger', 'Finger', 'Chest', 'Legs', 'Feet', 'Waist',
+              'Power Source', 'Ammo']
+GENERAL_SLOTS = 10
+BANK_SLOTS = 24
+SHARED_BANK_SLOTS = 2
+
+FRAGMENT_OF_TRUTH_TYPES = ['Akhevan', 'Fiery', 'Gelid', 'Hastened', 'Healing', 'Icy', 'Lethal', 'Magical',
+                           'Replenishing', 'Runic', 'Ssraeshzian', 'Yttrium']
+ZEB_COMPONENTS = ['Time Phased Quintessence', 'Vortex of the Past']
+
+_GEAR_PREFIXES = ['Ancient', 'Runed', 'Gleaming', 'Shadowed', 'Frostforged', 'Ethereal', 'Dragonscale', 'Jade',
+                  'Stormborn', 'Gilded']
+_GEAR_NOUNS = {
+    'Charm': 'Charm', 'Ear': 'Earring', 'Head': 'Helm', 'Face': 'Mask', 'Neck': 'Amulet',
+    'Shoulders': 'Pauldrons', 'Arms': 'Vambraces', 'Back': 'Cloak', 'Wrist': 'Bracer', 'Range': 'Longbow',
+    'Hands': 'Gauntlets', 'Primary': 'Blade', 'Secondary': 'Shield', 'Finger': 'Ring', 'Chest': 'Breastplate',
+    'Legs': 'Greaves', 'Feet': 'Boots', 'Waist': 'Girdle', 'Power Source': 'Power Source', 'Ammo': 'Arrows',
+}
+_AUGMENTS = ['Stone of Flowing Thought', 'Ornate Mithril Augment', 'Glowing Rune of Warding',
+             'Shard of Celestial Fury', 'Polished Ember Stone']
+_COMMON_ITEMS = [('Mana Potion', 20), ('Distillate of Healing', 20), ('Bread', 20), ('Iron Ration', 20),
+                 ('Bone Chips', 1000), ('Peridot', 100), ('Emerald', 100), ('Spider Silk', 1000), ('Pearl', 100),
+                 ('Small Brick of Velium', 100), ('Large Brick of Velium', 100), ('Celestial Essence', 20),
+                 ('Tiny Dagger', 1), ('Rusty Long Sword', 1), ('Tattered Cloth Sandal', 1)]
+_SPELLS = ['Fireball', 'Complete Heal', 'Gate', 'Clarity', 'Spirit of Wolf', 'Invisibility', 'Levitate', 'Root',
+           'Snare', 'Mesmerize']
+_BAGS = [('Backpack', 8), ('Large Bag', 10), ('Extraplanar Trade Satchel', 10), ('Bazaar Bag', 10),
+         ('Large Sewing Kit', 10), ('Deluxe Toolbox', 10)]
+
+# Chance that a character's export still has the account's previous shared bank
+STALE_SHARED_BANK_RATE = 0.1
+
+
+class _Catalog:
+    """Item names with stable IDs, shared by every generated file."""
+
+    def __init__(self):
+        self.gear: Dict[str, List[str]] = {
+            slot: [f"{prefix} {noun}" for prefix in _GEAR_PREFIXES] for slot, noun in _GEAR_NOUNS.items()
+        }
+        self.fragments = [f"{kind} Fragment of Truth ({grade})"
+                          for kind in FRAGMENT_OF_TRUTH_TYPES for grade in ('Enchanted', 'Legendary')]
+        self.quest_items = sorted(SignetOfMightQuest().get_all_unique_items())
+        self.stackables = _COMMON_ITEMS + [(name, 20) for name in self.quest_items + ZEB_COMPONENTS]
+        self.spells = [f"Spell: {spell}" for spell in _SPELLS]
+
+        names = [name for slot in self.gear.values() for name in slot]
+        names += _AUGMENTS + self.fragments + [name for name, _ in self.stackables] + self.spells
+        names += [name for name, _ in _BAGS]
+        self.ids = {}
+        for name in names:
+            self.ids.setdefault(name, 10000 + len(self.ids))
+
+
+def _row(location: str, name: str, item_id: int, count: int, slots: int) -> str:
+    return f"{location}\t{name}\t{item_id}\t{count}\t{slots}\n"
+
+
+def _empty(location: str) -> str:
+    return _row(location, 'Empty', 0, 0, 0)
+
+
+def _gear(location: str, slot: str, rng: random.Random, catalog: _Catalog) -> List[str]:
+    """A piece of gear with its augment slots (location-Slot1, location-Slot2, ...)."""
+    name = rng.choice(catalog.gear[slot])
+    rows = [_row(location, name, catalog.ids[name], 1, 0)]
+    for aug_slot in range(1, rng.randint(1, 3) + 1):
+        aug_location = f"{location}-Slot{aug_slot}"
+        if rng.random() < 0.5:
+            augment = rng.choice(catalog.fragments if rng.random() < 0.3 else _AUGMENTS)
+            rows.append(_row(aug_location, augment, catalog.ids[augment], 1, 0))
+        else:
+            rows.append(_empty(aug_location))
+    return rows
+
+
+def _loose_item(location: str, rng: random.Random, catalog: _Catalog) -> List[str]:
+    """Anything that can sit in a bag slot: stacks, spells, fragments or spare gear."""
+    roll = rng.random()
+    if roll < 0.55:
+        name, max_stack = rng.choice(catalog.stackables)
+        return [_row(location, name, catalog.ids[name], rng.randint(1, max_stack), 0)]
+    if roll < 0.7:
+        name = rng.choice(catalog.spells)
+    elif roll < 0.85:
+        name = rng.choice(catalog.fragments)
+    else:
+        return _gear(location, rng.choice(WORN_SLOTS), rng, catalog)
+    return [_row(location, name, catalog.ids[name], 1, 0)]
+
+
+def _container_slot(location: str, rng: random.Random, catalog: _Catalog, fill: float) -> List[str]:
+    """A General, Bank or SharedBank slot: usually a bag with its contents, sometimes one item."""
+    roll = rng.random()
+    if roll < 0.8:
+        bag, capacity = rng.choice(_BAGS)
+        rows = [_row(location, bag, catalog.ids[bag], 1, capacity)]
+        for bag_slot in range(1, capacity + 1):
+            slot_location = f"{location}-Slot{bag_slot}"
+            rows.extend(_loose_item(slot_location, rng, catalog) if rng.random() < fill else [_empty(slot_location)])
+        return rows
+    if roll < 0.9:
+        return _loose_item(location, rng, catalog)
+    return [_empty(location)]
+
+
+def _shared_bank_block(rng: random.Random, catalog: _Catalog) -> str:
+    rows = []
+    for slot in range(1, SHARED_BANK_SLOTS + 1):
+        rows.extend(_container_slot(f"SharedBank{slot}", rng, catalog, fill=0.7))
+    return ''.join(rows)
+
+
+def _character_rows(rng: random.Random, catalog: _Catalog) -> str:
+    rows = []
+    for slot in WORN_SLOTS:
+        rows.extend(_gear(slot, slot, rng, catalog) if rng.random() < 0.9 else [_empty(slot)])
+    for slot in range(1, GENERAL_SLOTS + 1):
+        rows.extend(_container_slot(f"General{slot}", rng, catalog, fill=0.6))
+    for slot in range(1, BANK_SLOTS + 1):
+        rows.extend(_container_slot(f"Bank{slot}", rng, catalog, fill=0.5))
+    return ''.join(rows)
+
+
+def character_names(count: int, seed: int = 0) -> List[str]:
+    """count distinct, pronounceable character names."""
+    syllables = ['ar', 'bel', 'cor', 'dra', 'el', 'fen', 'gor', 'hal', 'is', 'jor', 'kal', 'lor', 'mir', 'nor',
+                 'or', 'pel', 'quin', 'ran', 'sil', 'tor', 'ul', 'val', 'wyn', 'xan', 'yor', 'zel']
+    rng = random.Random(f"{seed}-names")
+    names, seen = [], set()
+    while len(names) < count:
+        name = ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize()
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def generate_inventory_directory(directory: str, characters: int, seed: int = 0,
+                                 characters_per_account: int = 6) -> List[str]:
+    """
+    Write a folder of synthetic inventory exports.
+
+    Args:
+        directory: Output directory (created if missing)
+        characters: Number of *-Inventory.txt files to write
+        seed: Seed for names, contents and export times
+        characters_per_account: Characters sharing one shared bank
+
+    Returns:
+        Paths of the written files
+    """
+    os.makedirs(directory, exist_ok=True)
+    catalog = _Catalog()
+    now = time.time()
+
+    account_banks: Dict[int, Tuple[str, str]] = {}
+    file_paths = []
+    for index, name in enumerate(character_names(characters, seed)):
+        account = index // characters_per_account
+        if account not in account_banks:
+            account_rng = random.Random(f"{seed}-account-{account}")
+            account_banks[account] = (_shared_bank_block(account_rng, catalog), _shared_bank_block(account_rng, catalog))
+        current_bank, stale_bank = account_banks[account]
+
+        rng = random.Random(f"{seed}-character-{index}")
+        shared_bank = stale_bank if rng.random() < STALE_SHARED_BANK_RATE else current_bank
+        file_path = os.path.join(directory, f"{name}-Inventory.txt")
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(HEADER)
+            f.write(_character_rows(rng, catalog))
+            f.write(shared_bank)
+
+        # Spread the exports over the last month
+        exported_at = now - rng.uniform(0, 30 * 24 * 3600)
+        os.utime(file_path, (exported_at, exported_at))
+        file_paths.append(file_path)
+    return file_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic EverQuest inventory folder')
+    parser.add_argument('directory', help='Output directory')
+    parser.add_argument('-n', '--characters', type=int, default=100, help='Number of characters (default: 100)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--per-account', type=int, default=6,
+                        help='Characters sharing one shared bank (default: 6)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    file_paths = generate_inventory_directory(args.directory, args.characters, args.seed, args.per_account)
+    print(f"Wrote {len(file_paths)} inventory files to {args.directory} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Inventory Watch
+Notices new, re-exported and deleted *-Inventory.txt files in an inventory directory.
+
+On Linux the directory is watched with inotify (through libc, no extra package), so an
+idle watch costs nothing. Elsewhere, or when inotify cannot be set up, the directory
+is polled: one scandir per interval, comparing each inventory file's mtime and size.
+
+Changes are reported once the directory has been quiet for a short settle time, so a
+client still writing a file (or several characters exporting back to back) produces a
+single callback with every changed path. The callback runs on the watcher thread.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from inventory_stream import INVENTORY_FILE_PATTERN
+
+
+WATCH_BACKENDS = ('auto', 'inotify', 'poll')
+
+# inotify event bits (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_DELETE
+
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+def is_inventory_file_name(file_name: str) -> bool:
+    """True for file names the loader picks up (hidden files excluded, as glob does)."""
+    return not file_name.startswith('.') and fnmatch.fnmatch(file_name, INVENTORY_FILE_PATTERN)
+
+
+class _InotifySource:
+    """Reports inventory files closed after writing, moved in or out, or deleted."""
+
+    def __init__(self, directory: str):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.directory = directory
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"Cannot watch {directory}")
+
+    def read(self, timeout: float) -> Optional[Set[str]]:
+        """
+        Wait up to timeout seconds for events.
+
+        Returns:
+            Changed inventory file paths, or None if the kernel dropped events and the
+            whole directory has to be checked
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            _, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_length].rstrip(b'\0'))
+            offset += name_length
+
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            if name and is_inventory_file_name(name):
+                changed.add(os.path.join(self.directory, name))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _PollSource:
+    """Reports inventory files whose mtime or size changed, or which appeared or disappeared."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not is_inventory_file_name(entry.name):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue  # Deleted between listing and stat
+                    snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError as e:
+            print(f"Error scanning {self.directory}: {e}")
+            return self.snapshot
+        return snapshot
+
+    def read(self, timeout: float) -> Optional[Set[str]]:
+        """Rescan the directory (the caller waits between calls). Returns the changed paths."""
+        snapshot = self._scan()
+        changed = {path for path, state in snapshot.items() if self.snapshot.get(path) != state}
+        changed.update(path for path in self.snapshot if path not in snapshot)
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+class InventoryWatcher:
+    """Calls on_change with the inventory files that changed in a directory."""
+
+    def __init__(self, directory: str, on_change: Callable[[Optional[List[str]]], None],
+                 backend: str = 'auto', interval: float = 1.0, settle: float = 0.5):
+        """
+        Args:
+            directory: Directory containing *-Inventory.txt files
+            on_change: Called on the watcher thread with the sorted changed paths, or with
+                       None when every file has to be checked (inotify queue overflow)
+            backend: 'inotify', 'poll', or 'auto' (inotify where available, else polling)
+            interval: Seconds between polls (and the longest stop() waits)
+            settle: Seconds without further changes before on_change is called
+        """
+        if backend not in WATCH_BACKENDS:
+            raise ValueError(f"Unknown watch backend: {backend} (expected one of {', '.join(WATCH_BACKENDS)})")
+        self.directory = directory
+        self.on_change = on_change
+        self.interval = interval
+        self.settle = settle
+        self.source = self._open_source(backend)
+        self.backend = 'inotify' if isinstance(self.source, _InotifySource) else 'poll'
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _open_source(self, backend: str):
+        if backend != 'poll' and sys.platform.startswith('linux'):
+            try:
+                return _InotifySource(self.directory)
+            except (OSError, AttributeError) as e:
+                if backend == 'inotify':
+                    raise
+                print(f"inotify unavailable ({e}), polling {self.directory} instead")
+        elif backend == 'inotify':
+            raise OSError(f"inotify is not available on {sys.platform}")
+        return _PollSource(self.directory)
+
+    def start(self) -> 'InventoryWatcher':
+        """Start watching on a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name='inventory-watch', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching. Changes not yet reported are dropped."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._thread is None:
+            self.source.close()  # Never started, so _run will not close it
+        elif self._thread is not threading.current_thread():
+            self._thread.join(self.interval + self.settle + 1)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        pending: Set[str] = set()
+        rescan = False
+        last_change = 0.0
+        try:
+            while not self._stop.is_set():
+                waiting = pending or rescan
+                timeout = min(self.interval, self.settle) if waiting else self.interval
+                if self.backend == 'poll':
+                    if self._stop.wait(timeout):
+                        break
+                    changed = self.source.read(0)
+                else:
+                    changed = self.source.read(timeout)
+
+                now = time.monotonic()
+                if changed is None:
+                    rescan = True
+                    last_change = now
+                elif changed:
+                    pending.update(changed)
+                    last_change = now
+
+                if (pending or rescan) and now - last_change >= self.settle and not self._stop.is_set():
+                    paths = None if rescan else sorted(pending)
+                    pending, rescan = set(), False
+                    try:
+                        self.on_change(paths)
+                    except Exception as e:
+                        print(f"Error handling inventory changes: {e}")
+        finally:
+            self.source.close()
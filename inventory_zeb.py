@@ -0,0 +1,164 @@
+"""
+Inventory Zeb
+Zeb weapon components: which Fragment of Truth tiers and other components an inventory holds.
+
+A Zeb weapon needs every required fragment, either as a Legendary or as four Enchanted
+to combine into one, plus each of the other components. Only items loose in containers
+count toward crafting unless equipped items are included; fragments augmented into worn
+or spare gear are reported separately.
+"""
+
+from typing import Dict, List
+
+import pandas as pd
+
+from inventory_catalog import ItemCatalog
+from inventory_locations import equipped_location_mask
+
+# Components checked by Check Zeb Weapon Components
+ZEB_REQUIRED_FRAGMENTS = [
+    "Akhevan Fragment of Truth",
+    "Fiery Fragment of Truth",
+    "Gelid Fragment of Truth",
+    "Hastened Fragment of Truth",
+    "Healing Fragment of Truth",
+    "Icy Fragment of Truth",
+    "Lethal Fragment of Truth",
+    "Magical Fragment of Truth",
+    "Replenishing Fragment of Truth",
+    "Runic Fragment of Truth",
+    "Ssraeshzian Fragment of Truth",
+    "Yttrium Fragment of Truth"
+]
+
+ZEB_OTHER_COMPONENTS = [
+    "Time Phased Quintessence",
+    "Vortex of the Past"
+]
+
+
+def analyze_zeb_components(items_df: pd.DataFrame, item_catalog: ItemCatalog,
+                           required_fragments: List[str] = ZEB_REQUIRED_FRAGMENTS,
+                           other_components: List[str] = ZEB_OTHER_COMPONENTS,
+                           include_equipped: bool = False) -> Dict:
+    """
+    Analyze inventory for Zeb weapon components.
+
+    Args:
+        items_df: Loaded items DataFrame
+        item_catalog: ItemCatalog of items_df
+        required_fragments: Fragment base names, each needed as a Legendary or four Enchanted
+        other_components: Other items needed at least once
+        include_equipped: Count fragments augmented into gear as available
+
+    Returns:
+        Dict with per-fragment and per-component counts, what is missing and 'can_make_weapon'
+    """
+    # Get all non-empty items
+    all_non_empty_items = items_df[items_df['IsEmpty'] == False]
+
+    # Define what constitutes "available" (not equipped) items
+    if not include_equipped:
+        # Available = items that are loose in containers (not augmented into any gear)
+        # Equipped = items that are augmented into gear (worn OR spare)
+        # Location decomposition columns are computed at load time (see equipped_location_mask)
+        is_equipped_location = equipped_location_mask(all_non_empty_items)
+    else:
+        # If including equipped, all non-empty items are "available"
+        is_equipped_location = pd.Series(False, index=all_non_empty_items.index)
+
+    # Debug output - let's see what we're working with
+    available_count = int((~is_equipped_location).sum())
+    print(f"Debug: Total non-empty items: {len(all_non_empty_items)}")
+    print(f"Debug: Available items: {available_count}")
+    if not include_equipped:
+        equipped_count = int(is_equipped_location.sum())
+        print(f"Debug: Equipped items: {equipped_count}")
+        print(f"Debug: Sample available locations: {all_non_empty_items.loc[~is_equipped_location, 'Location'].head(10).tolist()}")
+        if equipped_count > 0:
+            print(f"Debug: Sample equipped locations: {all_non_empty_items.loc[is_equipped_location, 'Location'].head(10).tolist()}")
+
+    # Resolve every fragment tier and component to its item IDs, then count them by equipped state in one pass
+    patterns = []
+    for fragment_base in required_fragments:
+        patterns += [f"{fragment_base} (Legendary)", f"{fragment_base} (Enchanted)"]
+    patterns += list(other_components)
+    requirement_ids = item_catalog.requirement_table(patterns, regex=False)
+    counts = item_catalog.count(all_non_empty_items, requirement_ids, groups=is_equipped_location)
+    counts = counts.reindex(columns=[False, True], fill_value=0)
+    available_counts = counts[False]
+    equipped_counts = counts[True]
+
+    results = {
+        'fragments': {},
+        'other_components': {},
+        'missing_fragments': [],
+        'missing_other': [],
+        'can_make_weapon': False,
+        'total_fragments_ready': 0,
+        'include_equipped': include_equipped,
+        'equipped_fragments': {},
+        'available_fragments': {}
+    }
+
+    # Check each required fragment
+    for fragment_base in required_fragments:
+        legendary_name = f"{fragment_base} (Legendary)"
+        enchanted_name = f"{fragment_base} (Enchanted)"
+
+        # Count from available items (for crafting)
+        legendary_count = int(available_counts[legendary_name])
+        enchanted_count = int(available_counts[enchanted_name])
+
+        # Count equipped versions for reporting (ALL equipped: worn + spare gear)
+        equipped_legendary = int(equipped_counts[legendary_name])
+        equipped_enchanted = int(equipped_counts[enchanted_name])
+
+        # Debug output for specific fragments
+        print(f"Debug {fragment_base}: Available L:{legendary_count} E:{enchanted_count}, Equipped L:{equipped_legendary} E:{equipped_enchanted}")
+
+        # Calculate if we can make a legendary (need 4 enchanted available)
+        can_make_legendary = enchanted_count >= 4
+        has_legendary = legendary_count > 0
+
+        results['fragments'][fragment_base] = {
+            'legendary_count': legendary_count,
+            'enchanted_count': enchanted_count,
+            'equipped_legendary': equipped_legendary,
+            'equipped_enchanted': equipped_enchanted,
+            'has_legendary': has_legendary,
+            'can_make_legendary': can_make_legendary,
+            'ready': has_legendary or can_make_legendary
+        }
+
+        if has_legendary or can_make_legendary:
+            results['total_fragments_ready'] += 1
+        else:
+            missing_info = {
+                'name': fragment_base,
+                'legendary_count': legendary_count,
+                'enchanted_count': enchanted_count,
+                'equipped_legendary': equipped_legendary,
+                'equipped_enchanted': equipped_enchanted,
+                'need_more': 4 - enchanted_count if enchanted_count < 4 else 0
+            }
+            results['missing_fragments'].append(missing_info)
+
+    # Check other components
+    for component in other_components:
+        count = int(available_counts[component])
+
+        results['other_components'][component] = {
+            'count': count,
+            'ready': count > 0
+        }
+
+        if count == 0:
+            results['missing_other'].append(component)
+
+    # Determine if weapon can be made
+    all_fragments_ready = results['total_fragments_ready'] == len(required_fragments)
+    all_other_ready = len(results['missing_other']) == 0
+    results['can_make_weapon'] = all_fragments_ready and all_other_ready
+
+    return results
@@ -3,6 +3,11 @@ Signet of Might Quest Data Structure
 Contains all quest steps, items, and tracking logic for the Aid Grimel quest chain.
 """
 
+import re
+
+from inventory_catalog import ItemCatalog
+from inventory_search import get_pattern_matcher, is_literal_term
+
 class SignetOfMightQuest:
     """Data structure for the complete Signet of Might quest chain."""
     
@@ -29,6 +34,9 @@ class SignetOfMightQuest:
             6: self._get_fletching_quest(),
             7: self._get_baking_quest()
         }
+        
+        # Per-name item totals for the last analyzed inventory (see _get_item_totals)
+        self._item_totals = None
     
     def _get_blacksmithing_quest(self):
         return {
@@ -991,9 +999,17 @@ class SignetOfMightQuest:
         
         return all_items
     
-    def get_quest_progress_summary(self, inventory_items):
-        """Analyze inventory and return progress summary for all quests."""
+    def get_quest_progress_summary(self, inventory_items, catalog=None):
+        """
+        Analyze inventory and return progress summary for all quests.
+        
+        Args:
+            inventory_items: Items DataFrame
+            catalog: ItemCatalog of inventory_items, if one was built at load time
+        """
         progress = {}
+        if inventory_items is not None and not inventory_items.empty:
+            self._get_item_totals(inventory_items, catalog)
         
         for quest_num, quest_data in self.quest_chain.items():
             quest_name = quest_data["name"]
@@ -1038,27 +1054,83 @@ class SignetOfMightQuest:
             "can_complete": len(missing_items) == 0
         }
     
+    def _get_item_totals(self, inventory_items, catalog=None):
+        """
+        Aggregate non-empty inventory Counts by item, once per inventory DataFrame.
+        
+        With an ID column the Counts are summed per item ID (see ItemCatalog) and quest
+        items are resolved to their IDs once. Without one they are summed per name.
+        
+        Returns:
+            Dict with 'catalog', 'id_totals' (Count per catalog ID) and 'partial' (quest
+            item -> matching IDs), or, by name, 'exact' (lowercase name -> total), 'partial'
+            (quest item -> total over every name containing it) and 'names' (distinct name -> total)
+        """
+        if self._item_totals is not None and self._item_totals['source'] is inventory_items:
+            return self._item_totals
+        
+        is_item = inventory_items['IsEmpty'] == False
+        if catalog is None and 'ID' in inventory_items.columns:
+            catalog = ItemCatalog(inventory_items)
+        if catalog is not None:
+            counted = inventory_items.loc[is_item, ['ID', 'Count']]
+            id_totals, _ = catalog.id_totals(counted, weights=counted['Count'].astype(int))
+            self._item_totals = {'source': inventory_items, 'catalog': catalog, 'id_totals': id_totals[:, 0],
+                                 'partial': catalog.requirement_table(list(self.get_all_unique_items()))}
+            return self._item_totals
+        
+        non_empty = inventory_items[is_item]
+        name_totals = non_empty['Count'].astype(int).groupby(non_empty['Name'], observed=True).sum()
+        names = {str(name): int(total) for name, total in name_totals.items()}
+        
+        exact = {}
+        for name, total in names.items():
+            exact[name.lower()] = exact.get(name.lower(), 0) + total
+        
+        # Partial matches for every quest item: one multi-pattern pass over the distinct names
+        item_names = list(self.get_all_unique_items())
+        literal_items = [item_name for item_name in item_names if is_literal_term(item_name)]
+        matcher = get_pattern_matcher(tuple(literal_items))
+        partial = dict.fromkeys(item_names, 0)
+        for name, total in names.items():
+            for pattern_id in matcher.find(name):
+                partial[literal_items[pattern_id]] += total
+        for item_name in item_names:
+            if item_name not in literal_items:
+                partial[item_name] = self._partial_total(item_name, names)
+        
+        self._item_totals = {'source': inventory_items, 'exact': exact, 'partial': partial, 'names': names}
+        return self._item_totals
+    
+    def _partial_total(self, item_name, names):
+        """Total Count of names matching item_name the way str.contains(case=False) would."""
+        pattern = re.compile(item_name, re.IGNORECASE)
+        return sum(total for name, total in names.items() if pattern.search(name))
+    
     def _count_item_in_inventory(self, item_name, inventory_items):
         """Count how many of a specific item exist in inventory."""
         if inventory_items is None or inventory_items.empty:
             return 0
         
-        # Search for exact matches and partial matches
-        exact_matches = inventory_items[
-            (inventory_items['Name'].str.lower() == item_name.lower()) &
-            (inventory_items['IsEmpty'] == False)
-        ]
+        item_totals = self._get_item_totals(inventory_items)
+        if 'catalog' in item_totals:
+            return self._count_item_by_id(item_name, item_totals)
         
-        if not exact_matches.empty:
-            return exact_matches['Count'].astype(int).sum()
+        # Search for exact matches and partial matches
+        if item_name.lower() in item_totals['exact']:
+            return item_totals['exact'][item_name.lower()]
         
         # Try partial match for items with variations
-        partial_matches = inventory_items[
-            (inventory_items['Name'].str.contains(item_name, case=False, na=False)) &
-            (inventory_items['IsEmpty'] == False)
-        ]
-        
-        if not partial_matches.empty:
-            return partial_matches['Count'].astype(int).sum()
-        
-        return 0
+        if item_name in item_totals['partial']:
+            return item_totals['partial'][item_name]
+        return self._partial_total(item_name, item_totals['names'])
+    
+    def _count_item_by_id(self, item_name, item_totals):
+        """Count of item_name from per-ID totals: exactly named IDs first, then partial matches."""
+        catalog = item_totals['catalog']
+        item_ids = catalog.ids_for_name(item_name)
+        if len(item_ids) == 0:
+            item_ids = item_totals['partial'].get(item_name)
+            if item_ids is None:
+                item_ids = catalog.resolve(item_name)
+        return int(round(catalog.sum_ids(item_totals['id_totals'], item_ids)))
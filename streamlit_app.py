@@ -4,6 +4,9 @@ import os
 from datetime import datetime
 import re
 from signet_of_might_data import SignetOfMightQuest
+from inventory_locations import categorize_locations
+from inventory_catalog import ItemCatalog
+from inventory_search import TrigramIndex, IncrementalSearch, SearchResultCache, tag_pattern_hits
 
 # Page config
 st.set_page_config(
@@ -48,21 +51,6 @@ if 'search_term' not in st.session_state:
 if 'zeb_results' not in st.session_state:
     st.session_state.zeb_results = None
 
-# Helper function
-def categorize_location(location):
-    """Categorize item location."""
-    location = str(location).lower()
-    if 'bank' in location:
-        return 'Bank'
-    elif 'bag' in location or 'slot' in location:
-        return 'Inventory'
-    elif location in ['charm', 'ear', 'head', 'face', 'neck', 'shoulders', 'arms', 'wrist', 
-                     'hands', 'finger', 'chest', 'legs', 'feet', 'waist', 'primary', 
-                     'secondary', 'range', 'ammo']:
-        return 'Equipped'
-    else:
-        return 'Other'
-
 # Sidebar for file upload and info
 with st.sidebar:
     st.header("📁 Upload Inventory Files")
@@ -139,7 +127,7 @@ if uploaded_files:
                 # Add character name
                 character_items.insert(0, 'Character', char_name)
                 character_items['IsEmpty'] = character_items['Name'] == 'Empty'
-                character_items['ItemType'] = character_items['Location'].apply(categorize_location)
+                character_items['ItemType'] = categorize_locations(character_items['Location'])
                 
                 result_list.append(character_items)
                 
@@ -147,7 +135,7 @@ if uploaded_files:
                 if not shared_bank_items.empty:
                     shared_bank_items.insert(0, 'Character', 'SHARED-BANK')
                     shared_bank_items['IsEmpty'] = shared_bank_items['Name'] == 'Empty'
-                    shared_bank_items['ItemType'] = shared_bank_items['Location'].apply(categorize_location)
+                    shared_bank_items['ItemType'] = categorize_locations(shared_bank_items['Location'])
                     
                     # Only add if we haven't seen this shared bank before
                     if 'SHARED-BANK' not in [df['Character'].iloc[0] for df in result_list if not df.empty]:
@@ -162,6 +150,14 @@ if uploaded_files:
             return final_df
         return pd.DataFrame()
     
+    @st.cache_resource
+    def build_name_index(items_df):
+        return TrigramIndex(items_df['Name'])
+    
+    @st.cache_resource
+    def build_item_catalog(items_df):
+        return ItemCatalog(items_df)
+    
     # Load data
     with st.spinner("🔄 Processing inventory files..."):
         items_df = load_web_inventory_files(uploaded_files)
@@ -277,21 +273,35 @@ if uploaded_files:
         
         # Perform search
         if search_term:
-            # Apply search logic (reuse from desktop version)
-            df = items_df[items_df['IsEmpty'] == False].copy()
+            # Per-session caches: refining a search narrows the previous results, and
+            # repeating one (every rerun does) reuses the filtered frame until new data is loaded
+            name_index = build_name_index(items_df)
+            if st.session_state.get('search_cache') is None:
+                st.session_state.search_cache = SearchResultCache()
+            if st.session_state.get('name_search') is None or st.session_state.name_search.index is not name_index:
+                def swap():
+                    st.session_state.name_search = IncrementalSearch(name_index)
+                st.session_state.search_cache.invalidate(swap)
             
-            if '|' in search_term:
-                df = df[df['Name'].str.contains(search_term, case=False, na=False, regex=True)]
-            elif exact_match:
-                df = df[df['Name'].str.lower() == search_term.lower()]
-            else:
-                df = df[df['Name'].str.contains(search_term, case=False, na=False)]
-            
-            if character != 'All':
-                df = df[df['Character'] == character]
+            def run_search():
+                # Apply search logic (reuse from desktop version)
+                # 'A|B' patterns stay regex searches even with exact match set
+                if exact_match and '|' not in search_term:
+                    df = items_df[items_df['Name'].str.lower() == search_term.lower()]
+                else:
+                    df = st.session_state.name_search.search(items_df, search_term)
+                df = df[df['IsEmpty'] == False].copy()
+                
+                if character != 'All':
+                    df = df[df['Character'] == character]
+                
+                if item_type != 'All':
+                    df = df[df['ItemType'] == item_type]
+                return df
             
-            if item_type != 'All':
-                df = df[df['ItemType'] == item_type]
+            df = st.session_state.search_cache.get_or_compute(
+                search_term, None if character == 'All' else character,
+                None if item_type == 'All' else item_type, exact_match, run_search)
             
             # Display results with enhanced highlighting
             st.markdown("---")
@@ -368,7 +378,7 @@ if uploaded_files:
         with quest_col2:
             if st.button("🔍 Analyze Quest Progress", type="primary", key="analyze_quest"):
                 with st.spinner("🔄 Analyzing quest progress..."):
-                    progress = st.session_state.signet_quest.get_quest_progress_summary(items_df)
+                    progress = st.session_state.signet_quest.get_quest_progress_summary(items_df, build_item_catalog(items_df))
                     st.session_state.quest_progress = progress
                     st.success("Quest analysis complete!")
                     st.rerun()
@@ -379,12 +389,9 @@ if uploaded_files:
                 all_items = st.session_state.signet_quest.get_all_unique_items()
                 item_names = list(all_items.keys())
                 
-                # Create a regex pattern to match any quest item
-                search_pattern = "|".join([f"({name.replace('(', '\\(').replace(')', '\\)')})" for name in item_names])
-                
-                # Perform search
+                # Tag every item with the quest items its name contains, in one pass
                 df_quest = items_df[items_df['IsEmpty'] == False].copy()
-                df_quest = df_quest[df_quest['Name'].str.contains(search_pattern, case=False, na=False, regex=True)]
+                df_quest = df_quest[tag_pattern_hits(df_quest['Name'], item_names).map(len) > 0]
                 
                 st.markdown("---")
                 st.success(f"📄 **All Signet of Might Quest Items** ({len(df_quest)} items found)")
@@ -664,29 +671,34 @@ if uploaded_files:
                 
                 # Show locations for each component
                 debug_items_df = st.session_state.items_df
+                required_fragments = [
+                    "Akhevan Fragment of Truth", "Fiery Fragment of Truth", "Gelid Fragment of Truth",
+                    "Hastened Fragment of Truth", "Healing Fragment of Truth", "Icy Fragment of Truth",
+                    "Lethal Fragment of Truth", "Magical Fragment of Truth", "Replenishing Fragment of Truth",
+                    "Runic Fragment of Truth", "Ssraeshzian Fragment of Truth", "Yttrium Fragment of Truth"
+                ]
+                other_components = ["Time Phased Quintessence", "Vortex of the Past"]
+                
+                # Tag each item with the fragment tiers and components it matches, in one pass
+                patterns = []
+                for fragment in required_fragments:
+                    patterns += [f"{fragment} (Legendary)", f"{fragment} (Enchanted)"]
+                debug_hits = tag_pattern_hits(debug_items_df['Name'], patterns + other_components).explode().dropna()
+                
+                def items_matching(pattern):
+                    return debug_items_df.loc[debug_hits.index[debug_hits == pattern]]
                 
                 debug_col1, debug_col2 = st.columns(2)
                 
                 with debug_col1:
                     st.markdown("**🧩 Fragment Locations:**")
                     
-                    required_fragments = [
-                        "Akhevan Fragment of Truth", "Fiery Fragment of Truth", "Gelid Fragment of Truth",
-                        "Hastened Fragment of Truth", "Healing Fragment of Truth", "Icy Fragment of Truth",
-                        "Lethal Fragment of Truth", "Magical Fragment of Truth", "Replenishing Fragment of Truth",
-                        "Runic Fragment of Truth", "Ssraeshzian Fragment of Truth", "Yttrium Fragment of Truth"
-                    ]
-                    
                     for fragment in required_fragments:
                         fragment_short = fragment.replace(" Fragment of Truth", "")
                         
                         # Find all instances of this fragment
-                        legendary_items = debug_items_df[
-                            debug_items_df['Name'].str.contains(f"{fragment} (Legendary)", case=False, na=False, regex=False)
-                        ]
-                        enchanted_items = debug_items_df[
-                            debug_items_df['Name'].str.contains(f"{fragment} (Enchanted)", case=False, na=False, regex=False)
-                        ]
+                        legendary_items = items_matching(f"{fragment} (Legendary)")
+                        enchanted_items = items_matching(f"{fragment} (Enchanted)")
                         
                         if not legendary_items.empty or not enchanted_items.empty:
                             with st.expander(f"🧩 {fragment_short} ({len(legendary_items) + len(enchanted_items)} found)"):
@@ -703,12 +715,8 @@ if uploaded_files:
                 with debug_col2:
                     st.markdown("**🔧 Other Component Locations:**")
                     
-                    other_components = ["Time Phased Quintessence", "Vortex of the Past"]
-                    
                     for component in other_components:
-                        component_items = debug_items_df[
-                            debug_items_df['Name'].str.contains(component, case=False, na=False, regex=False)
-                        ]
+                        component_items = items_matching(component)
                         
                         if not component_items.empty:
                             with st.expander(f"🔧 {component} ({len(component_items)} found)"):
@@ -741,14 +749,18 @@ if uploaded_files:
                     
                     other_components = ["Time Phased Quintessence", "Vortex of the Past"]
                     
+                    # Resolve every fragment tier and component to its item IDs and count them in one pass
+                    patterns = []
+                    for fragment in required_fragments:
+                        patterns += [f"{fragment} (Legendary)", f"{fragment} (Enchanted)"]
+                    item_catalog = build_item_catalog(items_df)
+                    requirement_ids = item_catalog.requirement_table(patterns + other_components, regex=False)
+                    counts = item_catalog.count(items_df[items_df['IsEmpty'] == False], requirement_ids)['Count']
+                    
                     fragment_status = []
                     for fragment in required_fragments:
-                        legendary_count = len(items_df[
-                            items_df['Name'].str.contains(f"{fragment} (Legendary)", case=False, na=False, regex=False)
-                        ])
-                        enchanted_count = len(items_df[
-                            items_df['Name'].str.contains(f"{fragment} (Enchanted)", case=False, na=False, regex=False)
-                        ])
+                        legendary_count = int(counts[f"{fragment} (Legendary)"])
+                        enchanted_count = int(counts[f"{fragment} (Enchanted)"])
                         
                         ready = legendary_count > 0 or enchanted_count >= 4
                         status = "✅ Ready" if ready else ("🔄 Can Make" if enchanted_count > 0 else "❌ Missing")
@@ -764,9 +776,7 @@ if uploaded_files:
                     # Other components
                     other_status = []
                     for component in other_components:
-                        count = len(items_df[
-                            items_df['Name'].str.contains(component, case=False, na=False, regex=False)
-                        ])
+                        count = int(counts[component])
                         other_status.append({
                             "Component": component,
                             "Status": "✅ Ready" if count > 0 else "❌ Missing",
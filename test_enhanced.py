@@ -15,8 +15,8 @@ try:
     print("Testing Enhanced EQ Inventory Monitor...")
     print("="*50)
     
-    # Test loading inventory from current directory
-    inventory = EQInventoryMonitor()
+    # Test loading the sample inventory shipped next to this script
+    inventory = EQInventoryMonitor(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SAMPLE_INVENTORY'))
     
     if inventory.items_df.empty:
         print("❌ No data loaded")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the desktop GUI's background searches
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip('tkinter')
+import eq_inventory_gui
+
+SEARCH_ATTRIBUTES = {'_search_state', 'items_df', 'name_index', 'name_search', 'item_catalog'}
+
+
+def make_items(names, character):
+    return pd.DataFrame({
+        'Character': character, 'Name': names, 'Location': [f"General{i}" for i in range(len(names))],
+        'ItemType': 'Inventory', 'Count': 1, 'ID': range(1000, 1000 + len(names)), 'IsEmpty': False,
+    })
+
+
+class ReloadingGUI(eq_inventory_gui.EQInventoryGUI):
+    """GUI whose next read of any search attribute is followed by a reload, as from watch mode."""
+
+    def __getattribute__(self, name):
+        value = object.__getattribute__(self, name)
+        if name in SEARCH_ATTRIBUTES and object.__getattribute__(self, '__dict__').get('next_frame') is not None:
+            next_frame, self.next_frame = self.next_frame, None
+            self._use_loaded_items(next_frame)
+        return value
+
+
+def make_gui(items_df):
+    eq_inventory_gui._import_dataframe_modules()
+    gui = ReloadingGUI.__new__(ReloadingGUI)  # No window needed
+    gui.next_frame = None
+    gui.search_cache = eq_inventory_gui.SearchResultCache()
+    gui._use_loaded_items(items_df)
+    return gui
+
+
+def test_search_uses_one_snapshot_when_a_reload_swaps_mid_search():
+    old_items = make_items(['Mana Potion', 'Rare Gem', 'Mana Stone', 'Bread', 'Water Flask'], 'Gandalf')
+    new_items = make_items(['Bread'], 'Frodo')  # Fewer rows: positions from the old index do not exist here
+    searches = [
+        (lambda gui: gui._search_items_uncached('mana'), ['Mana Potion', 'Mana Stone']),
+        (lambda gui: gui.search_items_any(['Water', 'Gem']), ['Rare Gem', 'Water Flask']),
+    ]
+    for search, expected in searches:
+        gui = make_gui(old_items)
+        gui.next_frame = new_items
+        assert list(search(gui)['Name']) == expected  # Results of the frame current when the search started
+        assert gui.items_df is new_items
+
+
+def test_alternation_stays_a_regex_search_with_exact_match():
+    gui = make_gui(make_items(['Mana Potion', 'Rare Gem', 'Mana Stone', 'Bread'], 'Gandalf'))
+    assert list(gui._search_items_uncached('Potion|Gem', exact_match=True)['Name']) == ['Mana Potion', 'Rare Gem']
+    assert list(gui._search_items_uncached('mana potion', exact_match=True)['Name']) == ['Mana Potion']
+
+
+def test_searches_before_any_items_load_are_empty():
+    gui = make_gui(pd.DataFrame())  # A folder with no inventory files
+    assert gui._search_items_uncached('mana').empty
+    assert gui.search_items_any(['Water', 'Gem']).empty
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Tests that the desktop GUI module stays cheap to import
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_gui_import_defers_pandas():
+    pytest.importorskip('tkinter')
+    script = ("import sys, eq_inventory_gui; print('pandas' in sys.modules); "
+              "eq_inventory_gui._import_dataframe_modules(); print(eq_inventory_gui.pd is sys.modules['pandas'])")
+    output = subprocess.run([sys.executable, '-c', script], cwd=PACKAGE_DIR,
+                            capture_output=True, text=True, check=True).stdout.split()
+    assert output == ['False', 'True']
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the item ID catalog and ID-based requirement counting
+"""
+
+import os
+import random
+import sys
+
+import pandas as pd
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_catalog import ItemCatalog
+from inventory_loader import InventoryLoader
+from inventory_search import count_pattern_hits
+from inventory_synthetic import generate_inventory_directory
+from signet_of_might_data import SignetOfMightQuest
+
+
+ITEMS = [
+    ('Fiery Fragment of Truth (Legendary)', 501),
+    ('Fiery Fragment of Truth (Enchanted)', 502),
+    ('Icy Fragment of Truth (Enchanted)', 503),
+    ('Vortex of the Past', 504),
+    ('Mana Potion', 101),
+    ('Empty', 0),
+]
+
+
+def make_items():
+    random.seed(11)
+    rows = []
+    for _ in range(500):
+        name, item_id = random.choice(ITEMS)
+        rows.append({'Name': name, 'ID': item_id, 'Count': random.randint(1, 3), 'IsEmpty': name == 'Empty',
+                     'IsEquipped': random.random() < 0.3})
+    return pd.DataFrame(rows)
+
+
+def test_catalog_names_and_resolution():
+    items_df = make_items()
+    items_df.loc[0, ['Name', 'ID', 'IsEmpty']] = ['MANA POTION', 101, False]  # A second spelling of ID 101
+    catalog = ItemCatalog(items_df)
+
+    assert list(catalog.ids) == [101, 501, 502, 503, 504]  # Empty slots are not items
+    assert catalog.name(101) == 'Mana Potion' and catalog.name(0) is None
+    assert list(catalog.ids_for_name('fiery fragment of truth (legendary)')) == [501]
+    assert list(catalog.resolve('Fragment of Truth')) == [501, 502, 503]
+    assert list(catalog.resolve('Fiery.*Enchanted')) == [502]
+    assert list(catalog.resolve('(Enchanted)', regex=False)) == [502, 503]
+    assert list(catalog.resolve('Tulwar')) == []
+
+    table = catalog.requirement_table(['Vortex of the Past', 'mana potion', '(Enchanted)'], regex=False)
+    assert {name: list(ids) for name, ids in table.items()} == {
+        'Vortex of the Past': [504], 'mana potion': [101], '(Enchanted)': [502, 503]}
+
+
+def test_count_matches_name_scans():
+    items_df = make_items()
+    non_empty = items_df[items_df['IsEmpty'] == False]
+    patterns = ['Fiery Fragment of Truth (Legendary)', 'Fragment of Truth (Enchanted)', 'Vortex of the Past', 'Tulwar']
+
+    catalog = ItemCatalog(items_df)
+    counts = catalog.count(non_empty, catalog.requirement_table(patterns, regex=False), groups=non_empty['IsEquipped'])
+    expected = count_pattern_hits(non_empty['Name'], patterns, non_empty['IsEquipped'])
+    pd.testing.assert_frame_equal(counts.reindex(columns=[False, True]), expected.reindex(columns=[False, True], fill_value=0),
+                                  check_dtype=False, check_names=False)
+
+    weighted = catalog.count(non_empty, catalog.requirement_table(['Mana Potion']), weights=non_empty['Count'])
+    assert weighted.loc['Mana Potion', 'Count'] == non_empty.loc[non_empty['Name'] == 'Mana Potion', 'Count'].sum()
+
+
+def test_quest_progress_by_id_matches_progress_by_name(tmp_path):
+    generate_inventory_directory(str(tmp_path), 12, seed=4)
+    items_df = InventoryLoader(str(tmp_path), mode='serial').load()
+
+    by_id = SignetOfMightQuest().get_quest_progress_summary(items_df, ItemCatalog(items_df))
+    by_name = SignetOfMightQuest().get_quest_progress_summary(items_df.drop(columns=['ID']))
+    assert by_id == by_name
+    assert any(item['owned'] for quest in by_id.values() for item in quest['owned_items'].values())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact items DataFrame representation
+"""
+
+import os
+import sys
+
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_compact import CATEGORY_COLUMNS, expand_items_df, memory_report
+from inventory_loader import InventoryLoader
+
+
+def test_compact_matches_plain_load(make_inventory_dir):
+    directory = make_inventory_dir()
+    plain_df = InventoryLoader(directory, mode='serial').load()
+    compact_df = InventoryLoader(directory, mode='serial', compact=True).load()
+
+    for col in CATEGORY_COLUMNS:
+        assert isinstance(compact_df[col].dtype, CategoricalDtype)
+    assert compact_df['Count'].dtype.itemsize < plain_df['Count'].dtype.itemsize
+
+    expanded_df = expand_items_df(compact_df)
+    for col in plain_df.columns:
+        expected = plain_df[col].astype(object) if col in CATEGORY_COLUMNS else plain_df[col]
+        pd.testing.assert_series_equal(expanded_df[col], expected)
+
+
+def test_categories_shared_across_reloads(tmp_path, make_inventory_dir):
+    directory = make_inventory_dir()
+    loader = InventoryLoader(directory, mode='serial', compact=True)
+    first_df = loader.load()
+
+    changed_file = tmp_path / 'Gandalf1-Inventory.txt'
+    changed_file.write_text(changed_file.read_text().replace('Mana Potion', 'Greater Mana Potion'))
+    reloaded_df = loader.load()
+
+    assert isinstance(reloaded_df['Name'].dtype, CategoricalDtype)
+    assert 'Greater Mana Potion' in reloaded_df['Name'].cat.categories
+    # Categories only grow, so earlier codes stay valid
+    assert set(first_df['Name'].cat.categories) <= set(reloaded_df['Name'].cat.categories)
+    assert reloaded_df['Name'].dtype == loader.categories.dtypes['Name']
+
+
+def test_memory_report(make_inventory_dir):
+    directory = make_inventory_dir()
+    items_df = InventoryLoader(directory, mode='serial').load()
+    report = memory_report(items_df)
+
+    total = report[report['Column'] == 'Total'].iloc[0]
+    assert total['CompactBytes'] < total['PlainBytes']
+    assert list(report['Column'][:-1]) == list(items_df.columns)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized duplicate finder
+"""
+
+import os
+import random
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_compact import compact_items_df
+from inventory_duplicates import find_duplicate_rows
+
+
+def make_items():
+    random.seed(3)
+    items = [('Mana Potion', 101), ('Bread', 102), ('Bread', 103), ('Rare Gem', 104), ('Empty', 0)]
+    rows = []
+    for i in range(300):
+        name, item_id = random.choice(items)
+        rows.append({'Character': random.choice(['Alpha', 'Bravo', 'Charlie']), 'Name': name, 'ID': item_id,
+                     'Location': f"General{i % 10 + 1}", 'ItemType': 'Inventory', 'Count': random.randint(1, 20),
+                     'Slots': 0, 'IsEmpty': name == 'Empty'})
+    return pd.DataFrame(rows)
+
+
+def duplicates_by_filtering(items_df, min_count):
+    """The original approach: group counts, then one filter per duplicate group."""
+    item_counts = items_df[items_df['IsEmpty'] == False].groupby(['Name', 'ID']).size().reset_index(name='Total')
+    result_list = []
+    for _, row in item_counts[item_counts['Total'] >= min_count].iterrows():
+        details = items_df[(items_df['Name'] == row['Name']) & (items_df['ID'] == row['ID']) &
+                           (items_df['IsEmpty'] == False)].copy()
+        details['TotalFound'] = row['Total']
+        result_list.append(details)
+    return pd.concat(result_list, ignore_index=True)
+
+
+@pytest.mark.parametrize('min_count', [2, 60])
+def test_matches_per_group_filtering(min_count):
+    items_df = make_items()
+    expected = duplicates_by_filtering(items_df, min_count)
+    result = find_duplicate_rows(items_df, min_count)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_modes():
+    items_df = pd.DataFrame([
+        {'Character': 'Alpha', 'Name': 'Bread', 'ID': 102, 'IsEmpty': False},
+        {'Character': 'Alpha', 'Name': 'Bread', 'ID': 102, 'IsEmpty': False},
+        {'Character': 'Alpha', 'Name': 'Bread', 'ID': 103, 'IsEmpty': False},
+        {'Character': 'Bravo', 'Name': 'Stale Bread', 'ID': 102, 'IsEmpty': False},
+        {'Character': 'Bravo', 'Name': 'Empty', 'ID': 0, 'IsEmpty': True},
+        {'Character': 'Charlie', 'Name': 'Empty', 'ID': 0, 'IsEmpty': True},
+    ])
+
+    assert find_duplicate_rows(items_df, 2, 'name_id')['TotalFound'].tolist() == [2, 2]
+    assert find_duplicate_rows(items_df, 3, 'name')['Name'].tolist() == ['Bread'] * 3
+    assert find_duplicate_rows(items_df, 3, 'id')['Name'].tolist() == ['Bread', 'Bread', 'Stale Bread']
+    # Alpha's two Bread stacks are a single character; nothing is held by two characters
+    assert find_duplicate_rows(items_df, 2, 'cross_character').empty
+    assert find_duplicate_rows(items_df, 2, 'cross_character').columns[-1] == 'TotalFound'
+    assert find_duplicate_rows(make_items(), 3, 'cross_character')['TotalFound'].eq(3).all()
+
+    with pytest.raises(ValueError):
+        find_duplicate_rows(items_df, 2, 'bogus')
+
+
+def test_compact_frame_gives_same_rows():
+    items_df = make_items()
+    plain = find_duplicate_rows(items_df, 2, 'cross_character')
+    compact = find_duplicate_rows(compact_items_df(items_df), 2, 'cross_character')
+    assert compact['Name'].astype(str).tolist() == plain['Name'].tolist()
+    assert compact['TotalFound'].tolist() == plain['TotalFound'].tolist()
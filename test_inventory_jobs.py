@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the background job scheduler used by the desktop GUI
+"""
+
+import os
+import queue
+import sys
+import threading
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_jobs import JobScheduler
+
+
+class UIThread:
+    """Stands in for root.after: callbacks are queued and run when drained."""
+
+    def __init__(self):
+        self.callbacks = queue.Queue()
+
+    def post(self, callback):
+        self.callbacks.put(callback)
+
+    def drain(self, count):
+        for _ in range(count):
+            self.callbacks.get(timeout=5)()
+
+
+def test_stale_results_are_dropped():
+    ui = UIThread()
+    busy_changes = []
+    jobs = JobScheduler(ui.post, lambda busy, label: busy_changes.append((busy, label)))
+    delivered = []
+
+    release = threading.Event()
+    jobs.submit('slow', lambda: release.wait(5) and 'slow result', delivered.append)
+    jobs.submit('fast', lambda: 'fast result', delivered.append)
+    release.set()
+
+    # Both jobs post a delivery, but only the newest generation is handed over
+    ui.drain(2)
+    assert delivered == ['fast result']
+    assert busy_changes == [(True, 'slow'), (True, 'fast'), (False, 'fast')]
+
+
+def test_cancel_and_errors():
+    ui = UIThread()
+    jobs = JobScheduler(ui.post)
+    delivered, errors = [], []
+
+    release = threading.Event()
+    jobs.submit('cancelled', lambda: release.wait(5) and 'result', delivered.append, errors.append)
+    assert jobs.cancel()
+    release.set()
+    ui.drain(1)
+    assert delivered == [] and errors == []
+    assert not jobs.cancel()
+
+    jobs.submit('failing', lambda: 1 / 0, delivered.append, errors.append)
+    ui.drain(1)
+    assert delivered == []
+    assert isinstance(errors[0], ZeroDivisionError)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared inventory loader
+"""
+
+import logging
+import os
+import random
+import shutil
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import inventory_cache
+from inventory_loader import (InventoryLoader, create_shared_bank_signature, drop_duplicate_rows,
+                              load_inventory_directory, parse_inventory_files)
+from inventory_synthetic import generate_inventory_directory
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SAMPLE_INVENTORY')
+
+
+def test_parallel_modes_match_serial(make_inventory_dir):
+    directory = make_inventory_dir()
+
+    serial_df = load_inventory_directory(directory, mode='serial')
+    assert not serial_df.empty
+
+    for mode in ('thread', 'process'):
+        parallel_df = load_inventory_directory(directory, mode=mode, max_workers=2)
+        pd.testing.assert_frame_equal(serial_df, parallel_df)
+
+
+def test_shared_bank_deduplicated(make_inventory_dir):
+    directory = make_inventory_dir()
+    items_df = load_inventory_directory(directory, mode='serial')
+
+    shared_bank = items_df[items_df['Character'] == 'SHARED-BANK']
+    # Two distinct shared banks in the samples, each kept once
+    assert len(shared_bank) == 4
+    assert set(shared_bank['FileName']) == {'Bloodthirster0-Inventory.txt', 'Gandalf0-Inventory.txt'}
+
+
+def test_shared_bank_signature_and_skipping(tmp_path, make_inventory_dir):
+    bank = pd.DataFrame({'Location': ['SharedBank1', 'SharedBank2', 'SharedBank3'],
+                         'Name': ['Rare Gem', 'Empty', 'Bread'], 'ID': [10, 0, 20], 'Count': [1, 0, 5]})
+    signature = create_shared_bank_signature(bank)
+    # Row order and empty slots don't matter; contents do
+    assert create_shared_bank_signature(bank.iloc[[2, 0]]) == signature
+    assert create_shared_bank_signature(bank.assign(Count=[2, 0, 5])) != signature
+
+    directory = make_inventory_dir(copies=2)
+    inventory_files = sorted(str(path) for path in tmp_path.iterdir())
+    parsed_files = parse_inventory_files(inventory_files, mode='serial', known_shared_banks=set())
+    # The second copy of each bank is dropped before its rows are processed
+    assert [parsed['shared_bank_skipped'] for parsed in parsed_files] == [False, True, False, True]
+    assert parsed_files[1]['shared_bank_items'].empty
+    assert parsed_files[1]['shared_bank_signature'] == parsed_files[0]['shared_bank_signature']
+    assert not parsed_files[1]['character_items'].empty
+
+
+def test_skipped_shared_bank_parsed_when_it_becomes_the_source(tmp_path, make_inventory_dir, sorted_items):
+    directory = make_inventory_dir()
+    loader = InventoryLoader(directory, mode='serial')
+    loader.load()
+
+    os.remove(tmp_path / 'Bloodthirster0-Inventory.txt')
+    spliced_df = loader.load()
+    shared_bank = spliced_df[spliced_df['Character'] == 'SHARED-BANK']
+    assert set(shared_bank['FileName']) == {'Bloodthirster1-Inventory.txt', 'Gandalf0-Inventory.txt'}
+
+    full_df = InventoryLoader(directory, mode='serial').load()
+    pd.testing.assert_frame_equal(sorted_items(spliced_df), sorted_items(full_df))
+
+
+def test_natural_key_dedup_matches_all_column_dedup(tmp_path, make_inventory_dir):
+    directory = make_inventory_dir(copies=2)
+    # An older export of the same character that sorts first: identical rows, older timestamp
+    shutil.copy(tmp_path / 'Gandalf0-Inventory.txt', tmp_path / 'Gandalf0-A-Inventory.txt')
+    os.utime(tmp_path / 'Gandalf0-A-Inventory.txt', (1, 1))
+    parsed_files = parse_inventory_files(sorted(str(path) for path in tmp_path.iterdir()), mode='serial')
+
+    combined = pd.concat([parsed['character_items'] for parsed in parsed_files], ignore_index=True)
+    unique_columns = [col for col in combined.columns if col not in ['UpdatedAt', 'FileName']]
+    expected = combined.drop_duplicates(subset=unique_columns)
+    deduplicated, removed = drop_duplicate_rows(combined)
+    pd.testing.assert_frame_equal(deduplicated, expected)
+    assert removed == len(combined) - len(expected) > 0
+    assert set(deduplicated[deduplicated['Character'] == 'Gandalf0']['FileName']) == {'Gandalf0-A-Inventory.txt'}
+
+    newest, removed_newest = drop_duplicate_rows(combined, keep='newest')
+    assert removed_newest == removed
+    gandalf0 = newest[newest['Character'] == 'Gandalf0']
+    assert set(gandalf0['FileName']) == {'Gandalf0-Inventory.txt'}
+
+    loader = InventoryLoader(directory, mode='serial', duplicate_keep='newest')
+    loader.load()
+    assert loader.last_reload['duplicates'] == removed
+
+
+def test_newest_ties_go_to_the_first_file_across_reloads(tmp_path):
+    for i in range(4):
+        shutil.copy(os.path.join(SAMPLE_DIR, 'Gandalf-Inventory.txt'), tmp_path / f"Gandalf{i}-Inventory.txt")
+    exported_at = os.path.getmtime(tmp_path / 'Gandalf0-Inventory.txt')
+
+    def export(names, at):
+        for name in names:
+            os.utime(tmp_path / f"{name}-Inventory.txt", (at, at))
+
+    def bank_sources(items_df):
+        return set(items_df.loc[items_df['Character'] == 'SHARED-BANK', 'FileName'])
+
+    export(['Gandalf0', 'Gandalf1', 'Gandalf2', 'Gandalf3'], exported_at)
+    loader = InventoryLoader(str(tmp_path), mode='serial', shared_bank_mode='rows', duplicate_keep='newest')
+    assert bank_sources(loader.load()) == {'Gandalf0-Inventory.txt'}
+
+    # Each re-export ties with the previous one; the first file by name keeps the rows either way
+    for names, expected in [(['Gandalf3'], 'Gandalf3'), (['Gandalf2'], 'Gandalf2'), (['Gandalf1', 'Gandalf3'], 'Gandalf1')]:
+        export(names, exported_at + 60)
+        spliced_df = loader.load()
+        assert bank_sources(spliced_df) == {f"{expected}-Inventory.txt"}
+        fresh_df = InventoryLoader(str(tmp_path), mode='serial', shared_bank_mode='rows', duplicate_keep='newest').load()
+        pd.testing.assert_frame_equal(spliced_df, fresh_df)
+
+    combined = pd.concat([parsed['shared_bank_items'] for parsed in loader.parsed_files.values()], ignore_index=True)
+    assert bank_sources(drop_duplicate_rows(combined[::-1], keep='newest')[0]) == {'Gandalf1-Inventory.txt'}
+
+
+def modify_inventory_dir(tmp_path):
+    """Change one character's bags, swap another's shared bank, add, remove and re-export files."""
+    changed_file = tmp_path / 'Gandalf1-Inventory.txt'
+    changed_file.write_text(changed_file.read_text().replace('Mana Potion', 'Greater Mana Potion'))
+    bank_file = tmp_path / 'Bloodthirster2-Inventory.txt'
+    bank_file.write_text(bank_file.read_text().replace('Rare Gem', 'Very Rare Gem'))
+    shutil.copy(os.path.join(SAMPLE_DIR, 'Gandalf-Inventory.txt'), tmp_path / 'Newbie-Inventory.txt')
+    os.remove(tmp_path / 'Bloodthirster3-Inventory.txt')
+    touched_file = tmp_path / 'Gandalf2-Inventory.txt'
+    os.utime(touched_file, (os.path.getmtime(touched_file) + 60,) * 2)
+
+
+@pytest.mark.parametrize('shared_bank_mode,duplicate_keep', [('signature', 'first'), ('rows', 'first'), ('rows', 'newest')])
+def test_incremental_reload_matches_full_load(tmp_path, shared_bank_mode, duplicate_keep, make_inventory_dir,
+                                              sorted_items):
+    directory = make_inventory_dir()
+    loader = InventoryLoader(directory, mode='serial', shared_bank_mode=shared_bank_mode, duplicate_keep=duplicate_keep)
+    loader.load()
+
+    # Nothing changed - nothing is parsed again
+    loader.load()
+    assert loader.last_reload['parsed'] == []
+
+    modify_inventory_dir(tmp_path)
+    spliced_df = loader.load()
+
+    reload_info = loader.last_reload
+    assert sorted(os.path.basename(path) for path in reload_info['parsed']) == [
+        'Bloodthirster2-Inventory.txt', 'Gandalf1-Inventory.txt', 'Newbie-Inventory.txt'
+    ]
+    assert [os.path.basename(path) for path in reload_info['touched']] == ['Gandalf2-Inventory.txt']
+    assert [os.path.basename(path) for path in reload_info['removed']] == ['Bloodthirster3-Inventory.txt']
+
+    full_df = InventoryLoader(directory, mode='serial', shared_bank_mode=shared_bank_mode,
+                              duplicate_keep=duplicate_keep).load()
+    pd.testing.assert_frame_equal(sorted_items(spliced_df), sorted_items(full_df))
+
+
+def test_reload_of_reported_paths_matches_full_load(tmp_path, make_inventory_dir, sorted_items):
+    directory = make_inventory_dir()
+    loader = InventoryLoader(directory, mode='serial')
+    loader.load()
+
+    modify_inventory_dir(tmp_path)
+    (tmp_path / 'Gandalf3-Inventory.txt').write_text('Location\tName\tID\tCount\tSlots\n')
+    reported = [os.path.join(directory, name) for name in [
+        'Gandalf1-Inventory.txt', 'Bloodthirster2-Inventory.txt', 'Newbie-Inventory.txt',
+        'Bloodthirster3-Inventory.txt', 'Gandalf2-Inventory.txt'
+    ]]
+    spliced_df = loader.load(reported)
+
+    # Gandalf3 changed too but was not reported, so it keeps its old rows
+    reload_info = loader.last_reload
+    assert [os.path.basename(path) for path in reload_info['removed']] == ['Bloodthirster3-Inventory.txt']
+    assert reload_info['characters'] == ['Bloodthirster2', 'Bloodthirster3', 'Gandalf1', 'Gandalf2',
+                                         'Newbie', 'SHARED-BANK']
+    assert (spliced_df['Character'] == 'Gandalf3').any()
+
+    loader.load()
+    # Emptying Gandalf3 also drops its copy of the shared bank
+    assert loader.last_reload['characters'] == ['Gandalf3', 'SHARED-BANK']
+    full_df = InventoryLoader(directory, mode='serial').load()
+    pd.testing.assert_frame_equal(sorted_items(loader.items_df), sorted_items(full_df))
+
+
+def random_edit(directory, rng, step):
+    """Edit, add, delete, re-export or swap the shared bank of a random file; return what was done."""
+    names = sorted(name for name in os.listdir(directory) if name.endswith('-Inventory.txt'))
+    file_path = os.path.join(directory, rng.choice(names))
+    operation = rng.choice(['edit', 'add', 'delete', 'touch', 'bank'])
+    text = open(file_path, encoding='utf-8').read()
+    bank_start = text.index('SharedBank1')
+    bank_start = text.rindex('\n', 0, bank_start) + 1
+
+    if operation == 'delete' and len(names) > 3:
+        os.remove(file_path)
+        return operation, file_path
+    if operation == 'edit':
+        lines = text[:bank_start].split('\n')
+        location, name, item_id, count, slots = lines[rng.randrange(1, len(lines) - 1)].split('\t')
+        edited = '\t'.join([location, name, item_id, str(int(count) + 1), slots])
+        text = text[:bank_start].replace('\t'.join([location, name, item_id, count, slots]), edited, 1) + text[bank_start:]
+    elif operation == 'add':
+        file_path = os.path.join(directory, f"Added{step}-Inventory.txt")
+    elif operation == 'bank':
+        other = open(os.path.join(directory, rng.choice(names)), encoding='utf-8').read()
+        other_start = other.rindex('\n', 0, other.index('SharedBank1')) + 1
+        text = text[:bank_start] + other[other_start:]
+    if operation != 'touch':
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    # Content changes get a new export time; re-exports often share another file's, so UpdatedAt ties
+    if operation == 'touch' and rng.random() < 0.7:
+        exported_at = os.path.getmtime(os.path.join(directory, rng.choice(names)))
+    else:
+        exported_at = os.path.getmtime(os.path.join(directory, names[0])) + 1000 + step
+    os.utime(file_path, (exported_at, exported_at))
+    return operation, file_path
+
+
+@pytest.mark.parametrize('shared_bank_mode,duplicate_keep', [('signature', 'first'), ('rows', 'first'), ('rows', 'newest')])
+def test_random_reloads_equal_fresh_loads(tmp_path, shared_bank_mode, duplicate_keep):
+    directory = str(tmp_path)
+    generate_inventory_directory(directory, 6, seed=3, characters_per_account=3)
+    loader = InventoryLoader(directory, mode='serial', shared_bank_mode=shared_bank_mode, duplicate_keep=duplicate_keep)
+    loader.load()
+
+    rng = random.Random(7)
+    for step in range(12):
+        operation = random_edit(directory, rng, step)
+        spliced_df = loader.load()
+        fresh_df = InventoryLoader(directory, mode='serial', shared_bank_mode=shared_bank_mode,
+                                   duplicate_keep=duplicate_keep).load()
+        # Same rows in the same order, down to which file each kept row came from
+        try:
+            pd.testing.assert_frame_equal(spliced_df, fresh_df)
+        except AssertionError as e:
+            raise AssertionError(f"step {step} {operation}: {e}") from None
+
+
+def test_load_timings_reach_hook_and_log(tmp_path, caplog, make_inventory_dir):
+    directory = make_inventory_dir(copies=2)
+    reported = []
+    loader = InventoryLoader(directory, mode='serial', timing_hook=reported.append)
+
+    with caplog.at_level(logging.INFO, logger='inventory.load'):
+        items_df = loader.load()
+
+    timings, = reported
+    assert timings is loader.last_reload['timings']
+    assert list(timings.seconds)[:3] == ['glob', 'fingerprint', 'parse']
+    assert {'concat', 'dedup', 'shared_bank'} <= set(timings.seconds)
+    assert timings.counts['parse'] == (4, 'files')
+    assert set(timings.details['parse'].seconds) == {'read_csv', 'signature', 'derive'}
+    # read_csv counts every row read, including repeated shared banks dropped afterwards
+    assert timings.details['parse'].counts['read_csv'][0] > len(items_df)
+    assert timings.total >= timings.seconds['parse']
+    assert timings.format_line().startswith('Load ')
+
+    record, = caplog.records
+    assert record.directory == directory
+    assert record.load_timings['stages']['parse']['count'] == 4
+    assert 'read_csv' in record.load_timings['stages']['parse']['stages']
+
+    # A reload of one changed file only parses that file
+    changed_file = tmp_path / 'Gandalf1-Inventory.txt'
+    changed_file.write_text(changed_file.read_text().replace('Mana Potion', 'Greater Mana Potion'))
+    loader.load()
+    assert reported[-1].counts['parse'] == (1, 'files')
+    assert 'splice' in reported[-1].seconds
+
+
+@pytest.mark.parametrize('data_format', ['npz', 'feather'])
+def test_warm_start_from_cache(tmp_path, monkeypatch, data_format, make_inventory_dir, sorted_items):
+    if data_format == 'feather':
+        pytest.importorskip('pyarrow')
+    monkeypatch.setattr(inventory_cache, 'HAS_PYARROW', data_format == 'feather')
+
+    directory = make_inventory_dir()
+    cold_df = InventoryLoader(directory, mode='serial', cache=True).load()
+    assert os.path.exists(tmp_path / f'.fdt_inventory_cache.{data_format}')
+
+    # Nothing changed - the warm start parses no files at all
+    warm_loader = InventoryLoader(directory, mode='serial', cache=True)
+    warm_df = warm_loader.load()
+    assert warm_loader.last_reload['from_cache']
+    assert warm_loader.last_reload['parsed'] == []
+    assert warm_loader.parsed_files == {}
+    pd.testing.assert_frame_equal(sorted_items(warm_df), sorted_items(cold_df))
+
+    # Changes made while the app was closed are spliced on top of the cached state
+    modify_inventory_dir(tmp_path)
+    warm_df = InventoryLoader(directory, mode='serial', cache=True).load()
+    full_df = InventoryLoader(directory, mode='serial').load()
+    pd.testing.assert_frame_equal(sorted_items(warm_df), sorted_items(full_df))
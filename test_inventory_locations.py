@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for inventory location classification
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_locations import (categorize_location, categorize_locations, is_worn_location, worn_locations,
+                                 decompose_locations, equipped_location_mask,
+                                 ROOT_WORN, ROOT_GENERAL, ROOT_BANK, ROOT_SHARED_BANK)
+
+LOCATIONS = pd.Series(
+    ['Primary', 'General1', 'General1-Slot3', 'General2-Slot1-Slot2', 'Bank4-Slot7', 'SharedBank1',
+     'Range-Slot1', 'Charm', 'Empty', np.nan, 'Primary', 'Bag1', 'finger'],
+    index=range(100, 113)
+)
+
+
+def test_vectorized_matches_per_row_apply():
+    pd.testing.assert_series_equal(categorize_locations(LOCATIONS), LOCATIONS.apply(categorize_location))
+    pd.testing.assert_series_equal(worn_locations(LOCATIONS), LOCATIONS.apply(is_worn_location))
+
+
+def test_decompose_locations():
+    parts = decompose_locations(LOCATIONS)
+    assert list(parts.index) == list(LOCATIONS.index)
+
+    by_location = dict(zip(LOCATIONS.astype(str), parts.itertuples(index=False, name=None)))
+    assert by_location['Primary'] == (ROOT_WORN, 0, 0, '')
+    assert by_location['Range-Slot1'] == (ROOT_WORN, 0, 1, '1')
+    assert by_location['General2-Slot1-Slot2'] == (ROOT_GENERAL, 2, 2, '1-2')
+    assert by_location['Bank4-Slot7'] == (ROOT_BANK, 4, 1, '7')
+    assert by_location['SharedBank1'] == (ROOT_SHARED_BANK, 1, 0, '')
+
+
+def test_equipped_location_mask_matches_string_rules():
+    def is_equipped_location(location):
+        location_str = str(location)
+        slot_count = location_str.count('-Slot')
+        if slot_count == 0:
+            return False
+        if slot_count == 1:
+            return not ('General' in location_str or 'Bank' in location_str)
+        return True
+
+    mask = equipped_location_mask(decompose_locations(LOCATIONS))
+    pd.testing.assert_series_equal(mask, LOCATIONS.apply(is_equipped_location), check_names=False)
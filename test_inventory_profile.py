@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-operation profiling mode
+"""
+
+import json
+import os
+import pstats
+import sys
+import threading
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_profile import OperationProfiler, profile_methods
+
+
+class Searcher:
+    def search(self, term):
+        return [term] * 1000
+
+    def search_twice(self, term):
+        return self.search(term) + self.search(term)
+
+
+def read_summary(directory):
+    with open(os.path.join(directory, 'summary.jsonl'), encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_profiled_operation_writes_reports(tmp_path):
+    profiler = OperationProfiler(str(tmp_path))
+    with profiler.profile('zeb check'):
+        fragments = [f"Fragment {i}" for i in range(10000)]
+
+    assert len(fragments) == 10000
+    assert sorted(os.listdir(tmp_path)) == ['001-zeb_check.prof', '001-zeb_check.txt', 'summary.jsonl']
+    pstats.Stats(str(tmp_path / '001-zeb_check.prof'))  # Loadable by pstats
+
+    report = (tmp_path / '001-zeb_check.txt').read_text(encoding='utf-8')
+    assert 'Operation: zeb check' in report and 'Peak memory:' in report
+
+    entry, = read_summary(str(tmp_path))
+    assert entry['operation'] == 'zeb check' and entry['file'] == '001-zeb_check.prof'
+    assert entry['seconds'] >= 0 and entry['peak_mb'] > 0
+
+
+def test_profile_methods_skips_nested_calls_and_keeps_earlier_runs(tmp_path):
+    searcher = Searcher()
+    profile_methods(searcher, {'search': 'search', 'search_twice': 'search_twice'}, OperationProfiler(str(tmp_path)))
+
+    assert len(searcher.search_twice('Pearl')) == 2000
+    assert searcher.search('Bread') == ['Bread'] * 1000
+    assert not hasattr(Searcher.search, '__wrapped__')
+
+    # A second profiler in the same directory numbers after the existing reports
+    other = Searcher()
+    profile_methods(other, {'search': 'search_again'}, OperationProfiler(str(tmp_path), memory=False))
+    other.search('Ring')
+
+    summary = read_summary(str(tmp_path))
+    assert [(entry['operation'], entry['file']) for entry in summary] == [
+        ('search_twice', '001-search_twice.prof'),
+        ('search', '002-search.prof'),
+        ('search_again', '003-search_again.prof'),
+    ]
+    assert summary[2]['peak_mb'] is None
+
+
+def test_overlapping_operation_on_another_thread_runs_unprofiled(tmp_path):
+    profiler = OperationProfiler(str(tmp_path), memory=False)
+    load_started, finish_load = threading.Event(), threading.Event()
+
+    def background_load():
+        with profiler.profile('load'):
+            load_started.set()
+            finish_load.wait(10)
+
+    loader = threading.Thread(target=background_load)
+    loader.start()
+    load_started.wait(10)
+
+    # A search on this thread while the load is profiled neither waits for it nor is profiled
+    with profiler.profile('search'):
+        results = ['Pearl'] * 10
+    finish_load.set()
+    loader.join(10)
+
+    assert results == ['Pearl'] * 10
+    assert profiler.skipped == 1
+    assert [entry['operation'] for entry in read_summary(str(tmp_path))] == ['load']
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the scroll and selection bookkeeping of the virtual results view
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip('tkinter')
+from inventory_results_view import ResultWindow, clamp_offset
+
+
+def make_window(total_rows, visible_rows=10, overscan=5):
+    window = ResultWindow(overscan)
+    window.resize(visible_rows)
+    window.reset(total_rows)
+    return window
+
+
+def test_clamp_offset_keeps_the_last_page_full():
+    assert clamp_offset(-3, 100, 10) == 0
+    assert clamp_offset(42, 100, 10) == 42
+    assert clamp_offset(95, 100, 10) == 90
+    assert clamp_offset(5, 4, 10) == 0  # Fewer rows than fit
+
+
+def test_window_rows_scrolling_and_resizing():
+    window = make_window(100)
+    assert window.rows() == range(0, 15)  # Visible rows plus overscan
+    assert window.scrollbar_range() == (0.0, 0.1)
+
+    window.scroll(200)
+    assert window.offset == 90 and window.rows() == range(90, 100)
+    window.move_to(0.5)
+    assert window.rows() == range(50, 65)
+
+    assert window.resize(60)  # A taller view pulls the last page back up
+    assert window.offset == 40 and window.scrollbar_range() == (0.4, 1.0)
+    assert not window.resize(60)
+
+    window.reset(3)
+    assert window.offset == 0 and window.rows() == range(0, 3)
+    window.reset(0)
+    assert window.rows() == range(0, 0) and window.scrollbar_range() == (0.0, 1.0)
+
+
+def test_keyboard_selection_scrolls_into_view():
+    window = make_window(100)
+    assert window.move_selection(1) == 1 and window.offset == 0  # No focus yet: from the first visible row
+    window.select_rendered({9})  # A click moves the focus
+
+    # Moving below the visible rows scrolls just enough to show the new row
+    assert window.move_selection(1) == 10 and window.offset == 1
+    assert window.move_selection(10) == 20 and window.offset == 11  # Page down
+    assert window.move_selection(-15) == 5 and window.offset == 5
+    assert window.move_selection(500) == 99 and window.offset == 90
+    assert window.move_selection(-500) == 0 and window.offset == 0
+    assert window.selected == {0} and window.focus == 0
+
+
+def test_focus_is_kept_by_row_while_scrolling():
+    window = make_window(100)
+    window.move_selection(3)
+    # Scrolling renders other rows into the widget's pooled items; the focus stays on row 3
+    window.scroll(50)
+    window.select_rendered(set())
+    assert window.focus == 3
+    assert window.move_selection(1) == 4 and window.offset == 0
+
+    window.reset(20)
+    assert window.focus is None and window.move_selection(1) == 1
+
+
+def test_selection_survives_scrolling_out_of_the_window():
+    window = make_window(100)
+    window.select_rendered({3})
+    assert window.selected == {3}
+
+    # The widget has nothing selected once row 3 is no longer rendered - keep it
+    window.scroll(50)
+    window.select_rendered(set())
+    assert window.selected == {3}
+
+    window.select_rendered({52})
+    assert window.selected == {52}
+
+    # Deselecting a rendered row does clear the selection
+    window.select_rendered(set())
+    assert window.selected == set()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the trigram item name index
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_search import (AhoCorasick, IncrementalSearch, SearchResultCache, TrigramIndex, count_pattern_hits,
+                              tag_pattern_hits)
+
+NAMES = pd.Series(
+    ['Fragment of Truth (Enchanted)', 'Gelid Fragment of Truth (Legendary)', 'Mana Potion', 'Empty',
+     'Greater Mana Potion', 'Bread', 'Water Flask', np.nan, 'Mana Potion', 'Empty', 'Rare Gem', 'Tru'],
+    index=range(200, 212)
+)
+
+
+@pytest.mark.parametrize('term', [
+    'Fragment of Truth', 'fragment OF truth', 'mana potion', 'Potion', 'Tru', 'ru', 'e', '',
+    'Bread|Water|Food|Drink', 'Gelid|Rare', 'nothing like this',
+    r'Fragment.*\(Legendary\)', '(?:Mana Potion)|Rare Gem'
+])
+def test_matches_str_contains(term):
+    index = TrigramIndex(NAMES)
+    expected = np.flatnonzero(NAMES.str.contains(term, case=False, na=False, regex=True).to_numpy())
+    np.testing.assert_array_equal(index.matching_positions(term), expected)
+
+
+def test_literal_search_and_frame_rows():
+    index = TrigramIndex(NAMES)
+    expected = np.flatnonzero(NAMES.str.contains('Truth (Enchanted', case=False, na=False, regex=False).to_numpy())
+    np.testing.assert_array_equal(index.matching_positions('Truth (Enchanted', regex=False), expected)
+
+    items_df = pd.DataFrame({'Name': NAMES, 'Count': range(len(NAMES))})
+    pd.testing.assert_frame_equal(index.search(items_df, 'mana'),
+                                  items_df[items_df['Name'].str.contains('mana', case=False, na=False)])
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    patterns = ['he', 'she', 'his', 'hers', 'Fragment of Truth', 'truth (legendary)']
+    matcher = AhoCorasick(patterns)
+    for text in ['ushers', 'ahishers', 'Gelid Fragment of Truth (Legendary)', 'nothing', '']:
+        expected = {i for i, pattern in enumerate(patterns) if pattern.lower() in text.lower()}
+        assert matcher.find(text) == expected
+
+
+def test_multi_pattern_search_matches_alternation():
+    patterns = ['Fragment of Truth (Enchanted)', 'Mana Potion', 'Water', 'Not In Inventory']
+    index = TrigramIndex(NAMES)
+    expected = np.flatnonzero(NAMES.str.lower().apply(
+        lambda name: isinstance(name, str) and any(p.lower() in name for p in patterns)).to_numpy())
+    np.testing.assert_array_equal(index.matching_positions_any(patterns), expected)
+
+    tags = tag_pattern_hits(NAMES, patterns)
+    assert list(tags.index) == list(NAMES.index)
+    assert tags.iloc[4] == ('Mana Potion',)
+    assert tags.iloc[7] == ()
+    np.testing.assert_array_equal(np.flatnonzero((tags.map(len) > 0).to_numpy()), expected)
+
+
+def test_count_pattern_hits_matches_per_pattern_scans():
+    patterns = ['Fragment of Truth', 'Mana Potion', 'Empty', 'Not In Inventory']
+    groups = pd.Series([i % 2 == 0 for i in range(len(NAMES))], index=NAMES.index)
+    counts = count_pattern_hits(NAMES, patterns, groups).reindex(columns=[False, True], fill_value=0)
+
+    for pattern in patterns:
+        hit = NAMES.str.contains(pattern, case=False, na=False, regex=False)
+        assert counts.loc[pattern, True] == (hit & groups).sum()
+        assert counts.loc[pattern, False] == (hit & ~groups).sum()
+
+    totals = count_pattern_hits(NAMES, patterns)
+    assert list(totals.columns) == ['Count']
+    assert totals.loc['Mana Potion', 'Count'] == 3
+    assert totals.loc['Not In Inventory', 'Count'] == 0
+
+
+def test_incremental_search_narrows_previous_results():
+    index = TrigramIndex(NAMES)
+    search = IncrementalSearch(index, max_terms=3)
+
+    for term in ['f', 'fr', 'fra', 'frag', 'Fragment', 'fragment of', 'mana', 'ana p', 'Bread|Water']:
+        np.testing.assert_array_equal(search.matching_positions(term), index.matching_positions(term))
+    # 'fr', 'fra', 'frag', 'Fragment' and 'fragment of' each narrow the previous result
+    assert search.narrowed >= 5
+
+    search.matching_positions('ana p')
+    assert search.hits == 1
+    # Least recently used terms are dropped
+    assert len(search._cache) == 3
+
+
+def test_search_result_cache_hits_and_invalidates():
+    cache = SearchResultCache(max_entries=2)
+    calls = []
+
+    def compute(label):
+        calls.append(label)
+        return pd.DataFrame({'Name': [label]})
+
+    first = cache.get_or_compute('Mana', None, None, False, lambda: compute('a'))
+    assert cache.get_or_compute('mana', None, None, False, lambda: compute('b')) is first
+    cache.get_or_compute('mana', 'Bob', None, False, lambda: compute('c'))
+    cache.get_or_compute('mana', None, None, True, lambda: compute('d'))
+    assert cache.stats() == {'version': 0, 'entries': 2, 'hits': 1, 'misses': 3}
+
+    # The least recently used entry ('mana' for all characters) was evicted
+    cache.get_or_compute('mana', None, None, False, lambda: compute('e'))
+    assert calls == ['a', 'c', 'd', 'e']
+
+    swapped = []
+    cache.invalidate(lambda: swapped.append(True))
+    assert swapped == [True]
+    assert cache.stats()['entries'] == 0 and cache.version == 1
+    cache.get_or_compute('mana', None, None, True, lambda: compute('f'))
+    assert calls[-1] == 'f'
+
+
+def test_search_result_cache_drops_results_from_old_version():
+    cache = SearchResultCache()
+    # A reload lands while the query is being computed: its result must not be cached
+    cache.get_or_compute('mana', None, None, False, lambda: (cache.invalidate(), pd.DataFrame())[1])
+    assert cache.stats()['entries'] == 0
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite storage backend of the inventory monitor
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from enhanced_inv_monitor import EQInventoryMonitor, SQLiteInventoryMonitor
+from inventory_duplicates import DUPLICATE_KEYS
+
+SEARCH_TERMS = ['potion', 'GEM', 'Ge', 'Potion|Gem', r'^S\w+ of', 'Empty', '100%', 'nothing like this']
+
+
+def same_rows(result, expected):
+    """Equal as sets of rows (the pandas search sorts by character and name only)."""
+    result = result.reset_index(drop=True)
+    expected = expected.reset_index(drop=True)
+    assert list(result.columns) == list(expected.columns)
+    assert sorted(result.itertuples(index=False)) == sorted(expected.itertuples(index=False))
+
+
+def assert_backends_agree(sqlite_monitor, pandas_monitor):
+    for term in SEARCH_TERMS:
+        same_rows(sqlite_monitor.search_items(term), pandas_monitor.search_items(term))
+    same_rows(sqlite_monitor.search_items('mana potion', exact_match=True),
+              pandas_monitor.search_items('mana potion', exact_match=True))
+    same_rows(sqlite_monitor.search_items('gem', character='shared-bank', item_type='bank'),
+              pandas_monitor.search_items('gem', character='shared-bank', item_type='bank'))
+
+    for mode in DUPLICATE_KEYS:
+        result, expected = sqlite_monitor.find_duplicates(2, mode), pandas_monitor.find_duplicates(2, mode)
+        same_rows(result, expected)
+        assert list(result['TotalFound']) == list(expected['TotalFound'])  # Most frequent first
+
+    pd.testing.assert_frame_equal(sqlite_monitor.characters_info, pandas_monitor.characters_info, check_dtype=False)
+    for character in ['gandalf1', 'SHARED-BANK', 'Nobody']:
+        assert sqlite_monitor.get_character_summary(character) == pandas_monitor.get_character_summary(character)
+    same_rows(sqlite_monitor.get_character_items('Gandalf0'), pandas_monitor.get_character_items('Gandalf0'))
+
+
+def test_queries_match_pandas_backend(inventory_dir):
+    sqlite_monitor = SQLiteInventoryMonitor(inventory_dir)
+    assert sqlite_monitor.store.fts
+    assert_backends_agree(sqlite_monitor, EQInventoryMonitor(inventory_dir))
+
+
+def test_reingest_after_reexport_and_delete(inventory_dir, tmp_path_factory):
+    database = str(tmp_path_factory.mktemp('db') / 'inventory.sqlite')
+    sqlite_monitor = SQLiteInventoryMonitor(inventory_dir, database)
+
+    # Bloodthirster0 holds the visible copy of the shared bank; another file's copy takes over
+    os.remove(os.path.join(inventory_dir, 'Bloodthirster0-Inventory.txt'))
+    reexported = os.path.join(inventory_dir, 'Gandalf1-Inventory.txt')
+    with open(reexported, 'a', encoding='utf-8') as f:
+        f.write("General9\tFiery Fragment of Truth (Enchanted)\t60001\t1\t0\n")
+        f.write("General10\tMANA POTION\t30003\t2\t0\n")  # Case variant of a stored name
+
+    characters = sqlite_monitor.reload_inventory()
+    assert characters == ['Bloodthirster0', 'Gandalf1', 'SHARED-BANK']
+    assert_backends_agree(sqlite_monitor, EQInventoryMonitor(inventory_dir))
+
+    # A new monitor on the same database finds nothing to ingest
+    reopened = SQLiteInventoryMonitor(inventory_dir, database)
+    assert reopened.store.last_ingest['added'] == [] and reopened.store.last_ingest['changed'] == []
+    assert_backends_agree(reopened, EQInventoryMonitor(inventory_dir))
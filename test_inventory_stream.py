@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the pandas-free streaming parser used by one-shot CLI searches
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from enhanced_inv_monitor import EQInventoryMonitor
+from inventory_stream import RESULT_COLUMNS, StreamFormatError, format_table, read_inventory_directory
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.mark.parametrize('term', ['potion', 'GEM', 'Potion|Gem', r'^S\w+ of', 'Empty', 'nothing like this'])
+def test_matches_dataframe_search(inventory_dir, term):
+    expected = EQInventoryMonitor(inventory_dir).search_items(term)
+    inventory = read_inventory_directory(inventory_dir)
+    rows = inventory.result_rows(inventory.matching_positions(term))
+    assert rows == list(expected.itertuples(index=False, name=None))
+
+
+def test_search_after_reload_finds_no_files(inventory_dir):
+    monitor = EQInventoryMonitor(inventory_dir)
+    for file_name in os.listdir(inventory_dir):
+        os.remove(os.path.join(inventory_dir, file_name))
+    monitor.reload_inventory()
+    results = monitor.search_items('potion')
+    assert results.empty and list(results.columns) == RESULT_COLUMNS
+
+
+def test_unsupported_files_fall_back(tmp_path):
+    (tmp_path / 'Odd-Inventory.txt').write_text('Location\tName\tID\tCount\tSlots\nGeneral1\t"Quoted"\t1\t1\t0\n')
+    with pytest.raises(StreamFormatError):
+        read_inventory_directory(str(tmp_path))
+
+
+def test_cli_search_does_not_import_pandas(inventory_dir):
+    script = ("import sys; sys.argv = ['enhanced_inv_monitor.py', '-d', sys.argv[1], '-s', 'potion']; "
+              "import enhanced_inv_monitor; enhanced_inv_monitor.main(); print('pandas' in sys.modules)")
+    output = subprocess.run([sys.executable, '-c', script, inventory_dir], cwd=PACKAGE_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    assert 'Mana Potion' in output
+    assert output.strip().endswith('False')
+
+
+def test_format_table_aligns_like_to_string():
+    assert format_table(['Character', 'Count'], [('Alpha', 1), ('Bo', 20)]) == (
+        'Character Count\n    Alpha     1\n       Bo    20')
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic inventory generator and the benchmark runner
+"""
+
+import json
+import os
+import sys
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_benchmark import compare_reports, run_benchmarks
+from inventory_loader import InventoryLoader
+from inventory_synthetic import generate_inventory_directory
+
+
+def read_files(directory):
+    return {name: open(os.path.join(directory, name), encoding='utf-8').read()
+            for name in sorted(os.listdir(directory)) if name.endswith('-Inventory.txt')}
+
+
+def generate(tmp_path, name, characters, seed):
+    generate_inventory_directory(str(tmp_path / name), characters, seed=seed)
+    return read_files(str(tmp_path / name))
+
+
+def test_generator_is_seeded_and_prefix_stable(tmp_path):
+    small = generate(tmp_path, 'a', 5, seed=7)
+    again = generate(tmp_path, 'b', 5, seed=7)
+    larger = generate(tmp_path, 'c', 12, seed=7)
+    other_seed = generate(tmp_path, 'd', 5, seed=8)
+
+    assert small == again
+    assert len(larger) == 12 and all(larger[name] == contents for name, contents in small.items())
+    assert small != other_seed
+
+
+def test_generated_folder_loads_with_shared_banks_deduplicated(tmp_path):
+    directory = str(tmp_path)
+    generate_inventory_directory(directory, 12, seed=1, characters_per_account=6)
+    items_df = InventoryLoader(directory, mode='serial').load()
+
+    assert items_df['Character'].nunique() == 13  # 12 characters and SHARED-BANK
+    assert items_df['Location'].str.contains('-Slot').any()
+    assert (items_df['SlotDepth'] >= 2).any()  # Augments in spare gear inside bags
+    assert items_df['Name'].str.contains('Fragment of Truth').any()
+
+    # Two accounts; stale exports may add an older copy of an account's bank
+    shared_bank_files = items_df.loc[items_df['Character'] == 'SHARED-BANK', 'FileName'].nunique()
+    assert 2 <= shared_bank_files <= 4
+
+
+def test_benchmark_report(tmp_path):
+    report = run_benchmarks([3], seed=0, repeat=1, work_dir=str(tmp_path))
+    report = json.loads(json.dumps(report))
+
+    result, = report['results']
+    assert result['characters'] == 3 and result['files'] == 3 and result['rows'] > 0
+    assert set(result['timings']) == {
+        'load_cold', 'load_from_cache', 'reload_unchanged', 'reload_one_file', 'dedup', 'dedup_newest', 'stream_search',
+        'search_items', 'find_duplicates', 'analyze_zeb_components', 'quest_progress_summary'
+    }
+    assert all(len(timing['runs']) == 1 and timing['best'] >= 0 for timing in result['timings'].values())
+    assert result['load_stages']['stages']['parse']['count'] == 3
+
+    # The re-exported file is restored afterwards
+    assert 'Benchmark Token' not in ''.join(read_files(str(tmp_path / '3-characters')).values())
+
+    comparison = compare_reports(report, report).splitlines()
+    assert len(comparison) == 1 + len(result['timings'])
+    assert comparison[1].rstrip().endswith('1.00x')
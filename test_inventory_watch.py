@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for watching an inventory directory for re-exported files
+"""
+
+import os
+import queue
+import shutil
+import sys
+
+import pytest
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_loader import InventoryLoader
+from inventory_watch import InventoryWatcher, is_inventory_file_name
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SAMPLE_INVENTORY')
+
+
+def available_backends():
+    backends = ['poll']
+    try:
+        InventoryWatcher(SAMPLE_DIR, lambda paths: None, backend='inotify').stop()
+        backends.append('inotify')
+    except OSError:
+        pass
+    return backends
+
+
+def test_inventory_file_names():
+    assert is_inventory_file_name('Gandalf-Inventory.txt')
+    assert not is_inventory_file_name('Gandalf-Spellbook.txt')
+    assert not is_inventory_file_name('.fdt_inventory_cache.json')
+    assert not is_inventory_file_name('.Gandalf-Inventory.txt')
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_watcher_reports_changed_files_to_the_loader(tmp_path, backend):
+    for name in os.listdir(SAMPLE_DIR):
+        shutil.copy(os.path.join(SAMPLE_DIR, name), tmp_path / name)
+    directory = str(tmp_path)
+    loader = InventoryLoader(directory, mode='serial', shared_bank_mode='rows')
+    loader.load()
+
+    changes = queue.Queue()
+    watcher = InventoryWatcher(directory, changes.put, backend=backend, interval=0.05, settle=0.2).start()
+    assert watcher.backend == backend
+    try:
+        gandalf = tmp_path / 'Gandalf-Inventory.txt'
+        gandalf.write_text(gandalf.read_text().replace('Mana Potion', 'Greater Mana Potion'))
+        shutil.copy(gandalf, tmp_path / 'Newbie-Inventory.txt')
+        os.remove(tmp_path / 'Bloodthirster-Inventory.txt')
+        (tmp_path / 'notes.txt').write_text('not an inventory')
+
+        # The burst of changes arrives as one callback
+        paths = changes.get(timeout=5)
+        assert [os.path.basename(path) for path in paths] == [
+            'Bloodthirster-Inventory.txt', 'Gandalf-Inventory.txt', 'Newbie-Inventory.txt'
+        ]
+    finally:
+        watcher.stop()
+    assert not watcher.running
+
+    loader.load(paths)
+    assert loader.last_reload['characters'] == ['Bloodthirster', 'Gandalf', 'Newbie', 'SHARED-BANK']
+    assert set(loader.items_df['Character']) == {'Gandalf', 'Newbie', 'SHARED-BANK'}
+    assert loader.items_df['Name'].str.contains('Greater Mana Potion').any()
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        InventoryWatcher(SAMPLE_DIR, lambda paths: None, backend='kqueue')
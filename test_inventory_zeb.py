@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the Zeb weapon component analysis
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from inventory_catalog import ItemCatalog
+from inventory_loader import derive_item_columns
+from inventory_zeb import ZEB_REQUIRED_FRAGMENTS, analyze_zeb_components
+
+
+def make_items():
+    rows = []
+    for i, fragment in enumerate(ZEB_REQUIRED_FRAGMENTS):
+        if fragment.startswith('Icy'):
+            rows += [(f"General{i}-Slot{slot}", f"{fragment} (Enchanted)", 2000 + i, 1) for slot in range(1, 5)]
+        elif fragment.startswith('Fiery'):
+            rows.append(('Primary-Slot1', f"{fragment} (Legendary)", 1000 + i, 1))  # Augmented into worn gear
+        else:
+            rows.append((f"Bank{i}-Slot1", f"{fragment} (Legendary)", 1000 + i, 1))
+    rows += [('General12', 'Time Phased Quintessence', 3000, 1), ('General13', 'Empty', 0, 0)]
+    items_df = pd.DataFrame(rows, columns=['Location', 'Name', 'ID', 'Count'])
+    items_df.insert(0, 'Character', 'Gandalf')
+    derive_item_columns(items_df)
+    return items_df
+
+
+def test_zeb_components_count_available_and_equipped_fragments():
+    items_df = make_items()
+    item_catalog = ItemCatalog(items_df)
+
+    results = analyze_zeb_components(items_df, item_catalog)
+    assert results['fragments']['Icy Fragment of Truth']['can_make_legendary']
+    fiery = results['fragments']['Fiery Fragment of Truth']
+    assert fiery['equipped_legendary'] == 1 and not fiery['ready']
+    assert [missing['name'] for missing in results['missing_fragments']] == ['Fiery Fragment of Truth']
+    assert results['missing_other'] == ['Vortex of the Past']
+    assert results['total_fragments_ready'] == len(ZEB_REQUIRED_FRAGMENTS) - 1
+    assert not results['can_make_weapon']
+
+    with_equipped = analyze_zeb_components(items_df, item_catalog, include_equipped=True)
+    assert with_equipped['total_fragments_ready'] == len(ZEB_REQUIRED_FRAGMENTS)
+    assert not with_equipped['can_make_weapon']  # Still missing the Vortex
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the aggregated Signet of Might quest progress
+"""
+
+import os
+import random
+import sys
+
+import pandas as pd
+
+# Add the directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from signet_of_might_data import SignetOfMightQuest
+
+
+def count_item_by_scanning(item_name, inventory_items):
+    """The original per-item scan: exact name match first, then a partial str.contains match."""
+    exact_matches = inventory_items[
+        (inventory_items['Name'].str.lower() == item_name.lower()) &
+        (inventory_items['IsEmpty'] == False)
+    ]
+    if not exact_matches.empty:
+        return exact_matches['Count'].astype(int).sum()
+
+    partial_matches = inventory_items[
+        (inventory_items['Name'].str.contains(item_name, case=False, na=False)) &
+        (inventory_items['IsEmpty'] == False)
+    ]
+    if not partial_matches.empty:
+        return partial_matches['Count'].astype(int).sum()
+    return 0
+
+
+def make_inventory(quest):
+    random.seed(7)
+    item_names = list(quest.get_all_unique_items())
+    names = ['Empty', 'Mana Potion']
+    for item_name in item_names[::2]:
+        names.append(item_name)
+    for item_name in item_names[1::3]:
+        names += [item_name.upper(), f"{item_name} (Used)"]
+
+    rows = [{'Name': random.choice(names), 'Count': random.randint(1, 5)} for _ in range(400)]
+    inventory_items = pd.DataFrame(rows)
+    inventory_items['IsEmpty'] = inventory_items['Name'] == 'Empty'
+    return inventory_items
+
+
+def test_progress_matches_per_item_scans():
+    quest = SignetOfMightQuest()
+    inventory_items = make_inventory(quest)
+
+    progress = quest.get_quest_progress_summary(inventory_items)
+    for quest_data in quest.quest_chain.values():
+        owned_items = progress[quest_data['name']]['owned_items']
+        for item_name in quest_data.get('key_items', {}):
+            assert owned_items[item_name]['owned'] == count_item_by_scanning(item_name, inventory_items)
+
+    # Items outside the quest catalog still fall back to a partial match
+    assert quest._count_item_in_inventory('potion', inventory_items) == count_item_by_scanning('potion', inventory_items)
+
+
+def test_totals_rebuilt_for_new_inventory():
+    quest = SignetOfMightQuest()
+    inventory_items = make_inventory(quest)
+    quest.get_quest_progress_summary(inventory_items)
+
+    updated_items = inventory_items.copy()
+    updated_items['Count'] = updated_items['Count'] * 2
+    item_name = next(iter(quest.get_all_unique_items()))
+    assert quest._count_item_in_inventory(item_name, updated_items) == count_item_by_scanning(item_name, updated_items)